@@ -1,646 +1,582 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import tkinter as tk
-from tkinter import ttk, colorchooser, messagebox, filedialog
-import json
 import os
-from collections import deque
+import queue
+from collections import deque, OrderedDict
 from datetime import datetime
 import threading
 import time
+import argparse
 from threading import Lock
 import pyaudio
 import audioop
+import mesh_topology
+from capture import open_source
+from telemetry import TelemetryWriter
+from settings_ui import DEFAULT_COLOR_PRESETS, SettingsController, SettingsUIProcess, load_autosave_settings
 
-class ModernSettingsUI:
-    def __init__(self, tracker):
-        self.tracker = tracker
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.saves_dir = os.path.join(self.script_dir, "saves")
-        self.color_presets_dir = os.path.join(self.script_dir, "color_presets")
-        self.autosave_dir = os.path.join(self.script_dir, "autosave")
-        for directory in [self.saves_dir, self.color_presets_dir, self.autosave_dir]:
-            os.makedirs(directory, exist_ok=True)
-        self.thread = threading.Thread(target=self.run_ui, daemon=True)
-        self.thread.start()
-        
-    def run_ui(self):
-        self.root = tk.Tk()
-        self.root.title("Face Tracker Settings")
-        self.root.geometry("450x700")
-        self.root.configure(bg='#2b2b2b')
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
-        self.configure_styles()
-        self.notebook = ttk.Notebook(self.root, style='Dark.TNotebook')
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        self.create_appearance_tab()
-        self.create_color_presets_tab()
-        self.create_saves_tab()
-        self.create_experiments_tab()
-        self.create_performance_tab()
-        self.status_bar = tk.Label(self.root, text="Ready", bg='#1e1e1e', fg='white', relief=tk.SUNKEN, anchor=tk.W)
-        self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.after(100, self.load_autosave)
-        self.root.mainloop()
-        
-    def configure_styles(self):
-        self.style.configure('Dark.TNotebook', background='#2b2b2b', borderwidth=0)
-        self.style.configure('Dark.TNotebook.Tab', background='#3c3c3c', foreground='white', padding=[20, 10])
-        self.style.map('Dark.TNotebook.Tab', background=[('selected', '#555555')])
-        self.style.configure('Dark.TFrame', background='#2b2b2b')
-        self.style.configure('Dark.TLabel', background='#2b2b2b', foreground='white')
-        self.style.configure('Dark.TButton', background='#3c3c3c', foreground='white', borderwidth=0, focuscolor='none')
-        self.style.map('Dark.TButton', background=[('active', '#555555')])
-        self.style.configure('Dark.TCheckbutton', background='#2b2b2b', foreground='white', focuscolor='none')
-        self.style.configure('Dark.TRadiobutton', background='#2b2b2b', foreground='white', focuscolor='none')
-        self.style.configure('Dark.Horizontal.TScale', background='#2b2b2b', troughcolor='#3c3c3c', borderwidth=0)
-        
-    def create_appearance_tab(self):
-        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
-        self.notebook.add(tab, text='Appearance')
-        mode_frame = ttk.Frame(tab, style='Dark.TFrame')
-        mode_frame.pack(fill='x', padx=20, pady=10)
-        ttk.Label(mode_frame, text="Mode:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
-        self.mode_var = tk.StringVar(value=self.tracker.modes[self.tracker.mode])
-        self.mode_menu = ttk.Combobox(mode_frame, textvariable=self.mode_var, values=self.tracker.modes, state='readonly', width=15)
-        self.mode_menu.pack(side='left')
-        self.mode_menu.bind('<<ComboboxSelected>>', self.on_mode_change)
-        conn_frame = ttk.Frame(tab, style='Dark.TFrame')
-        conn_frame.pack(fill='x', padx=20, pady=10)
-        ttk.Label(conn_frame, text="Connection:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
-        self.conn_var = tk.StringVar(value=self.tracker.current_connection)
-        self.conn_menu = ttk.Combobox(conn_frame, textvariable=self.conn_var, values=list(self.tracker.connection_types.keys()), state='readonly', width=15)
-        self.conn_menu.pack(side='left')
-        self.conn_menu.bind('<<ComboboxSelected>>', self.on_connection_change)
-        toggles_frame = ttk.Frame(tab, style='Dark.TFrame')
-        toggles_frame.pack(fill='x', padx=20, pady=10)
-        self.show_camera_var = tk.BooleanVar(value=self.tracker.show_camera)
-        camera_check = ttk.Checkbutton(toggles_frame, text="Show Camera Feed", variable=self.show_camera_var,
-                                      command=self.on_camera_toggle, style='Dark.TCheckbutton')
-        camera_check.pack(anchor='w', pady=2)
-        self.show_hands_var = tk.BooleanVar(value=self.tracker.show_hands)
-        hands_check = ttk.Checkbutton(toggles_frame, text="Show Hands", variable=self.show_hands_var,
-                                     command=self.on_hands_toggle, style='Dark.TCheckbutton')
-        hands_check.pack(anchor='w', pady=2)
-        ttk.Label(toggles_frame, text="Camera Opacity:", style='Dark.TLabel').pack(anchor='w', pady=(10, 0))
-        self.camera_opacity_var = tk.DoubleVar(value=self.tracker.camera_opacity)
-        opacity_scale = ttk.Scale(toggles_frame, from_=0.1, to=1.0, orient='horizontal',
-                                 variable=self.camera_opacity_var, command=self.on_camera_opacity_change,
-                                 style='Dark.Horizontal.TScale')
-        opacity_scale.pack(fill='x', pady=5)
-        ttk.Label(tab, text="Colors:", style='Dark.TLabel').pack(anchor='w', padx=20, pady=(10, 5))
-        self.create_color_control(tab, "Dot Color", self.tracker.dot_color, self.on_dot_color_change)
-        self.create_color_control(tab, "Line Color", self.tracker.line_color, self.on_line_color_change)
-        self.create_color_control(tab, "Background", self.tracker.bg_color, self.on_bg_color_change)
-        size_frame = ttk.Frame(tab, style='Dark.TFrame')
-        size_frame.pack(fill='x', padx=20, pady=20)
-        ttk.Label(size_frame, text="Dot Size:", style='Dark.TLabel').pack()
-        self.dot_size_var = tk.IntVar(value=self.tracker.dot_size)
-        dot_scale = ttk.Scale(size_frame, from_=1, to=10, orient='horizontal', variable=self.dot_size_var, 
-                             command=self.on_dot_size_change, style='Dark.Horizontal.TScale')
-        dot_scale.pack(fill='x', pady=5)
-        ttk.Label(size_frame, text="Line Width:", style='Dark.TLabel').pack()
-        self.line_width_var = tk.IntVar(value=self.tracker.line_thickness)
-        line_scale = ttk.Scale(size_frame, from_=1, to=5, orient='horizontal', variable=self.line_width_var,
-                              command=self.on_line_width_change, style='Dark.Horizontal.TScale')
-        line_scale.pack(fill='x', pady=5)
-        
-    def create_color_presets_tab(self):
-        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
-        self.notebook.add(tab, text='Color Presets')
-        self.default_presets = {
-            "Neon": {"dot_color": [255, 0, 255], "line_color": [0, 255, 255], "bg_color": [0, 0, 0]},
-            "Matrix": {"dot_color": [0, 255, 0], "line_color": [0, 200, 0], "bg_color": [0, 0, 0]},
-            "Cyberpunk": {"dot_color": [255, 0, 128], "line_color": [0, 255, 255], "bg_color": [16, 0, 32]},
-            "Wireframe": {"dot_color": [255, 255, 255], "line_color": [128, 128, 128], "bg_color": [0, 0, 0]},
-            "Ocean": {"dot_color": [255, 200, 0], "line_color": [255, 100, 0], "bg_color": [40, 20, 0]},
-            "Sunset": {"dot_color": [0, 200, 255], "line_color": [0, 100, 200], "bg_color": [0, 20, 40]}
-        }
-        preset_frame = ttk.Frame(tab, style='Dark.TFrame')
-        preset_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        ttk.Label(preset_frame, text="Available Color Presets:", style='Dark.TLabel').pack()
-        self.preset_listbox = tk.Listbox(preset_frame, bg='#3c3c3c', fg='white', selectbackground='#555555')
-        self.preset_listbox.pack(fill='both', expand=True, pady=10)
-        button_frame = ttk.Frame(preset_frame, style='Dark.TFrame')
-        button_frame.pack(fill='x')
-        ttk.Button(button_frame, text="Load", command=self.load_color_preset, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Save Current", command=self.save_color_preset, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Delete", command=self.delete_color_preset, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Refresh", command=self.refresh_color_preset_list, style='Dark.TButton').pack(side='left', padx=5)
-        self.refresh_color_preset_list()
-    
-    def create_saves_tab(self):
-        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
-        self.notebook.add(tab, text='Saves')
-        save_frame = ttk.Frame(tab, style='Dark.TFrame')
-        save_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        ttk.Label(save_frame, text="Saved Configurations:", style='Dark.TLabel').pack()
-        self.save_listbox = tk.Listbox(save_frame, bg='#3c3c3c', fg='white', selectbackground='#555555')
-        self.save_listbox.pack(fill='both', expand=True, pady=10)
-        button_frame = ttk.Frame(save_frame, style='Dark.TFrame')
-        button_frame.pack(fill='x')
-        ttk.Button(button_frame, text="Load", command=self.load_save, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Save Current", command=self.save_current, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Delete", command=self.delete_save, style='Dark.TButton').pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Refresh", command=self.refresh_save_list, style='Dark.TButton').pack(side='left', padx=5)
-        self.start_save_monitor()
-        self.refresh_save_list()
-        
-    def create_experiments_tab(self):
-        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
-        self.notebook.add(tab, text='Experiments')
-        info_label = ttk.Label(tab, text="Enable experimental features (may affect performance)", 
-                              style='Dark.TLabel', font=('Arial', 10, 'bold'))
-        info_label.pack(padx=20, pady=10)
-        self.exp_expression_triggers = tk.BooleanVar(value=self.tracker.experiments.get('expression_triggers', False))
-        exp1_check = ttk.Checkbutton(tab, text="Expression Triggers (Emotion-based colors)", 
-                                    variable=self.exp_expression_triggers,
-                                    command=self.on_exp_expression_toggle, style='Dark.TCheckbutton')
-        exp1_check.pack(anchor='w', padx=20, pady=5)
-        self.expression_frame = ttk.LabelFrame(tab, text="Expression Settings", style='Dark.TFrame')
-        self.expression_frame.pack(fill='x', padx=40, pady=5)
-        self.emotion_colors = {
-            'happy': tk.StringVar(value=str(self.tracker.emotion_colors.get('happy', [0, 255, 0]))),
-            'sad': tk.StringVar(value=str(self.tracker.emotion_colors.get('sad', [255, 0, 0]))),
-            'angry': tk.StringVar(value=str(self.tracker.emotion_colors.get('angry', [0, 0, 255]))),
-            'neutral': tk.StringVar(value=str(self.tracker.emotion_colors.get('neutral', [128, 128, 128])))
-        }
-        for emotion, color_var in self.emotion_colors.items():
-            self.create_emotion_color_control(self.expression_frame, emotion.capitalize(), emotion)
-        self.toggle_expression_settings()
-        self.exp_additional_modes = tk.BooleanVar(value=self.tracker.experiments.get('additional_modes', False))
-        exp2_check = ttk.Checkbutton(tab, text="Additional Visualization Modes", 
-                                    variable=self.exp_additional_modes,
-                                    command=self.on_exp_modes_toggle, style='Dark.TCheckbutton')
-        exp2_check.pack(anchor='w', padx=20, pady=5)
-        modes_info = ttk.Label(tab, text="    Adds: Skeleton, Wireframe Triangle, Wireframe Hexagon", 
-                              style='Dark.TLabel', font=('Arial', 9))
-        modes_info.pack(anchor='w', padx=40, pady=2)
-        self.exp_audio_visualizer = tk.BooleanVar(value=self.tracker.experiments.get('audio_visualizer', False))
-        exp3_check = ttk.Checkbutton(tab, text="Audio Visualizer (Mic controls thickness)", 
-                                    variable=self.exp_audio_visualizer,
-                                    command=self.on_exp_audio_toggle, style='Dark.TCheckbutton')
-        exp3_check.pack(anchor='w', padx=20, pady=5)
-        self.audio_frame = ttk.LabelFrame(tab, text="Audio Settings", style='Dark.TFrame')
-        self.audio_frame.pack(fill='x', padx=40, pady=5)
-        self.audio_sensitivity = tk.DoubleVar(value=self.tracker.audio_sensitivity)
-        ttk.Label(self.audio_frame, text="Sensitivity:", style='Dark.TLabel').pack(anchor='w', padx=10)
-        sensitivity_scale = ttk.Scale(self.audio_frame, from_=0.1, to=5.0, orient='horizontal',
-                                     variable=self.audio_sensitivity, command=self.on_audio_sensitivity_change,
-                                     style='Dark.Horizontal.TScale')
-        sensitivity_scale.pack(fill='x', padx=10, pady=5)
-        self.toggle_audio_settings()
-    
-    def create_performance_tab(self):
-        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
-        self.notebook.add(tab, text='Performance')
-        self.performance_mode = tk.BooleanVar(value=self.tracker.performance_mode)
-        perf_check = ttk.Checkbutton(tab, text="Performance Mode (Higher FPS)", variable=self.performance_mode,
-                                    command=self.on_performance_toggle, style='Dark.TCheckbutton')
-        perf_check.pack(padx=20, pady=10)
-        self.show_fps = tk.BooleanVar(value=self.tracker.show_fps)
-        fps_check = ttk.Checkbutton(tab, text="Show FPS", variable=self.show_fps,
-                                   command=self.on_fps_toggle, style='Dark.TCheckbutton')
-        fps_check.pack(padx=20, pady=10)
-        self.auto_save = tk.BooleanVar(value=True)
-        auto_save_check = ttk.Checkbutton(tab, text="Auto-save settings", variable=self.auto_save,
-                                         style='Dark.TCheckbutton')
-        auto_save_check.pack(padx=20, pady=10)
-        info_frame = ttk.LabelFrame(tab, text="Performance Mode Info", style='Dark.TFrame')
-        info_frame.pack(fill='x', padx=20, pady=10)
-        info_text = """Performance mode optimizes tracking by:
-• Reducing face mesh resolution
-• Lowering detection confidence
-• Decreasing tracking smoothness
-• Simplifying hand tracking
-        
-This can improve FPS from 10-15 to 30-60."""
-        info_label = ttk.Label(info_frame, text=info_text, style='Dark.TLabel', justify='left')
-        info_label.pack(padx=10, pady=10)
-    
-    def create_emotion_color_control(self, parent, label, emotion):
-        frame = ttk.Frame(parent, style='Dark.TFrame')
-        frame.pack(fill='x', padx=10, pady=5)
-        ttk.Label(frame, text=f"{label}:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
-        current_color = eval(self.emotion_colors[emotion].get())
-        color_frame = tk.Frame(frame, width=50, height=25, bg=self.rgb_to_hex(current_color), relief=tk.RAISED, bd=2)
-        color_frame.pack(side='left', padx=(0, 10))
-        if not hasattr(self, 'emotion_color_frames'):
-            self.emotion_color_frames = {}
-        self.emotion_color_frames[emotion] = color_frame
-        ttk.Button(frame, text="Choose", 
-                  command=lambda: self.choose_emotion_color(emotion, color_frame),
-                  style='Dark.TButton').pack(side='left')
-    
-    def choose_emotion_color(self, emotion, color_frame):
-        current_color = eval(self.emotion_colors[emotion].get())
-        color = colorchooser.askcolor(initialcolor=self.rgb_to_hex(current_color))
-        if color[0]:
-            new_color = [int(color[0][2]), int(color[0][1]), int(color[0][0])]
-            self.emotion_colors[emotion].set(str(new_color))
-            self.tracker.emotion_colors[emotion] = new_color
-            color_frame.configure(bg=color[1])
-            self.schedule_autosave()
-    
-    def toggle_expression_settings(self):
-        if self.exp_expression_triggers.get():
-            self.expression_frame.pack(fill='x', padx=40, pady=5)
-        else:
-            self.expression_frame.pack_forget()
+DEFAULT_GESTURES = {
+    'pinch': {'pinch': (None, 0.3), 'middle': (None, 0.25), 'ring': (None, 0.25), 'pinky': (None, 0.25)},
+    'victory': {'index': (None, 0.2), 'middle': (None, 0.2), 'ring': (0.4, None), 'pinky': (0.4, None)},
+    'point': {'index': (None, 0.2), 'middle': (0.4, None), 'ring': (0.4, None), 'pinky': (0.4, None)},
+    'fist': {'index': (0.4, None), 'middle': (0.4, None), 'ring': (0.4, None), 'pinky': (0.4, None)},
+    'open_palm': {'thumb': (None, 0.3), 'index': (None, 0.2), 'middle': (None, 0.2), 'ring': (None, 0.2),
+                  'pinky': (None, 0.2), 'pinch': (0.5, None), 'facing': (0.6, None)}
+}
+
+DEFAULT_GESTURE_BINDINGS = {
+    'victory': 'next_mode',
+    'pinch': 'next_color_preset'
+}
+class InferenceResizer:
+    def __init__(self):
+        self.buffers = {}
+        self.frame_cache = {}
     
-    def toggle_audio_settings(self):
-        if self.exp_audio_visualizer.get():
-            self.audio_frame.pack(fill='x', padx=40, pady=5)
-        else:
-            self.audio_frame.pack_forget()
-    
-    def on_exp_expression_toggle(self):
-        self.tracker.experiments['expression_triggers'] = self.exp_expression_triggers.get()
-        self.toggle_expression_settings()
-        self.schedule_autosave()
-    
-    def on_exp_modes_toggle(self):
-        self.tracker.experiments['additional_modes'] = self.exp_additional_modes.get()
-        self.tracker.update_modes()
-        self.mode_var.set(self.tracker.modes[self.tracker.mode])
-        self.mode_menu['values'] = self.tracker.modes
-        self.schedule_autosave()
-    
-    def on_exp_audio_toggle(self):
-        self.tracker.experiments['audio_visualizer'] = self.exp_audio_visualizer.get()
-        if self.exp_audio_visualizer.get():
-            self.tracker.start_audio_stream()
+    def new_frame(self):
+        self.frame_cache.clear()
+    
+    def target_size(self, frame_shape, height):
+        if not height or height >= frame_shape[0]:
+            return frame_shape[1], frame_shape[0]
+        width = int(round(frame_shape[1] * height / frame_shape[0]))
+        return width, height
+    
+    def get(self, frame, height):
+        size = self.target_size(frame.shape, height)
+        if size in self.frame_cache:
+            return self.frame_cache[size]
+        buffers = self.buffers.get(size)
+        if buffers is None:
+            if len(self.buffers) >= 4:
+                self.buffers.clear()
+            buffers = (np.empty((size[1], size[0], 3), dtype=np.uint8), np.empty((size[1], size[0], 3), dtype=np.uint8))
+            self.buffers[size] = buffers
+        small, rgb = buffers
+        if size == (frame.shape[1], frame.shape[0]):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
         else:
-            self.tracker.stop_audio_stream()
-        self.toggle_audio_settings()
-        self.schedule_autosave()
-    
-    def on_audio_sensitivity_change(self, value):
-        self.tracker.audio_sensitivity = float(value)
-        self.schedule_autosave()
-    
-    def create_color_control(self, parent, label, color, callback):
-        frame = ttk.Frame(parent, style='Dark.TFrame')
-        frame.pack(fill='x', padx=20, pady=10)
-        ttk.Label(frame, text=f"{label}:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
-        color_frame = tk.Frame(frame, width=50, height=25, bg=self.rgb_to_hex(color), relief=tk.RAISED, bd=2)
-        color_frame.pack(side='left', padx=(0, 10))
-        if not hasattr(self, 'color_frames'):
-            self.color_frames = []
-        attr_map = {
-            "Dot Color": "dot_color",
-            "Line Color": "line_color",
-            "Background": "bg_color"
-        }
-        self.color_frames.append((color_frame, color, attr_map.get(label)))
-        ttk.Button(frame, text="Choose", command=lambda: self.choose_color(color, callback, color_frame),
-                  style='Dark.TButton').pack(side='left')
-    
-    def rgb_to_hex(self, rgb):
-        return '#{:02x}{:02x}{:02x}'.format(rgb[2], rgb[1], rgb[0])
-    
-    def choose_color(self, current_color, callback, color_frame):
-        rgb_color = (current_color[2], current_color[1], current_color[0])
-        color = colorchooser.askcolor(initialcolor=self.rgb_to_hex(current_color))
-        if color[0]:
-            new_color = [int(color[0][2]), int(color[0][1]), int(color[0][0])]
-            callback(new_color)
-            color_frame.configure(bg=color[1])
-    
-    def on_mode_change(self, event=None):
-        self.tracker.mode = self.tracker.modes.index(self.mode_var.get())
-        self.schedule_autosave()
-        
-    def on_connection_change(self, event=None):
-        self.tracker.current_connection = self.conn_var.get()
-        self.schedule_autosave()
-        
-    def on_dot_color_change(self, color):
-        self.tracker.dot_color = color
-        self.schedule_autosave()
-        
-    def on_line_color_change(self, color):
-        self.tracker.line_color = color
-        self.schedule_autosave()
-        
-    def on_bg_color_change(self, color):
-        self.tracker.bg_color = color
-        self.schedule_autosave()
-        
-    def on_dot_size_change(self, value):
-        self.tracker.dot_size = int(float(value))
-        self.schedule_autosave()
-        
-    def on_line_width_change(self, value):
-        self.tracker.line_thickness = int(float(value))
-        self.schedule_autosave()
-    
-    def on_fps_toggle(self):
-        self.tracker.show_fps = self.show_fps.get()
-        self.schedule_autosave()
-    
-    def on_camera_toggle(self):
-        self.tracker.show_camera = self.show_camera_var.get()
-        self.schedule_autosave()
-    
-    def on_camera_opacity_change(self, value):
-        self.tracker.camera_opacity = float(value)
-        self.schedule_autosave()
-    
-    def on_hands_toggle(self):
-        self.tracker.show_hands = self.show_hands_var.get()
-        self.schedule_autosave()
-    
-    def on_performance_toggle(self):
-        self.tracker.performance_mode = self.performance_mode.get()
-        self.tracker.update_performance_settings()
-        self.schedule_autosave()
-    
-    def schedule_autosave(self):
-        if hasattr(self, 'autosave_timer') and self.autosave_timer:
-            self.root.after_cancel(self.autosave_timer)
-        self.autosave_timer = self.root.after(1000, self.autosave_settings)
-    
-    def autosave_settings(self):
-        if self.auto_save.get():
-            autosave_path = os.path.join(self.autosave_dir, "autosave.json")
-            self.save_all_settings(autosave_path)
-    
-    def save_all_settings(self, filepath):
-        settings = {
-            "mode": self.tracker.mode,
-            "connection": self.tracker.current_connection,
-            "dot_color": self.tracker.dot_color,
-            "line_color": self.tracker.line_color,
-            "bg_color": self.tracker.bg_color,
-            "dot_size": self.tracker.dot_size,
-            "line_thickness": self.tracker.line_thickness,
-            "show_fps": self.tracker.show_fps,
-            "show_camera": self.tracker.show_camera,
-            "camera_opacity": self.tracker.camera_opacity,
-            "show_hands": self.tracker.show_hands,
-            "performance_mode": self.tracker.performance_mode,
-            "experiments": self.tracker.experiments,
-            "emotion_colors": self.tracker.emotion_colors,
-            "audio_sensitivity": self.tracker.audio_sensitivity
+            cv2.resize(frame, size, dst=small, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb)
+        self.frame_cache[size] = rgb
+        return rgb
+
+class DotRasterizer:
+    def __init__(self, max_sprites=16, max_stamp_cost=110):
+        self.max_sprites = max_sprites
+        self.max_stamp_cost = max_stamp_cost
+        self.sprites = OrderedDict()
+        self.transmittance = None
+    
+    def get_sprite(self, radius, color, antialiased, width):
+        key = (radius, tuple(color), antialiased, width)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        pad = radius + 1
+        mask = np.zeros((2 * pad + 1, 2 * pad + 1), dtype=np.uint8)
+        cv2.circle(mask, (pad, pad), radius, 255, -1, cv2.LINE_AA if antialiased else cv2.LINE_8)
+        ys, xs = np.nonzero(mask)
+        alpha = mask[ys, xs].astype(np.float32) / 255.0
+        color = np.array(color, dtype=np.float32)
+        sprite = {
+            'dy': ys - pad,
+            'dx': xs - pad,
+            'offsets': (ys - pad) * width + (xs - pad),
+            'channel_offsets': (((ys - pad) * width + (xs - pad)) * 3)[:, None] + np.arange(3),
+            'channel_colors': np.tile(color.astype(np.uint8), (len(ys), 1)),
+            'transparency': 1.0 - alpha,
+            'color': color,
+            'opaque': bool((alpha == 1.0).all()),
+            'pad': pad,
+            'line_type': cv2.LINE_AA if antialiased else cv2.LINE_8
         }
-        try:
-            with open(filepath, "w") as f:
-                json.dump(settings, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-            return False
+        sprite['cost'] = len(ys) if sprite['opaque'] else 4 * len(ys)
+        sprite['channel_offsets'] = sprite['channel_offsets'].ravel()
+        sprite['channel_colors'] = sprite['channel_colors'].ravel()
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
     
-    def load_all_settings(self, filepath):
-        try:
-            with open(filepath, "r") as f:
-                settings = json.load(f)
-            self.tracker.mode = settings.get("mode", 0)
-            self.tracker.current_connection = settings.get("connection", "TESSELATION")
-            self.tracker.dot_color = settings.get("dot_color", [255, 255, 0])
-            self.tracker.line_color = settings.get("line_color", [0, 255, 0])
-            self.tracker.bg_color = settings.get("bg_color", [0, 0, 0])
-            self.tracker.dot_size = settings.get("dot_size", 2)
-            self.tracker.line_thickness = settings.get("line_thickness", 1)
-            self.tracker.show_fps = settings.get("show_fps", True)
-            self.tracker.show_camera = settings.get("show_camera", False)
-            self.tracker.camera_opacity = settings.get("camera_opacity", 0.5)
-            self.tracker.show_hands = settings.get("show_hands", True)
-            self.tracker.performance_mode = settings.get("performance_mode", False)
-            self.tracker.experiments = settings.get("experiments", {
-                'expression_triggers': False,
-                'additional_modes': False,
-                'audio_visualizer': False
-            })
-            self.tracker.emotion_colors = settings.get("emotion_colors", {
-                'happy': [0, 255, 0],
-                'sad': [255, 0, 0],
-                'angry': [0, 0, 255],
-                'neutral': [128, 128, 128]
-            })
-            self.tracker.audio_sensitivity = settings.get("audio_sensitivity", 1.0)
-            self.tracker.update_modes()
-            self.update_ui_from_settings()
-            return True
-            
-        except json.JSONDecodeError:
-            os.remove(filepath)
-            return False
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            return False
+    def uses_stamping(self, radius, color, antialiased, width):
+        return self.get_sprite(radius, color, antialiased, width)['cost'] <= self.max_stamp_cost
     
-    def update_ui_from_settings(self):
-        self.mode_var.set(self.tracker.modes[self.tracker.mode])
-        self.mode_menu['values'] = self.tracker.modes
-        self.conn_var.set(self.tracker.current_connection)
-        self.dot_size_var.set(self.tracker.dot_size)
-        self.line_width_var.set(self.tracker.line_thickness)
-        self.show_camera_var.set(self.tracker.show_camera)
-        self.camera_opacity_var.set(self.tracker.camera_opacity)
-        self.show_hands_var.set(self.tracker.show_hands)
-        self.show_fps.set(self.tracker.show_fps)
-        self.performance_mode.set(self.tracker.performance_mode)
-        if hasattr(self, 'exp_expression_triggers'):
-            self.exp_expression_triggers.set(self.tracker.experiments.get('expression_triggers', False))
-            self.exp_additional_modes.set(self.tracker.experiments.get('additional_modes', False))
-            self.exp_audio_visualizer.set(self.tracker.experiments.get('audio_visualizer', False))
-            self.audio_sensitivity.set(self.tracker.audio_sensitivity)
-        if hasattr(self, 'emotion_colors'):
-            for emotion, color in self.tracker.emotion_colors.items():
-                self.emotion_colors[emotion].set(str(color))
-        for frame, color, attr in self.color_frames:
-            current_color = getattr(self.tracker, attr)
-            frame.configure(bg=self.rgb_to_hex(current_color))
-    
-    def load_autosave(self):
-        autosave_path = os.path.join(self.autosave_dir, "autosave.json")
-        if os.path.exists(autosave_path):
-            if not self.load_all_settings(autosave_path):
-                self.status_bar.config(text="Autosave corrupted, using defaults")
-            else:
-                self.status_bar.config(text="Loaded autosaved settings")
-    
-    def refresh_save_list(self):
-        self.save_listbox.delete(0, tk.END)
-        if os.path.exists(self.saves_dir):
-            for filename in os.listdir(self.saves_dir):
-                if filename.endswith('.json'):
-                    name = filename[:-5]
-                    self.save_listbox.insert(tk.END, name)
-    
-    def save_current(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save Configuration")
-        dialog.geometry("300x100")
-        dialog.configure(bg='#2b2b2b')
-        tk.Label(dialog, text="Save Name:", bg='#2b2b2b', fg='white').pack(pady=10)
-        name_entry = tk.Entry(dialog, bg='#3c3c3c', fg='white')
-        name_entry.pack(pady=5)
-        
-        def save():
-            name = name_entry.get()
-            if name:
-                save_path = os.path.join(self.saves_dir, f"{name}.json")
-                if self.save_all_settings(save_path):
-                    self.refresh_save_list()
-                    dialog.destroy()
-                    self.status_bar.config(text=f"Saved configuration: {name}")
-                else:
-                    messagebox.showerror("Error", "Failed to save configuration")
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
-    
-    def load_save(self):
-        selection = self.save_listbox.curselection()
-        if selection:
-            save_name = self.save_listbox.get(selection[0])
-            save_path = os.path.join(self.saves_dir, f"{save_name}.json")
-            if self.load_all_settings(save_path):
-                self.status_bar.config(text=f"Loaded configuration: {save_name}")
-            else:
-                messagebox.showwarning("Corrupted File", 
-                    f"The save file '{save_name}' was corrupted and has been deleted.")
-                self.refresh_save_list()
-    
-    def delete_save(self):
-        selection = self.save_listbox.curselection()
-        if selection:
-            save_name = self.save_listbox.get(selection[0])
-            if messagebox.askyesno("Delete Save", f"Delete configuration '{save_name}'?"):
-                save_path = os.path.join(self.saves_dir, f"{save_name}.json")
-                os.remove(save_path)
-                self.refresh_save_list()
-                self.status_bar.config(text=f"Deleted configuration: {save_name}")
-    
-    def start_save_monitor(self):
-        def check_saves():
-            self.refresh_save_list()
-            self.root.after(2000, check_saves)
-        self.root.after(2000, check_saves)
+    def stamp(self, frame, pixels, radius, color, antialiased=False):
+        if len(pixels) == 0:
+            return
+        height, width, channels = frame.shape
+        sprite = self.get_sprite(radius, color, antialiased, width)
+        if sprite['cost'] > self.max_stamp_cost:
+            for x, y in pixels.tolist():
+                cv2.circle(frame, (x, y), radius, tuple(color), -1, sprite['line_type'])
+            return
+        xs = pixels[:, 0]
+        ys = pixels[:, 1]
+        pad = sprite['pad']
+        inside = xs.min() >= pad and ys.min() >= pad and xs.max() < width - pad and ys.max() < height - pad
+        if sprite['opaque'] and inside and channels == 3:
+            frame.reshape(-1)[((ys * width + xs) * 3)[:, None] + sprite['channel_offsets']] = sprite['channel_colors']
+            return
+        if not inside and not sprite['opaque']:
+            near_edge = (xs < pad) | (ys < pad) | (xs >= width - pad) | (ys >= height - pad)
+            self.stamp(frame, pixels[~near_edge], radius, color, antialiased)
+            for x, y in pixels[near_edge].tolist():
+                cv2.circle(frame, (x, y), radius, tuple(color), -1, sprite['line_type'])
+            return
+        flat = (ys * width + xs)[:, None] + sprite['offsets']
+        transparency = np.broadcast_to(sprite['transparency'], flat.shape)
+        if not inside:
+            row = ys[:, None] + sprite['dy']
+            col = xs[:, None] + sprite['dx']
+            valid = (row >= 0) & (row < height) & (col >= 0) & (col < width)
+            flat = flat[valid]
+            transparency = transparency[valid]
+        frame_pixels = frame.reshape(-1, channels)
+        if sprite['opaque']:
+            frame_pixels[flat] = sprite['color'].astype(np.uint8)
+            return
+        flat = flat.ravel()
+        if self.transmittance is None or self.transmittance.size != height * width:
+            self.transmittance = np.ones(height * width, dtype=np.float32)
+        np.multiply.at(self.transmittance, flat, transparency.ravel())
+        remaining = self.transmittance[flat, None]
+        blended = frame_pixels[flat].astype(np.float32) * remaining + sprite['color'] * (1.0 - remaining)
+        frame_pixels[flat] = (blended + 0.5).astype(np.uint8)
+        self.transmittance[flat] = 1.0
 
-    def refresh_color_preset_list(self):
-        self.preset_listbox.delete(0, tk.END)
-        for name in self.default_presets:
-            self.preset_listbox.insert(tk.END, f"[Default] {name}")
-        if os.path.exists(self.color_presets_dir):
-            for filename in os.listdir(self.color_presets_dir):
-                if filename.endswith('.json'):
-                    name = filename[:-5]
-                    self.preset_listbox.insert(tk.END, name)
-    
-    def save_color_preset(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save Color Preset")
-        dialog.geometry("300x100")
-        dialog.configure(bg='#2b2b2b')
-        tk.Label(dialog, text="Preset Name:", bg='#2b2b2b', fg='white').pack(pady=10)
-        name_entry = tk.Entry(dialog, bg='#3c3c3c', fg='white')
-        name_entry.pack(pady=5)
-        
-        def save():
-            name = name_entry.get()
-            if name:
-                preset = {
-                    "dot_color": self.tracker.dot_color,
-                    "line_color": self.tracker.line_color,
-                    "bg_color": self.tracker.bg_color
-                }
-                preset_path = os.path.join(self.color_presets_dir, f"{name}.json")
-                try:
-                    with open(preset_path, "w") as f:
-                        json.dump(preset, f, indent=2)
-                    self.refresh_color_preset_list()
-                    dialog.destroy()
-                    self.status_bar.config(text=f"Saved color preset: {name}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to save preset: {e}")
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
-    
-    def load_color_preset(self):
-        selection = self.preset_listbox.curselection()
-        if selection:
-            preset_name = self.preset_listbox.get(selection[0])
-            if preset_name.startswith("[Default]"):
-                preset_name = preset_name.replace("[Default] ", "")
-                preset = self.default_presets[preset_name]
-            else:
-                preset_path = os.path.join(self.color_presets_dir, f"{preset_name}.json")
-                try:
-                    with open(preset_path, "r") as f:
-                        preset = json.load(f)
-                except json.JSONDecodeError:
-                    messagebox.showwarning("Corrupted File", 
-                        f"The preset file '{preset_name}' was corrupted and has been deleted.")
-                    os.remove(preset_path)
-                    self.refresh_color_preset_list()
-                    return
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to load preset: {e}")
-                    return
-            self.tracker.dot_color = preset["dot_color"]
-            self.tracker.line_color = preset["line_color"]
-            self.tracker.bg_color = preset["bg_color"]
-            self.update_ui_from_settings()
-            self.status_bar.config(text=f"Loaded color preset: {preset_name}")
-            self.schedule_autosave()
-    
-    def delete_color_preset(self):
-        selection = self.preset_listbox.curselection()
-        if selection:
-            preset_name = self.preset_listbox.get(selection[0])
-            if preset_name.startswith("[Default]"):
-                messagebox.showwarning("Cannot Delete", "Cannot delete default presets")
+class ReplayBuffer:
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_seconds=30.0, jpeg_quality=80, max_pending=4):
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.encode_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+        self.entry_overhead = 256
+        self.entries = deque()
+        self.bytes_used = 0
+        self.lock = Lock()
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.encoder = None
+    
+    def append(self, timestamp, face_points, hand_points, face_subset, frame_shape, frame=None):
+        size = self.entry_overhead + sum(points.nbytes for points in face_points)
+        size += sum(points.nbytes for points in hand_points or [])
+        entry = [timestamp, face_points, hand_points, face_subset, frame_shape, None, size]
+        with self.lock:
+            self.entries.append(entry)
+            self.bytes_used += size
+            self.evict(timestamp)
+        if frame is not None:
+            self.encode_later(entry, frame)
+    
+    def evict(self, now):
+        while self.entries and (self.bytes_used > self.max_bytes or now - self.entries[0][0] > self.max_seconds):
+            self.bytes_used -= self.entries.popleft()[6]
+    
+    def encode_later(self, entry, frame):
+        if self.encoder is None:
+            self.encoder = threading.Thread(target=self.encode_loop, daemon=True)
+            self.encoder.start()
+        try:
+            self.pending.put_nowait((entry, frame))
+        except queue.Full:
+            pass
+    
+    def encode_loop(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
                 return
-            if messagebox.askyesno("Delete Preset", f"Delete color preset '{preset_name}'?"):
-                preset_path = os.path.join(self.color_presets_dir, f"{preset_name}.json")
-                os.remove(preset_path)
-                self.refresh_color_preset_list()
-                self.status_bar.config(text=f"Deleted color preset: {preset_name}")
-    
-    def on_closing(self):
-        if hasattr(self, 'auto_save') and self.auto_save.get():
-            self.autosave_settings()
-        self.root.quit()
-    
-    def update(self):
-        pass
-        
+            entry, frame = item
+            ok, encoded = cv2.imencode('.jpg', frame, self.encode_params)
+            if not ok:
+                continue
+            jpeg = encoded.tobytes()
+            with self.lock:
+                if not self.entries or entry[0] < self.entries[0][0]:
+                    continue
+                entry[5] = jpeg
+                entry[6] += len(jpeg)
+                self.bytes_used += len(jpeg)
+                self.evict(self.entries[-1][0])
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes_used = 0
+    
+    def duration(self):
+        with self.lock:
+            if len(self.entries) < 2:
+                return 0.0
+            return self.entries[-1][0] - self.entries[0][0]
+    
+    def snapshot(self):
+        with self.lock:
+            return list(self.entries)
+    
+    def decode(self, entry):
+        if entry[5] is None:
+            return None
+        return cv2.imdecode(np.frombuffer(entry[5], dtype=np.uint8), cv2.IMREAD_COLOR)
+    
     def close(self):
-        pass
+        if self.encoder is not None:
+            self.pending.put(None)
+            self.encoder.join(timeout=2.0)
+            self.encoder = None
 
-class FaceTracker:
+class HeadPoseEstimator:
     def __init__(self):
+        self.landmarks = [1, 152, 33, 263, 61, 291]
+        self.model_points = np.array([
+            (0.0, 0.0, 0.0),
+            (0.0, 330.0, 65.0),
+            (-225.0, -170.0, 135.0),
+            (225.0, -170.0, 135.0),
+            (-150.0, 150.0, 125.0),
+            (150.0, 150.0, 125.0)
+        ], dtype=np.float64)
+        self.axis_points = np.array([(0.0, 0.0, 0.0), (100.0, 0.0, 0.0), (0.0, -100.0, 0.0), (0.0, 0.0, -100.0)])
+        self.camera_matrices = {}
+        self.dist_coeffs = np.zeros(4)
+        self.use_previous = True
+        self.reset()
+    
+    def reset(self):
+        self.rvec = None
+        self.tvec = None
+    
+    def camera_matrix(self, frame_shape):
+        key = frame_shape[:2]
+        if key not in self.camera_matrices:
+            height, width = key
+            self.camera_matrices[key] = np.array([
+                (width, 0.0, width / 2),
+                (0.0, width, height / 2),
+                (0.0, 0.0, 1.0)
+            ], dtype=np.float64)
+        return self.camera_matrices[key]
+    
+    def estimate(self, face_points, frame_shape):
+        image_points = np.multiply(face_points[self.landmarks, :2], (frame_shape[1], frame_shape[0]), dtype=np.float64)
+        camera_matrix = self.camera_matrix(frame_shape)
+        if self.use_previous and self.rvec is not None:
+            ok, rvec, tvec = cv2.solvePnP(self.model_points, image_points, camera_matrix, self.dist_coeffs,
+                                          self.rvec.copy(), self.tvec.copy(), True, cv2.SOLVEPNP_ITERATIVE)
+        else:
+            ok, rvec, tvec = cv2.solvePnP(self.model_points, image_points, camera_matrix, self.dist_coeffs,
+                                          flags=cv2.SOLVEPNP_ITERATIVE)
+        if not ok or tvec[2, 0] <= 0:
+            self.reset()
+            return None
+        self.rvec = rvec
+        self.tvec = tvec
+        rotation = cv2.Rodrigues(rvec)[0]
+        return {
+            'yaw': float(np.degrees(np.arctan2(-rotation[2, 0], np.hypot(rotation[2, 1], rotation[2, 2])))),
+            'pitch': float(np.degrees(np.arctan2(rotation[2, 1], rotation[2, 2]))),
+            'roll': float(np.degrees(np.arctan2(rotation[1, 0], rotation[0, 0]))),
+            'translation': tvec.ravel().tolist(),
+            'rvec': rvec,
+            'tvec': tvec
+        }
+    
+    def project_axes(self, pose, frame_shape):
+        pixels = cv2.projectPoints(self.axis_points, pose['rvec'], pose['tvec'], self.camera_matrix(frame_shape),
+                                   self.dist_coeffs)[0]
+        return np.round(pixels.reshape(-1, 2)).astype(np.int32)
+
+class GestureEngine:
+    def __init__(self, gestures=None, hold_frames=5, release_frames=3, cooldown=0.75):
+        self.finger_chains = np.array([
+            (1, 2, 3, 4),
+            (5, 6, 7, 8),
+            (9, 10, 11, 12),
+            (13, 14, 15, 16),
+            (17, 18, 19, 20)
+        ])
+        self.feature_names = ['thumb', 'index', 'middle', 'ring', 'pinky', 'pinch', 'facing']
+        self.hold_frames = hold_frames
+        self.release_frames = release_frames
+        self.cooldown = cooldown
+        self.configure(DEFAULT_GESTURES if gestures is None else gestures)
+    
+    def configure(self, gestures):
+        self.gesture_names = list(gestures)
+        self.lower = np.full((len(gestures), len(self.feature_names)), -np.inf)
+        self.upper = np.full((len(gestures), len(self.feature_names)), np.inf)
+        for row, bounds in enumerate(gestures.values()):
+            for name, (low, high) in bounds.items():
+                column = self.feature_names.index(name)
+                if low is not None:
+                    self.lower[row, column] = low
+                if high is not None:
+                    self.upper[row, column] = high
+        self.reset()
+    
+    def reset(self):
+        self.held = np.zeros(len(self.gesture_names), dtype=np.int32)
+        self.absent = np.full(len(self.gesture_names), self.release_frames, dtype=np.int32)
+        self.armed = np.ones(len(self.gesture_names), dtype=bool)
+        self.last_event_time = -np.inf
+        self.current = []
+    
+    def features(self, hands, frame_shape):
+        points = np.asarray(hands, dtype=np.float32) * (frame_shape[1], frame_shape[0], frame_shape[1])
+        chains = points[:, self.finger_chains]
+        lengths = np.linalg.norm(np.diff(chains, axis=2), axis=3).sum(axis=2)
+        chords = np.linalg.norm(chains[:, :, 3] - chains[:, :, 0], axis=2)
+        curl = 1 - chords / np.maximum(lengths, 1e-6)
+        palm = np.maximum(np.linalg.norm(points[:, 9] - points[:, 0], axis=1), 1e-6)
+        pinch = np.linalg.norm(points[:, 4] - points[:, 8], axis=1) / palm
+        normal = np.cross(points[:, 5] - points[:, 0], points[:, 17] - points[:, 0])
+        facing = np.abs(normal[:, 2]) / np.maximum(np.linalg.norm(normal, axis=1), 1e-6)
+        return np.column_stack([curl, pinch, facing])
+    
+    def classify(self, features):
+        matches = np.all((features[:, None] >= self.lower) & (features[:, None] <= self.upper), axis=2)
+        return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+    
+    def update(self, hands, frame_shape, now=None):
+        present = np.zeros(len(self.gesture_names), dtype=bool)
+        self.current = []
+        if hands:
+            labels = self.classify(self.features(hands, frame_shape))
+            present[labels[labels >= 0]] = True
+            self.current = [self.gesture_names[label] if label >= 0 else None for label in labels.tolist()]
+        self.held = np.where(present, self.held + 1, 0)
+        self.absent = np.where(present, 0, self.absent + 1)
+        self.armed |= self.absent >= self.release_frames
+        firing = present & self.armed & (self.held >= self.hold_frames)
+        if not firing.any():
+            return []
+        now = time.perf_counter() if now is None else now
+        if now - self.last_event_time < self.cooldown:
+            return []
+        index = int(firing.argmax())
+        self.armed[index] = False
+        self.last_event_time = now
+        return [self.gesture_names[index]]
+
+class TrailHistory:
+    def __init__(self, length=12, face_points=478, hand_points=21, max_hands=2):
+        self.face_points = face_points
+        self.hand_points = hand_points
+        self.max_hands = max_hands
+        self.intensity = None
+        self.color_layer = None
+        self.layer_color = None
+        self.resize(length)
+    
+    def resize(self, length):
+        self.length = max(2, int(length))
+        slots = self.face_points + self.hand_points * self.max_hands
+        self.positions = np.zeros((2, slots, 2), dtype=np.int32)
+        self.valid = np.zeros((2, slots), dtype=bool)
+        self.fade = int(np.ceil(255 / (self.length - 1)))
+        self.boxes = np.zeros((self.length - 1, 4), dtype=np.int32)
+        self.head = -1
+        if self.intensity is not None:
+            self.intensity[:] = 0
+    
+    def reset(self):
+        if self.head >= 0:
+            self.valid[:] = False
+            self.boxes[:] = 0
+            self.intensity[:] = 0
+            self.head = -1
+    
+    def push(self, face_pixels, hand_pixels, face_valid=None):
+        self.head += 1
+        row = self.positions[self.head % 2]
+        valid = self.valid[self.head % 2]
+        valid[:] = False
+        if face_pixels is not None:
+            count = min(len(face_pixels), self.face_points)
+            row[:count] = face_pixels[:count]
+            valid[:count] = True if face_valid is None else face_valid[:count]
+        for index, hand in enumerate((hand_pixels or [])[:self.max_hands]):
+            start = self.face_points + index * self.hand_points
+            row[start:start + self.hand_points] = hand
+            valid[start:start + self.hand_points] = True
+    
+    def segments(self, max_jump):
+        newer = self.positions[self.head % 2]
+        older = self.positions[(self.head - 1) % 2]
+        valid = self.valid[self.head % 2] & self.valid[(self.head - 1) % 2]
+        delta = newer - older
+        valid &= (delta * delta).sum(axis=1) <= max_jump * max_jump
+        return np.stack((older, newer), axis=1)[valid]
+    
+    def prepare_layers(self, frame_shape, color):
+        height, width = frame_shape[:2]
+        if self.intensity is None or self.intensity.shape != (height, width):
+            self.intensity = np.zeros((height, width), dtype=np.uint8)
+            self.color_layer = np.empty((height, width, 3), dtype=np.uint8)
+            self.layer_color = None
+            self.boxes[:] = 0
+        if self.layer_color != tuple(color):
+            self.color_layer[:] = color
+            self.layer_color = tuple(color)
+    
+    def region(self):
+        boxes = self.boxes[(self.boxes[:, 0] < self.boxes[:, 2]) & (self.boxes[:, 1] < self.boxes[:, 3])]
+        if not len(boxes):
+            return None
+        x0, y0 = boxes[:, :2].min(axis=0)
+        x1, y1 = boxes[:, 2:].max(axis=0)
+        return (slice(y0, y1), slice(x0, x1))
+    
+    def render(self, output_frame, color, thickness, max_jump):
+        if self.head < 0:
+            return
+        self.prepare_layers(output_frame.shape, color)
+        faded = self.region()
+        if faded is not None:
+            cv2.subtract(self.intensity[faded], self.fade, dst=self.intensity[faded])
+        box = self.boxes[self.head % len(self.boxes)]
+        box[:] = 0
+        lines = self.segments(max_jump)
+        if len(lines):
+            cv2.polylines(self.intensity, lines, False, 255, thickness, cv2.LINE_AA)
+            drawn = lines.reshape(-1, 2)
+            height, width = output_frame.shape[:2]
+            box[:2] = np.maximum(drawn.min(axis=0) - thickness - 1, 0)
+            box[2:] = np.minimum(drawn.max(axis=0) + thickness + 2, (width, height))
+        region = self.region()
+        if region is None:
+            return
+        weights = self.intensity[region].astype(np.float32) * (1.0 / 255)
+        output_frame[region] = cv2.blendLinear(self.color_layer[region], output_frame[region], weights, 1.0 - weights)
+
+class FramePresenter:
+    def __init__(self, window_name='Face Tracking', target_fps=60.0, size=(1280, 720)):
+        self.window_name = window_name
+        self.interval = 1.0 / target_fps
+        self.size = size
+        self.lock = Lock()
+        self.keys = queue.SimpleQueue()
+        self.latest = None
+        self.submitted = 0
+        self.shown = 0
+        self.presented = 0
+        self.skipped = 0
+        self.late = 0
+        self.error = None
+    
+    def start(self):
+        try:
+            self.create_window()
+        except Exception as e:
+            self.error = e
+    
+    def create_window(self):
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(self.window_name, *self.size)
+    
+    def submit(self, frame):
+        with self.lock:
+            if self.submitted > self.shown:
+                self.skipped += 1
+            self.latest = frame
+            self.submitted += 1
+    
+    def show_latest(self):
+        with self.lock:
+            frame = self.latest if self.submitted != self.shown else None
+            self.shown = self.submitted
+        if frame is not None:
+            cv2.imshow(self.window_name, frame)
+            self.presented += 1
+        key = cv2.waitKey(1) & 0xFF
+        if key != 0xFF:
+            self.keys.put(key)
+    
+    def run(self, keep_running):
+        next_time = time.perf_counter()
+        while self.error is None and keep_running():
+            try:
+                self.show_latest()
+            except Exception as e:
+                self.error = e
+                break
+            next_time += self.interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -self.interval:
+                self.late += 1
+                next_time = time.perf_counter()
+    
+    def poll_keys(self):
+        keys = []
+        while True:
+            try:
+                keys.append(self.keys.get_nowait())
+            except queue.Empty:
+                return keys
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'submitted': self.submitted,
+                'presented': self.presented,
+                'skipped': self.skipped,
+                'late': self.late
+            }
+    
+    def close(self):
+        try:
+            cv2.destroyWindow(self.window_name)
+            cv2.waitKey(1)
+        except Exception:
+            pass
+
+class FaceTracker(SettingsController):
+    def __init__(self, startup_report=False, source=0, headless=False, replay_seconds=30.0, replay_budget_mb=64,
+                 display_fps=60.0, capture_options=None):
+        startup_start = time.perf_counter()
+        self.startup_timings = {}
+        self.source = source
+        self.capture_options = capture_options or {}
+        self.headless = headless
+        self.display_fps = display_fps
+        self.presenter = None
+        self.settings_ui = None
+        self.audio_stream = None
+        self.audio_level = 0
+        super().__init__()
+        if not headless:
+            autosave = load_autosave_settings()
+            if autosave is not None:
+                self.apply_settings(autosave)
+        self.stage_times = {}
+        self.frame_latency = 0.0
+        self.frame_callbacks = []
+        self.telemetry = None
+        self.capture_fps = 0.0
+        self.last_read_time = None
+        self.dropped_frames = 0
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        self.cap.set(cv2.CAP_PROP_FPS, 60)
-        cv2.namedWindow('Face Tracking', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('Face Tracking', 1280, 720)
-        self.mode = 0
-        self.modes = ['Mesh', 'Dots']
-        self.dot_color = [255, 255, 0]
-        self.line_color = [0, 255, 0]
-        self.bg_color = [0, 0, 0]
-        self.dot_size = 2
-        self.line_thickness = 1
+        self.face_mesh = None
+        self.hands = None
+        self.face_config = None
+        self.hands_config = None
+        self.refine_landmarks = True
+        self.face_mesh_thread = None
+        self.pending_face_mesh = None
+        self.failed_face_config = None
+        self.pipeline = None
+        self.hands_thread = None
+        self.hands_lock = Lock()
+        self.hands_error = None
+        self.hands_error_time = None
+        self.hands_error_reported = None
+        self.hands_retry_interval = 5.0
+        self.cap = None
         self.connection_types = {
             'TESSELATION': self.mp_face_mesh.FACEMESH_TESSELATION,
             'CONTOURS': self.mp_face_mesh.FACEMESH_CONTOURS,
@@ -649,36 +585,242 @@ class FaceTracker:
             'LEFT_EYE': self.mp_face_mesh.FACEMESH_LEFT_EYE,
             'RIGHT_EYE': self.mp_face_mesh.FACEMESH_RIGHT_EYE
         }
-        self.current_connection = 'TESSELATION'
         self.hand_tessellation = self.create_hand_tessellation()
-        self.show_camera = False
-        self.camera_opacity = 0.5
-        self.show_hands = True
-        self.performance_mode = False
-        self.experiments = {
-            'expression_triggers': False,
-            'additional_modes': False,
-            'audio_visualizer': False
+        self.face_triangles = mesh_topology.triangles_from_edges(self.mp_face_mesh.FACEMESH_TESSELATION)
+        self.hand_triangles = mesh_topology.hand_triangles()
+        self.connection_edges = {name: mesh_topology.unique_edges(connections)
+                                 for name, connections in self.connection_types.items()}
+        self.hand_connection_edges = {
+            'TESSELATION': mesh_topology.unique_edges(self.hand_tessellation),
+            'CONNECTIONS': mesh_topology.unique_edges(self.mp_hands.HAND_CONNECTIONS)
         }
-        self.emotion_colors = {
-            'happy': [0, 255, 0],
-            'sad': [255, 0, 0],
-            'angry': [0, 0, 255],
-            'neutral': [128, 128, 128]
+        contour_vertices = np.unique(self.connection_edges['CONTOURS'])
+        self.face_lod_levels = mesh_topology.lod_levels([
+            self.connection_edges['TESSELATION'],
+            mesh_topology.edges_from_triangles(
+                mesh_topology.decimate_triangles(self.face_triangles, rounds=2, protected=contour_vertices.tolist())),
+            self.connection_edges['CONTOURS'],
+            mesh_topology.FACE_SKELETON
+        ])
+        self.hand_lod_levels = mesh_topology.lod_levels([
+            self.hand_connection_edges['TESSELATION'],
+            self.hand_connection_edges['CONNECTIONS'],
+            self.hand_connection_edges['CONNECTIONS'],
+            mesh_topology.HAND_SKELETON
+        ])
+        self.lod_thresholds = [160, 90, 45]
+        self.lod_hysteresis = 0.15
+        self.lod_state = {}
+        self.shade_levels = 16
+        self.cull_back_faces = True
+        self.inference_resizer = InferenceResizer()
+        self.redraw_threshold = 1.5
+        self.settings_version = 0
+        self.render_snapshot = None
+        self.rendered_settings_version = -1
+        self.last_output = None
+        self.last_tracked_pixels = None
+        self.render_hits = 0
+        self.render_misses = 0
+        self.dot_rasterizer = DotRasterizer()
+        self.replay_buffer = ReplayBuffer(max_bytes=int(replay_budget_mb * 1024 * 1024), max_seconds=replay_seconds)
+        self.replay = None
+        self.trail_history = TrailHistory(self.trail_length)
+        self.gesture_engine = GestureEngine()
+        self.gesture_bindings = dict(DEFAULT_GESTURE_BINDINGS)
+        self.gesture_actions = {
+            'next_mode': self.cycle_mode,
+            'next_color_preset': self.next_color_preset
         }
+        self.color_preset_index = -1
+        self.pending_actions = []
+        self.face_valid = None
+        self.last_gesture = None
+        self.last_gesture_time = 0.0
+        self.head_pose_estimator = HeadPoseEstimator()
+        self.head_pose = None
         self.current_emotion = 'neutral'
-        self.audio_sensitivity = 1.0
-        self.audio_stream = None
-        self.audio_level = 0
+        self.tracked_points = ([], None)
+        self.face_detected = False
+        self.hands_detected = False
+        self.hand_labels = []
         self.mouth_landmarks = [61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318]
         self.eye_landmarks = [33, 133, 157, 158, 159, 160, 161, 246, 263, 362, 387, 388, 389, 390, 391, 467]
         self.eyebrow_landmarks = [46, 52, 53, 63, 68, 70, 71, 55, 285, 295, 300, 293, 334, 296, 276, 283]
-        self.show_fps = True
+        self.mode_requirements = {
+            'Mesh': {'face': True, 'hands': True, 'iris': True, 'face_points': None},
+            'Dots': {'face': True, 'hands': True, 'iris': True, 'face_points': None},
+            'Skeleton': {'face': True, 'hands': True, 'iris': False,
+                         'face_points': [1, 10, 33, 61, 152, 234, 263, 291, 454]},
+            'Wireframe Triangle': {'face': True, 'hands': True, 'iris': False,
+                                   'face_points': [1, 4, 6, 9, 10, 17, 31, 33, 35, 61, 67, 84, 107, 109, 133, 157,
+                                                   197, 228, 261, 263, 264, 291, 314, 362, 387, 448]},
+            'Wireframe Hexagon': {'face': True, 'hands': True, 'iris': False,
+                                  'face_points': [1, 10, 33, 61, 152, 263, 291]},
+            'Shaded': {'face': True, 'hands': True, 'iris': False, 'face_points': None},
+            'Trails': {'face': True, 'hands': True, 'iris': True, 'face_points': None}
+        }
+        self.experiment_requirements = {
+            'expression_triggers': {'face': True, 'iris': False,
+                                    'face_points': self.mouth_landmarks + [10, 13, 61, 70, 145, 159, 291, 300, 374, 386]},
+            'audio_visualizer': {},
+            'gesture_controls': {'hands': True}
+        }
         self.fps_start_time = cv2.getTickCount()
         self.fps_counter = 0
         self.current_fps = 0
-        self.settings_ui = ModernSettingsUI(self)
-        time.sleep(0.5)
+        loaders = [
+            threading.Thread(target=self.timed_phase, args=('face_mesh', self.load_face_mesh), daemon=True),
+            threading.Thread(target=self.timed_phase, args=('capture', self.open_capture), daemon=True)
+        ]
+        for loader in loaders:
+            loader.start()
+        if not headless:
+            self.timed_phase('settings_ui', self.start_settings_ui)
+        if self.show_hands:
+            self.preload_hands()
+        if not headless:
+            self.timed_phase('window', self.create_window)
+        for loader in loaders:
+            loader.join()
+        self.startup_timings['total'] = time.perf_counter() - startup_start
+        if startup_report:
+            self.print_startup_report()
+    
+    def timed_phase(self, name, func):
+        start = time.perf_counter()
+        func()
+        self.startup_timings[name] = time.perf_counter() - start
+    
+    def load_face_mesh(self):
+        self.face_config = self.face_mesh_config()
+        self.face_mesh = self.create_face_mesh(self.face_config)
+    
+    def rebuild_face_mesh(self, config):
+        try:
+            self.pending_face_mesh = (self.create_face_mesh(config), config)
+        except Exception as e:
+            self.failed_face_config = config
+            print(f"Error creating face mesh: {e}")
+    
+    def swap_face_mesh(self):
+        self.face_mesh_thread = None
+        if self.pending_face_mesh is None:
+            return
+        face_mesh, self.face_config = self.pending_face_mesh
+        self.pending_face_mesh = None
+        self.face_mesh.close()
+        self.face_mesh = face_mesh
+    
+    def load_hands(self):
+        try:
+            self.hands = self.create_hands()
+            self.hands_error = None
+        except Exception as e:
+            self.hands_error = e
+            self.hands_error_time = time.perf_counter()
+    
+    def open_capture(self):
+        self.cap = open_source(self.source, **self.capture_options)
+        self.capture_fps = self.cap.fps if self.cap.live else 0.0
+        self.dropped_frames = 0 if self.cap.live else None
+        shortfall = self.cap.shortfall()
+        if shortfall:
+            print(f"Capture below requested format: {shortfall}")
+    
+    def create_window(self):
+        self.presenter = FramePresenter('Face Tracking', target_fps=self.display_fps)
+        self.presenter.start()
+    
+    def start_settings_ui(self):
+        self.settings_ui = SettingsUIProcess(self.get_settings())
+    
+    def poll_settings_ui(self):
+        if self.settings_ui is None:
+            return
+        changes = self.settings_ui.receive()
+        if changes is not None:
+            self.update_settings(changes)
+    
+    def sync_settings_ui(self, *keys):
+        if self.settings_ui is not None:
+            settings = self.get_settings()
+            self.settings_ui.send_settings({key: settings[key] for key in keys})
+    
+    def update_settings(self, changes):
+        SettingsController.update_settings(self, changes)
+        if 'experiments' not in changes:
+            return
+        if self.experiments.get('audio_visualizer', False):
+            self.start_audio_stream()
+        else:
+            self.stop_audio_stream()
+    
+    def preload_hands(self):
+        with self.hands_lock:
+            retry_wait = (self.hands_error is not None and
+                          time.perf_counter() - self.hands_error_time < self.hands_retry_interval)
+            if self.hands is None and self.hands_thread is None and not retry_wait:
+                self.hands_thread = threading.Thread(target=self.timed_phase, args=('hands', self.load_hands), daemon=True)
+                self.hands_thread.start()
+    
+    def get_hands(self):
+        if self.hands is None:
+            self.preload_hands()
+            loader = self.hands_thread
+            if loader is not None:
+                loader.join()
+            if self.hands is None:
+                with self.hands_lock:
+                    if self.hands_thread is loader:
+                        self.hands_thread = None
+                raise RuntimeError(f"Hand model failed to load: {self.hands_error}")
+        return self.hands
+    
+    def print_startup_report(self):
+        print("Startup report:")
+        for phase, seconds in self.startup_timings.items():
+            print(f"  {phase:<12} {seconds * 1000:8.1f} ms")
+        if self.hands_error is not None:
+            print(f"  {'hands':<12} failed: {self.hands_error}")
+        elif 'hands' not in self.startup_timings:
+            print(f"  {'hands':<12} {'deferred' if self.hands_thread is None else 'loading in background'}")
+        print(f"  Capture: {self.cap.describe()}")
+    
+    def model_confidence(self):
+        if self.detection_confidence is not None:
+            return self.detection_confidence
+        return 0.3 if self.performance_mode else 0.5
+    
+    def face_mesh_config(self):
+        refine_landmarks = self.refine_landmarks and self.iris_refinement and not self.performance_mode
+        return (refine_landmarks, self.model_confidence())
+    
+    def hand_model_config(self):
+        complexity = self.hand_model_complexity
+        if complexity is None:
+            complexity = 0 if self.performance_mode else 1
+        return (complexity, self.model_confidence())
+    
+    def create_face_mesh(self, config):
+        refine_landmarks, confidence = config
+        return self.mp_face_mesh.FaceMesh(
+            max_num_faces=1,
+            refine_landmarks=refine_landmarks,
+            min_detection_confidence=confidence,
+            min_tracking_confidence=confidence
+        )
+    
+    def create_hands(self):
+        complexity, confidence = self.hand_model_config()
+        self.hands_config = (complexity, confidence)
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=confidence,
+            min_tracking_confidence=confidence,
+            model_complexity=complexity
+        )
     
     def create_hand_tessellation(self):
         tessellation = []
@@ -716,54 +858,72 @@ class FaceTracker:
         ])
         return list(set(tessellation))
     
-    def draw_mesh(self, output_frame, face_landmarks, frame_shape, hand_results=None):
-        for idx, landmark in enumerate(face_landmarks.landmark):
-            x = int(landmark.x * frame_shape[1])
-            y = int(landmark.y * frame_shape[0])
-            cv2.circle(output_frame, (x, y), self.dot_size, tuple(self.dot_color), -1)
-        connections = self.connection_types[self.current_connection]
-        for connection in connections:
-            start_idx = connection[0]
-            end_idx = connection[1]
-            start_point = face_landmarks.landmark[start_idx]
-            end_point = face_landmarks.landmark[end_idx]
-            start_x = int(start_point.x * frame_shape[1])
-            start_y = int(start_point.y * frame_shape[0])
-            end_x = int(end_point.x * frame_shape[1])
-            end_y = int(end_point.y * frame_shape[0])
-            cv2.line(output_frame, (start_x, start_y), (end_x, end_y), 
-                    tuple(self.line_color), self.line_thickness)
-        if hand_results and hand_results.multi_hand_landmarks:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                for idx, landmark in enumerate(hand_landmarks.landmark):
-                    x = int(landmark.x * frame_shape[1])
-                    y = int(landmark.y * frame_shape[0])
-                    cv2.circle(output_frame, (x, y), self.dot_size, tuple(self.dot_color), -1)
-                hand_connections = self.hand_tessellation if self.current_connection == 'TESSELATION' else self.mp_hands.HAND_CONNECTIONS
-                for connection in hand_connections:
-                    start_idx = connection[0]
-                    end_idx = connection[1]
-                    if start_idx < len(hand_landmarks.landmark) and end_idx < len(hand_landmarks.landmark):
-                        start_point = hand_landmarks.landmark[start_idx]
-                        end_point = hand_landmarks.landmark[end_idx]
-                        start_x = int(start_point.x * frame_shape[1])
-                        start_y = int(start_point.y * frame_shape[0])
-                        end_x = int(end_point.x * frame_shape[1])
-                        end_y = int(end_point.y * frame_shape[0])
-                        cv2.line(output_frame, (start_x, start_y), (end_x, end_y), 
-                                tuple(self.line_color), self.line_thickness)
+    def landmarks_to_array(self, landmark_list, subset=None):
+        landmarks = landmark_list.landmark
+        if subset is None:
+            return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+        points = np.zeros((len(landmarks), 3), dtype=np.float32)
+        points[subset] = [(landmarks[idx].x, landmarks[idx].y, landmarks[idx].z) for idx in subset]
+        return points
     
-    def draw_dots_only(self, output_frame, face_landmarks, frame_shape, hand_results=None):
-        for idx, landmark in enumerate(face_landmarks.landmark):
-            x = int(landmark.x * frame_shape[1])
-            y = int(landmark.y * frame_shape[0])
-            cv2.circle(output_frame, (x, y), self.dot_size * 2, tuple(self.dot_color), -1)
-        if hand_results and hand_results.multi_hand_landmarks:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                for idx, landmark in enumerate(hand_landmarks.landmark):
-                    x = int(landmark.x * frame_shape[1])
-                    y = int(landmark.y * frame_shape[0])
-                    cv2.circle(output_frame, (x, y), self.dot_size * 2, tuple(self.dot_color), -1)
+    def to_pixels(self, points, frame_shape):
+        return np.multiply(points[:, :2], (frame_shape[1], frame_shape[0]), dtype=np.float64).astype(np.int32)
+    
+    def draw_dots(self, output_frame, pixels, radius):
+        self.dot_rasterizer.stamp(output_frame, pixels, radius, self.dot_color, self.antialias_dots)
+    
+    def select_lod(self, key, pixels):
+        size = int(np.ptp(pixels, axis=0).max())
+        level = self.lod_state.get(key, 0)
+        while level > 0 and size >= self.lod_thresholds[level - 1] * (1 + self.lod_hysteresis):
+            level -= 1
+        while level < len(self.lod_thresholds) and size < self.lod_thresholds[level] * (1 - self.lod_hysteresis):
+            level += 1
+        self.lod_state[key] = level
+        return level
+    
+    def draw_wire(self, output_frame, pixels, edges, vertices=None):
+        self.draw_dots(output_frame, pixels if vertices is None else pixels[vertices], self.dot_size)
+        if len(edges):
+            cv2.polylines(output_frame, pixels[edges], False, tuple(self.line_color), self.line_thickness)
+    
+    def valid_face_indices(self, indices):
+        indices = np.asarray(indices)
+        if self.face_valid is None or len(indices) == 0:
+            return indices
+        return indices[self.face_valid[indices].reshape(len(indices), -1).all(axis=1)]
+    
+    def draw_mesh(self, output_frame, face_points, frame_shape, hand_points=None, face_index=0):
+        face_pixels = self.to_pixels(face_points, frame_shape)
+        if self.face_valid is not None:
+            valid_pixels = face_pixels[self.face_valid]
+        else:
+            valid_pixels = face_pixels
+        if self.lod_enabled and self.current_connection == 'TESSELATION':
+            level = self.face_lod_levels[self.select_lod(('face', face_index), valid_pixels)]
+            edges, vertices = level['edges'], level['vertices']
+        else:
+            edges, vertices = self.connection_edges[self.current_connection], None
+        if self.face_valid is not None:
+            edges = self.valid_face_indices(edges)
+            vertices = self.valid_face_indices(np.arange(len(face_pixels)) if vertices is None else vertices)
+        self.draw_wire(output_frame, face_pixels, edges, vertices)
+        if hand_points:
+            hand_edges = self.hand_connection_edges['TESSELATION' if self.current_connection == 'TESSELATION' else 'CONNECTIONS']
+            for hand_index, hand in enumerate(hand_points):
+                hand_pixels = self.to_pixels(hand, frame_shape)
+                if self.lod_enabled and self.current_connection == 'TESSELATION':
+                    level = self.hand_lod_levels[self.select_lod(('hand', face_index, hand_index), hand_pixels)]
+                    self.draw_wire(output_frame, hand_pixels, level['edges'], level['vertices'])
+                else:
+                    self.draw_wire(output_frame, hand_pixels, hand_edges)
+    
+    def draw_dots_only(self, output_frame, face_points, frame_shape, hand_points=None):
+        if self.face_valid is not None:
+            face_points = face_points[self.face_valid]
+        if hand_points:
+            face_points = np.concatenate([face_points] + hand_points)
+        self.draw_dots(output_frame, self.to_pixels(face_points, frame_shape), self.dot_size * 2)
     
     def calculate_fps(self):
         self.fps_counter += 1
@@ -776,17 +936,12 @@ class FaceTracker:
     
     def draw_fps(self, frame):
         if self.show_fps:
-            cv2.putText(frame, f"FPS: {self.current_fps:.1f}", (10, 30),
+            text = f"FPS: {self.current_fps:.1f}"
+            if self.incremental_render:
+                text += f"  Reused: {self.render_cache_stats()['hit_rate']:.0%}"
+            cv2.putText(frame, text, (10, 30),
                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
     
-    def update_modes(self):
-        base_modes = ['Mesh', 'Dots']
-        if self.experiments.get('additional_modes', False):
-            base_modes.extend(['Skeleton', 'Wireframe Triangle', 'Wireframe Hexagon'])
-        self.modes = base_modes
-        if self.mode >= len(self.modes):
-            self.mode = 0
-    
     def start_audio_stream(self):
         if not self.audio_stream:
             try:
@@ -854,7 +1009,7 @@ class FaceTracker:
         else:
             return 'neutral'
     
-    def draw_skeleton(self, output_frame, face_landmarks, frame_shape, hand_results=None):
+    def draw_skeleton(self, output_frame, face_points, frame_shape, hand_points=None):
         key_face_points = [
             1,
             33,
@@ -866,11 +1021,9 @@ class FaceTracker:
             234,
             454,
         ]
-        for idx in key_face_points:
-            landmark = face_landmarks.landmark[idx]
-            x = int(landmark.x * frame_shape[1])
-            y = int(landmark.y * frame_shape[0])
-            cv2.circle(output_frame, (x, y), self.dot_size * 2, tuple(self.dot_color), -1)
+        pixels = self.to_pixels(face_points, frame_shape).tolist()
+        for idx in self.valid_face_indices(key_face_points).tolist():
+            cv2.circle(output_frame, tuple(pixels[idx]), self.dot_size * 2, tuple(self.dot_color), -1)
         skeleton_connections = [
             (1, 10),
             (1, 152),
@@ -879,34 +1032,20 @@ class FaceTracker:
             (234, 33),
             (454, 263),
         ]
-        for start_idx, end_idx in skeleton_connections:
-            start_point = face_landmarks.landmark[start_idx]
-            end_point = face_landmarks.landmark[end_idx]
-            start_x = int(start_point.x * frame_shape[1])
-            start_y = int(start_point.y * frame_shape[0])
-            end_x = int(end_point.x * frame_shape[1])
-            end_y = int(end_point.y * frame_shape[0])
-            cv2.line(output_frame, (start_x, start_y), (end_x, end_y), 
+        for start_idx, end_idx in self.valid_face_indices(skeleton_connections).tolist():
+            cv2.line(output_frame, tuple(pixels[start_idx]), tuple(pixels[end_idx]), 
                     tuple(self.line_color), self.line_thickness)
-        if hand_results and hand_results.multi_hand_landmarks and self.show_hands:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
+        if hand_points and self.show_hands:
+            for hand in hand_points:
+                hand_pixels = self.to_pixels(hand, frame_shape).tolist()
                 key_hand_points = [0, 4, 8, 12, 16, 20]
                 for idx in key_hand_points:
-                    landmark = hand_landmarks.landmark[idx]
-                    x = int(landmark.x * frame_shape[1])
-                    y = int(landmark.y * frame_shape[0])
-                    cv2.circle(output_frame, (x, y), self.dot_size * 2, tuple(self.dot_color), -1)
+                    cv2.circle(output_frame, tuple(hand_pixels[idx]), self.dot_size * 2, tuple(self.dot_color), -1)
                 for idx in [4, 8, 12, 16, 20]:
-                    start_point = hand_landmarks.landmark[0]
-                    end_point = hand_landmarks.landmark[idx]
-                    start_x = int(start_point.x * frame_shape[1])
-                    start_y = int(start_point.y * frame_shape[0])
-                    end_x = int(end_point.x * frame_shape[1])
-                    end_y = int(end_point.y * frame_shape[0])
-                    cv2.line(output_frame, (start_x, start_y), (end_x, end_y), 
+                    cv2.line(output_frame, tuple(hand_pixels[0]), tuple(hand_pixels[idx]), 
                             tuple(self.line_color), self.line_thickness)
     
-    def draw_wireframe_triangle(self, output_frame, face_landmarks, frame_shape, hand_results=None):
+    def draw_wireframe_triangle(self, output_frame, face_points, frame_shape, hand_points=None):
         triangle_indices = [
             (10, 67, 109), (109, 9, 10), (9, 109, 107),
             (33, 133, 157), (263, 362, 387),
@@ -914,45 +1053,35 @@ class FaceTracker:
             (61, 84, 17), (17, 314, 291),
             (35, 31, 228), (264, 261, 448)
         ]
-        for triangle in triangle_indices:
-            points = []
-            for idx in triangle:
-                if idx < len(face_landmarks.landmark):
-                    landmark = face_landmarks.landmark[idx]
-                    x = int(landmark.x * frame_shape[1])
-                    y = int(landmark.y * frame_shape[0])
-                    points.append((x, y))
+        pixels = self.to_pixels(face_points, frame_shape).tolist()
+        for triangle in self.valid_face_indices(triangle_indices).tolist():
+            points = [tuple(pixels[idx]) for idx in triangle if idx < len(pixels)]
             if len(points) == 3:
                 cv2.line(output_frame, points[0], points[1], tuple(self.line_color), self.line_thickness)
                 cv2.line(output_frame, points[1], points[2], tuple(self.line_color), self.line_thickness)
                 cv2.line(output_frame, points[2], points[0], tuple(self.line_color), self.line_thickness)
                 for point in points:
                     cv2.circle(output_frame, point, self.dot_size, tuple(self.dot_color), -1)
-        if hand_results and hand_results.multi_hand_landmarks and self.show_hands:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
+        if hand_points and self.show_hands:
+            for hand in hand_points:
+                hand_pixels = self.to_pixels(hand, frame_shape).tolist()
                 hand_triangles = [
                     (0, 1, 5), (0, 5, 9), (0, 9, 13), (0, 13, 17),
                     (1, 2, 3), (5, 6, 7), (9, 10, 11), (13, 14, 15), (17, 18, 19)
                 ]
                 for triangle in hand_triangles:
-                    points = []
-                    for idx in triangle:
-                        landmark = hand_landmarks.landmark[idx]
-                        x = int(landmark.x * frame_shape[1])
-                        y = int(landmark.y * frame_shape[0])
-                        points.append((x, y))
+                    points = [tuple(hand_pixels[idx]) for idx in triangle]
                     cv2.line(output_frame, points[0], points[1], tuple(self.line_color), self.line_thickness)
                     cv2.line(output_frame, points[1], points[2], tuple(self.line_color), self.line_thickness)
                     cv2.line(output_frame, points[2], points[0], tuple(self.line_color), self.line_thickness)
                     for point in points:
                         cv2.circle(output_frame, point, self.dot_size, tuple(self.dot_color), -1)
     
-    def draw_wireframe_hexagon(self, output_frame, face_landmarks, frame_shape, hand_results=None):
+    def draw_wireframe_hexagon(self, output_frame, face_points, frame_shape, hand_points=None):
         hex_centers = [10, 1, 152, 33, 263, 61, 291]
-        for center_idx in hex_centers:
-            center = face_landmarks.landmark[center_idx]
-            center_x = int(center.x * frame_shape[1])
-            center_y = int(center.y * frame_shape[0])
+        pixels = self.to_pixels(face_points, frame_shape).tolist()
+        for center_idx in self.valid_face_indices(hex_centers).tolist():
+            center_x, center_y = pixels[center_idx]
             radius = 30
             angles = [i * 60 for i in range(6)]
             hex_points = []
@@ -964,13 +1093,12 @@ class FaceTracker:
                 cv2.line(output_frame, hex_points[i], hex_points[(i + 1) % 6], 
                         tuple(self.line_color), self.line_thickness)
             cv2.circle(output_frame, (center_x, center_y), self.dot_size * 2, tuple(self.dot_color), -1)
-        if hand_results and hand_results.multi_hand_landmarks and self.show_hands:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
+        if hand_points and self.show_hands:
+            for hand in hand_points:
+                hand_pixels = self.to_pixels(hand, frame_shape).tolist()
                 hand_hex_centers = [0, 4, 8, 12, 16, 20]
                 for center_idx in hand_hex_centers:
-                    center = hand_landmarks.landmark[center_idx]
-                    center_x = int(center.x * frame_shape[1])
-                    center_y = int(center.y * frame_shape[0])
+                    center_x, center_y = hand_pixels[center_idx]
                     radius = 20
                     angles = [i * 60 for i in range(6)]
                     hex_points = []
@@ -983,109 +1111,427 @@ class FaceTracker:
                                 tuple(self.line_color), self.line_thickness)
                     cv2.circle(output_frame, (center_x, center_y), self.dot_size * 2, tuple(self.dot_color), -1)
     
+    def render_settings_snapshot(self):
+        return (self.mode, self.current_connection, tuple(self.dot_color), tuple(self.line_color),
+                tuple(self.bg_color), self.dot_size, self.line_thickness, self.show_camera,
+                self.camera_opacity, self.show_hands, self.antialias_dots, self.lod_enabled)
+    
+    def needs_redraw(self, frame, face_points, hand_points):
+        snapshot = self.render_settings_snapshot()
+        if snapshot != self.render_snapshot:
+            self.render_snapshot = snapshot
+            self.settings_version += 1
+        tracked = face_points + (hand_points or []) if face_points else []
+        tracked_pixels = self.to_pixels(np.concatenate(tracked), frame.shape) if tracked else None
+        redraw = (self.last_output is None or self.last_output.shape != frame.shape or self.show_camera
+                  or self.settings_version != self.rendered_settings_version)
+        if not redraw:
+            if tracked_pixels is None or self.last_tracked_pixels is None:
+                redraw = tracked_pixels is not self.last_tracked_pixels
+            elif tracked_pixels.shape != self.last_tracked_pixels.shape:
+                redraw = True
+            else:
+                redraw = np.abs(tracked_pixels - self.last_tracked_pixels).max() > self.redraw_threshold
+        if redraw:
+            self.last_tracked_pixels = tracked_pixels
+            self.rendered_settings_version = self.settings_version
+        return redraw
+    
+    def render_cache_stats(self):
+        total = self.render_hits + self.render_misses
+        return {
+            'hits': self.render_hits,
+            'misses': self.render_misses,
+            'hit_rate': self.render_hits / total if total else 0.0,
+            'settings_version': self.settings_version
+        }
+    
+    def render_frame(self, frame, face_points, hand_points, face_subset=None):
+        mode_name = self.modes[self.mode]
+        self.face_valid = None
+        if face_subset is not None and face_points:
+            self.face_valid = np.zeros(len(face_points[0]), dtype=bool)
+            self.face_valid[face_subset] = True
+        if mode_name == 'Trails':
+            self.update_trails(frame.shape, face_points, hand_points)
+        else:
+            self.trail_history.reset()
+        if self.incremental_render and mode_name != 'Trails':
+            if not self.needs_redraw(frame, face_points, hand_points):
+                self.render_hits += 1
+                return self.last_output
+            self.render_misses += 1
+        if self.show_camera:
+            output_frame = cv2.addWeighted(frame, self.camera_opacity, 
+                                         np.full_like(frame, self.bg_color), 
+                                         1 - self.camera_opacity, 0)
+        else:
+            output_frame = np.full_like(frame, self.bg_color)
+        if mode_name == 'Trails':
+            self.trail_history.render(output_frame, self.line_color, self.line_thickness, frame.shape[1] * 0.2)
+        for face_index, points in enumerate(face_points):
+            if mode_name == 'Mesh':
+                self.draw_mesh(output_frame, points, frame.shape, hand_points, face_index)
+            elif mode_name == 'Dots':
+                self.draw_dots_only(output_frame, points, frame.shape, hand_points)
+            elif mode_name == 'Skeleton':
+                self.draw_skeleton(output_frame, points, frame.shape, hand_points)
+            elif mode_name == 'Wireframe Triangle':
+                self.draw_wireframe_triangle(output_frame, points, frame.shape, hand_points)
+            elif mode_name == 'Wireframe Hexagon':
+                self.draw_wireframe_hexagon(output_frame, points, frame.shape, hand_points)
+            elif mode_name == 'Shaded':
+                self.draw_shaded(output_frame, points, frame.shape, hand_points)
+            elif mode_name == 'Trails':
+                self.draw_dots_only(output_frame, points, frame.shape, hand_points if self.show_hands else None)
+        self.last_output = output_frame if self.incremental_render else None
+        return output_frame
+    
+    def update_trails(self, frame_shape, face_points, hand_points):
+        if self.trail_history.length != self.trail_length:
+            self.trail_history.resize(self.trail_length)
+        face_pixels = self.to_pixels(face_points[0], frame_shape) if face_points else None
+        hand_pixels = [self.to_pixels(hand, frame_shape) for hand in hand_points] if hand_points and self.show_hands else None
+        self.trail_history.push(face_pixels, hand_pixels, self.face_valid)
+    
+    def shade_palette(self):
+        far_color = np.array(self.line_color, dtype=np.float32)
+        near_color = np.array(self.dot_color, dtype=np.float32)
+        steps = (np.arange(self.shade_levels, dtype=np.float32) + 0.5) / self.shade_levels
+        palette = far_color + (near_color - far_color) * steps[:, None]
+        return [tuple(color) for color in np.clip(palette, 0, 255).astype(np.uint8).tolist()]
+    
+    def fill_triangles(self, output_frame, points, triangles, frame_shape):
+        pixels = self.to_pixels(points, frame_shape)
+        if self.cull_back_faces:
+            triangles = triangles[mesh_topology.front_facing(pixels, triangles)]
+        if len(triangles) == 0:
+            return
+        order, depth = mesh_topology.triangle_depth_order(points, triangles)
+        polygons = pixels[triangles[order]]
+        span = max(float(depth[0] - depth[-1]), 1e-6)
+        shades = np.minimum(((depth[0] - depth) / span * self.shade_levels).astype(np.int32), self.shade_levels - 1)
+        palette = self.shade_palette()
+        for polygon, shade in zip(polygons, shades.tolist()):
+            cv2.fillConvexPoly(output_frame, polygon, palette[shade])
+    
+    def draw_shaded(self, output_frame, face_points, frame_shape, hand_points=None):
+        self.fill_triangles(output_frame, face_points, self.valid_face_indices(self.face_triangles), frame_shape)
+        if hand_points and self.show_hands:
+            for hand in hand_points:
+                self.fill_triangles(output_frame, hand, self.hand_triangles, frame_shape)
+    
+    def draw_head_pose(self, output_frame):
+        if not self.show_head_pose or self.head_pose is None:
+            return
+        origin, x_axis, y_axis, z_axis = [tuple(point) for point in
+                                          self.head_pose_estimator.project_axes(self.head_pose, output_frame.shape).tolist()]
+        cv2.line(output_frame, origin, x_axis, (0, 0, 255), 3, cv2.LINE_AA)
+        cv2.line(output_frame, origin, y_axis, (0, 255, 0), 3, cv2.LINE_AA)
+        cv2.line(output_frame, origin, z_axis, (255, 0, 0), 3, cv2.LINE_AA)
+        text = f"Yaw: {self.head_pose['yaw']:.0f}  Pitch: {self.head_pose['pitch']:.0f}  Roll: {self.head_pose['roll']:.0f}"
+        cv2.putText(output_frame, text, (10, output_frame.shape[0] - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    
+    def toggle_replay(self):
+        if self.replay is not None:
+            self.replay = None
+            return
+        entries = self.replay_buffer.snapshot()
+        if len(entries) < 2:
+            return
+        self.replay = {
+            'entries': entries,
+            'times': np.array([entry[0] for entry in entries]),
+            'started': time.perf_counter(),
+            'index': -1,
+            'frame': None
+        }
+    
+    def render_replay(self):
+        times = self.replay['times']
+        position = times[0] + (time.perf_counter() - self.replay['started']) * self.replay_speed
+        index = int(np.searchsorted(times, position, side='right')) - 1
+        if index >= len(times) - 1 and position > times[-1]:
+            self.replay = None
+            return None
+        entry = self.replay['entries'][index]
+        if index != self.replay['index']:
+            self.replay['index'] = index
+            frame = self.replay_buffer.decode(entry)
+            if frame is not None:
+                self.replay['frame'] = frame
+            elif self.replay['frame'] is None or self.replay['frame'].shape != entry[4]:
+                self.replay['frame'] = np.zeros(entry[4], dtype=np.uint8)
+        return self.render_frame(self.replay['frame'], entry[1], entry[2], entry[3])
+    
+    def draw_replay_status(self, output_frame):
+        if self.replay is None:
+            return
+        times = self.replay['times']
+        offset = times[max(self.replay['index'], 0)] - times[-1]
+        text = f"REPLAY x{self.replay_speed:.2f}  {offset:.1f}s"
+        cv2.putText(output_frame, text, (output_frame.shape[1] - 360, 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
+    
+    def handle_gesture(self, gesture):
+        action = self.gesture_bindings.get(gesture)
+        if action in self.gesture_actions:
+            self.pending_actions.append(self.gesture_actions[action])
+        self.last_gesture = gesture
+        self.last_gesture_time = time.perf_counter()
+    
+    def draw_gesture(self, output_frame):
+        if not self.experiments.get('gesture_controls', False) or self.last_gesture is None:
+            return
+        if time.perf_counter() - self.last_gesture_time > 1.5:
+            return
+        cv2.putText(output_frame, f"Gesture: {self.last_gesture}", (10, 90),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    
+    def cycle_mode(self):
+        self.mode = (self.mode + 1) % len(self.modes)
+        self.sync_settings_ui('mode')
+    
+    def next_color_preset(self):
+        names = list(DEFAULT_COLOR_PRESETS)
+        self.color_preset_index = (self.color_preset_index + 1) % len(names)
+        preset = DEFAULT_COLOR_PRESETS[names[self.color_preset_index]]
+        self.dot_color = list(preset["dot_color"])
+        self.line_color = list(preset["line_color"])
+        self.bg_color = list(preset["bg_color"])
+        self.sync_settings_ui('dot_color', 'line_color', 'bg_color')
+    
     def update_performance_settings(self):
-        if self.performance_mode:
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                max_num_faces=1,
-                refine_landmarks=False,
-                min_detection_confidence=0.3,
-                min_tracking_confidence=0.3
-            )
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.3,
-                min_tracking_confidence=0.3,
-                model_complexity=0
-            )
+        self.face_config = None
+        self.hands_config = None
+    
+    def pipeline_requirements(self):
+        needs = {'face': False, 'hands': False, 'iris': False, 'face_points': set()}
+        declarations = [self.mode_requirements.get(self.modes[self.mode], {})]
+        for name, enabled in self.experiments.items():
+            if enabled and name in self.experiment_requirements:
+                declarations.append(self.experiment_requirements[name])
+        for declaration in declarations:
+            needs['face'] = needs['face'] or declaration.get('face', False)
+            needs['hands'] = needs['hands'] or declaration.get('hands', False)
+            needs['iris'] = needs['iris'] or declaration.get('iris', False)
+            if declaration.get('face', False) and needs['face_points'] is not None:
+                face_points = declaration.get('face_points')
+                needs['face_points'] = None if face_points is None else needs['face_points'] | set(face_points)
+        needs['hands'] = needs['hands'] and self.show_hands
+        if needs['face'] and needs['face_points'] is not None:
+            needs['face_points'] |= set(self.head_pose_estimator.landmarks)
+        if needs['face_points'] is not None:
+            needs['face_points'] = sorted(needs['face_points'])
+        return needs
+    
+    def configure_pipeline(self, wait=False):
+        needs = self.pipeline_requirements()
+        self.refine_landmarks = needs['iris']
+        config = self.face_mesh_config()
+        if (needs['face'] and config != self.face_config and config != self.failed_face_config
+                and self.face_mesh_thread is None):
+            self.face_mesh_thread = threading.Thread(target=self.rebuild_face_mesh, args=(config,), daemon=True)
+            self.face_mesh_thread.start()
+        if self.face_mesh_thread is not None:
+            if wait:
+                self.face_mesh_thread.join()
+            if not self.face_mesh_thread.is_alive():
+                self.swap_face_mesh()
+        if needs['hands'] and self.hands is not None and self.hands_config != self.hand_model_config():
+            self.hands.close()
+            self.hands = self.create_hands()
+        self.pipeline = needs
+        return needs
+    
+    def process_frame(self, frame):
+        stage_start = time.perf_counter()
+        self.poll_settings_ui()
+        actions, self.pending_actions = self.pending_actions, []
+        for action in actions:
+            action()
+        needs = self.configure_pipeline()
+        frame = cv2.flip(frame, 1)
+        self.inference_resizer.new_frame()
+        results = None
+        if needs['face']:
+            results = self.face_mesh.process(self.inference_resizer.get(frame, self.face_inference_height))
+        now = time.perf_counter()
+        self.stage_times['face'] = now - stage_start
+        stage_start = now
+        hand_results = None
+        if needs['hands']:
+            try:
+                hands = self.get_hands()
+            except RuntimeError as e:
+                hands = None
+                if self.hands_error_reported != self.hands_error_time:
+                    self.hands_error_reported = self.hands_error_time
+                    print(f"Error loading hand model: {e}")
+            if hands is not None:
+                hand_results = hands.process(self.inference_resizer.get(frame, self.hand_inference_height))
+        now = time.perf_counter()
+        self.stage_times['hands'] = now - stage_start
+        stage_start = now
+        face_landmarks = results.multi_face_landmarks if results is not None else None
+        if face_landmarks and self.experiments.get('expression_triggers', False):
+            self.current_emotion = self.detect_emotion(face_landmarks[0])
+            emotion_color = self.emotion_colors[self.current_emotion]
+            self.dot_color = emotion_color
+            self.line_color = emotion_color
+        face_points = [self.landmarks_to_array(face, needs['face_points']) for face in face_landmarks or []]
+        pose_start = time.perf_counter()
+        if face_points:
+            self.head_pose = self.head_pose_estimator.estimate(face_points[0], frame.shape)
         else:
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-    
-    def run(self):
-        while True:
+            self.head_pose = None
+            self.head_pose_estimator.reset()
+        self.stage_times['head_pose'] = time.perf_counter() - pose_start
+        hand_points = None
+        self.hand_labels = []
+        if hand_results and hand_results.multi_hand_landmarks:
+            hand_points = [self.landmarks_to_array(hand) for hand in hand_results.multi_hand_landmarks]
+            handedness = getattr(hand_results, 'multi_handedness', None) or []
+            self.hand_labels = [hand.classification[0].label for hand in handedness]
+        if self.experiments.get('gesture_controls', False):
+            gesture_start = time.perf_counter()
+            for gesture in self.gesture_engine.update(hand_points, frame.shape):
+                self.handle_gesture(gesture)
+            self.stage_times['gestures'] = time.perf_counter() - gesture_start
+        self.tracked_points = (face_points, hand_points)
+        self.face_detected = bool(face_points)
+        self.hands_detected = bool(hand_points)
+        original_dot_size = self.dot_size
+        original_line_thickness = self.line_thickness
+        
+        if self.experiments.get('audio_visualizer', False):
+            base_size = 1
+            audio_multiplier = 1 + (self.audio_level * 9)
+            self.dot_size = int(base_size * audio_multiplier)
+            self.line_thickness = int(base_size * audio_multiplier)
+        self.replay_buffer.append(time.perf_counter(), face_points, hand_points, needs['face_points'], frame.shape,
+                                  frame if self.replay_frames else None)
+        output_frame = self.render_replay() if self.replay is not None else None
+        if output_frame is None:
+            output_frame = self.render_frame(frame, face_points, hand_points)
+        if self.experiments.get('audio_visualizer', False):
+            self.dot_size = original_dot_size
+            self.line_thickness = original_line_thickness
+        self.calculate_fps()
+        if output_frame is self.last_output and (self.show_fps or self.show_head_pose
+                                                 or self.experiments.get('expression_triggers', False)
+                                                 or self.experiments.get('gesture_controls', False)
+                                                 or self.replay is not None):
+            output_frame = output_frame.copy()
+        self.draw_fps(output_frame)
+        self.draw_replay_status(output_frame)
+        if self.replay is None:
+            self.draw_head_pose(output_frame)
+        self.draw_gesture(output_frame)
+        if self.experiments.get('expression_triggers', False):
+            cv2.putText(output_frame, f"Emotion: {self.current_emotion}", (10, 60),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.emotion_colors[self.current_emotion], 2)
+        self.stage_times['render'] = time.perf_counter() - stage_start
+        return output_frame
+    
+    def present(self, output_frame):
+        if self.presenter is None:
+            return True
+        if self.presenter.error is not None:
+            print(f"Error displaying frame: {self.presenter.error}")
+            return False
+        self.presenter.submit(output_frame)
+        for key in self.presenter.poll_keys():
+            if key == ord('q'):
+                return False
+            elif key == ord(' '):
+                self.cycle_mode()
+            elif key == ord('r'):
+                self.toggle_replay()
+        return True
+    
+    def run(self, max_frames=None):
+        self.configure_pipeline(wait=True)
+        self.process_error = None
+        if self.presenter is None:
+            self.process_frames(max_frames)
+        else:
+            worker = threading.Thread(target=self.process_frames, args=(max_frames,), daemon=True)
+            worker.start()
+            self.presenter.run(worker.is_alive)
+            worker.join()
+        self.cleanup()
+        if self.process_error is not None:
+            raise self.process_error
+    
+    def process_frames(self, max_frames):
+        try:
+            self.process_loop(max_frames)
+        except Exception as e:
+            self.process_error = e
+    
+    def process_loop(self, max_frames):
+        frames = 0
+        while max_frames is None or frames < max_frames:
+            frame_start = time.perf_counter()
             ret, frame = self.cap.read()
             if not ret:
                 break
-            frame = cv2.flip(frame, 1)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.face_mesh.process(rgb_frame)
-            hand_results = None
-            if self.show_hands and self.mode in [0, 1, 2, 3, 4]:
-                hand_results = self.hands.process(rgb_frame)
-            if results.multi_face_landmarks and self.experiments.get('expression_triggers', False):
-                self.current_emotion = self.detect_emotion(results.multi_face_landmarks[0])
-                emotion_color = self.emotion_colors[self.current_emotion]
-                self.dot_color = emotion_color
-                self.line_color = emotion_color
-            original_dot_size = self.dot_size
-            original_line_thickness = self.line_thickness
-            
-            if self.experiments.get('audio_visualizer', False):
-                base_size = 1
-                audio_multiplier = 1 + (self.audio_level * 9)
-                self.dot_size = int(base_size * audio_multiplier)
-                self.line_thickness = int(base_size * audio_multiplier)
-            if self.show_camera:
-                output_frame = cv2.addWeighted(frame, self.camera_opacity, 
-                                             np.full_like(frame, self.bg_color), 
-                                             1 - self.camera_opacity, 0)
-            else:
-                output_frame = np.full_like(frame, self.bg_color)
-            if results.multi_face_landmarks:
-                for face_landmarks in results.multi_face_landmarks:
-                    if self.mode == 0:
-                        self.draw_mesh(output_frame, face_landmarks, frame.shape, hand_results)
-                    elif self.mode == 1:
-                        self.draw_dots_only(output_frame, face_landmarks, frame.shape, hand_results)
-                    elif self.mode == 2:
-                        self.draw_skeleton(output_frame, face_landmarks, frame.shape, hand_results)
-                    elif self.mode == 3:
-                        self.draw_wireframe_triangle(output_frame, face_landmarks, frame.shape, hand_results)
-                    elif self.mode == 4:
-                        self.draw_wireframe_hexagon(output_frame, face_landmarks, frame.shape, hand_results)
-            if self.experiments.get('audio_visualizer', False):
-                self.dot_size = original_dot_size
-                self.line_thickness = original_line_thickness
-            self.calculate_fps()
-            self.draw_fps(output_frame)
-            if self.experiments.get('expression_triggers', False):
-                cv2.putText(output_frame, f"Emotion: {self.current_emotion}", (10, 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, self.emotion_colors[self.current_emotion], 2)
-            cv2.imshow('Face Tracking', output_frame)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
+            read_time = time.perf_counter()
+            self.stage_times['capture'] = read_time - frame_start
+            if self.last_read_time is not None and self.capture_fps > 0:
+                self.dropped_frames = max(0, int(round((read_time - self.last_read_time) * self.capture_fps)) - 1)
+            self.last_read_time = read_time
+            output_frame = self.process_frame(frame)
+            present_start = time.perf_counter()
+            keep_running = self.present(output_frame)
+            self.stage_times['present'] = time.perf_counter() - present_start
+            self.frame_latency = time.perf_counter() - frame_start
+            for callback in self.frame_callbacks:
+                callback(self, output_frame)
+            frames += 1
+            if not keep_running:
                 break
-            elif key == ord(' '):
-                self.mode = (self.mode + 1) % len(self.modes)
-                if hasattr(self.settings_ui, 'mode_var') and hasattr(self.settings_ui, 'mode_menu'):
-                    try:
-                        self.settings_ui.root.after(0, lambda: (
-                            self.settings_ui.mode_var.set(self.modes[self.mode]),
-                            setattr(self.settings_ui.mode_menu, 'values', self.modes)
-                        ))
-                    except:
-                        pass
-        self.cleanup()
     
     def cleanup(self):
         self.stop_audio_stream()
-        self.settings_ui.close()
+        self.replay_buffer.close()
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.settings_ui is not None:
+            self.settings_ui.close()
         self.cap.release()
-        cv2.destroyAllWindows()
+        if self.presenter is not None:
+            self.presenter.close()
+        if self.face_mesh_thread is not None:
+            self.face_mesh_thread.join()
+            self.swap_face_mesh()
         self.face_mesh.close()
-        self.hands.close()
+        if self.hands is not None:
+            self.hands.close()
 
 if __name__ == "__main__":
-    tracker = FaceTracker()
+    parser = argparse.ArgumentParser(description="Live wireframe face and hand tracking")
+    parser.add_argument('--source', default='0',
+                        help="Camera index, video file, image folder or glob, or synthetic[:WIDTHxHEIGHT[@FPS]]")
+    parser.add_argument('--width', type=int, default=1280, help="Camera resolution to request")
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--fps', type=float, default=60, help="Camera frame rate to request")
+    parser.add_argument('--fourcc', choices=['MJPG', 'YUYV'], help="Camera pixel format (default tries MJPG, then YUYV)")
+    parser.add_argument('--startup-report', action='store_true', help="Print the time spent in each startup phase")
+    parser.add_argument('--replay-seconds', type=float, default=30.0, help="Seconds of history kept for instant replay")
+    parser.add_argument('--replay-budget-mb', type=float, default=64, help="Memory budget of the replay buffer")
+    parser.add_argument('--telemetry', nargs='?', const=os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "telemetry.jsonl"),
+                        help="Append one record per frame to this log (default logs/telemetry.jsonl)")
+    parser.add_argument('--telemetry-max-mb', type=float, default=10, help="Rotate the telemetry log at this size")
+    parser.add_argument('--display-fps', type=float, default=60.0, help="Rate the window is refreshed at, independent of tracking")
+    args = parser.parse_args()
+    capture_options = {'width': args.width, 'height': args.height, 'fps': args.fps, 'fourcc': args.fourcc}
+    tracker = FaceTracker(startup_report=args.startup_report, source=args.source,
+                          capture_options=capture_options, replay_seconds=args.replay_seconds,
+                          replay_budget_mb=args.replay_budget_mb, display_fps=args.display_fps)
+    if args.telemetry:
+        tracker.telemetry = TelemetryWriter(args.telemetry, max_bytes=int(args.telemetry_max_mb * 1024 * 1024))
+        tracker.frame_callbacks.append(tracker.telemetry.on_frame)
     tracker.run()
@@ -0,0 +1,215 @@
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from LiveVisualTracking import FaceTracker
+from settings_ui import SettingsController, load_autosave_settings
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+REFERENCE_CONFIG = {
+    'performance_mode': False,
+    'detection_confidence': 0.5,
+    'hand_model_complexity': 1,
+    'iris_refinement': True,
+    'face_inference_height': 0,
+    'hand_inference_height': 0,
+    'lod_enabled': False,
+    'incremental_render': False
+}
+
+GRID = {
+    'detection_confidence': [0.5, 0.3],
+    'hand_model_complexity': [1, 0],
+    'iris_refinement': [True, False],
+    'face_inference_height': [0, 480, 360],
+    'hand_inference_height': [0, 360],
+    'lod_enabled': [False, True]
+}
+
+
+def build_configs(grid):
+    keys = list(grid.keys())
+    configs = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        config = dict(REFERENCE_CONFIG)
+        config.update(zip(keys, values))
+        if config != REFERENCE_CONFIG:
+            configs.append(config)
+    return configs
+
+
+def load_base_settings(path):
+    if path is None:
+        return SettingsController(load_autosave_settings()).get_settings()
+    with open(path, "r") as f:
+        return SettingsController(json.load(f)).get_settings()
+
+
+def measure(video, base_settings, config, frames, warmup):
+    tracker = FaceTracker(source=video, headless=True)
+    settings = dict(base_settings)
+    settings.update(config)
+    tracker.apply_settings(settings)
+    latencies = []
+    tracked = []
+    timing = {'seen': 0, 'start': None, 'end': None}
+
+    def on_frame(tracker, output_frame):
+        timing['seen'] += 1
+        if timing['seen'] == warmup:
+            timing['start'] = time.perf_counter()
+        if timing['seen'] <= warmup:
+            return
+        timing['end'] = time.perf_counter()
+        timing['shape'] = output_frame.shape[:2]
+        latencies.append(tracker.frame_latency)
+        face_points, hand_points = tracker.tracked_points
+        face = face_points[0][:468].copy() if face_points else None
+        labels = tracker.hand_labels + [None] * len(hand_points or [])
+        hands = [(label, hand.copy()) for label, hand in zip(labels, hand_points or [])]
+        tracked.append((face, hands, tracker.pipeline['face_points']))
+
+    tracker.frame_callbacks.append(on_frame)
+    if warmup == 0:
+        timing['start'] = time.perf_counter()
+    tracker.run(max_frames=frames + warmup)
+    if not latencies:
+        return None, None
+    latencies_ms = np.array(latencies) * 1000
+    elapsed = timing['end'] - timing['start']
+    result = {
+        'config': config,
+        'frames': len(latencies),
+        'fps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'mean': float(latencies_ms.mean()),
+            'p50': float(np.percentile(latencies_ms, 50)),
+            'p95': float(np.percentile(latencies_ms, 95)),
+            'p99': float(np.percentile(latencies_ms, 99))
+        }
+    }
+    return result, (tracked, timing['shape'])
+
+
+def match_hands(ref_hands, test_hands):
+    pairs = []
+    unmatched = list(range(len(test_hands)))
+    for ref_label, ref in ref_hands:
+        same_label = [index for index in unmatched if ref_label is not None and test_hands[index][0] == ref_label]
+        candidates = same_label if len(same_label) == 1 else unmatched
+        if not candidates:
+            break
+        best = min(candidates, key=lambda index: np.linalg.norm(test_hands[index][1][0] - ref[0]))
+        unmatched.remove(best)
+        pairs.append((ref, test_hands[best][1]))
+    return pairs
+
+
+def agreement(reference, candidate):
+    reference_frames, frame_shape = reference
+    candidate_frames, _ = candidate
+    scale = np.array([frame_shape[1], frame_shape[0]], dtype=np.float32)
+    face_agree = hand_agree = 0
+    face_errors = []
+    hand_errors = []
+    for (ref_face, ref_hands, subset), (face, hands, _) in zip(reference_frames, candidate_frames):
+        if (ref_face is None) == (face is None):
+            face_agree += 1
+        if ref_face is not None and face is not None:
+            rows = slice(None) if subset is None else [index for index in subset if index < 468]
+            face_errors.append(np.linalg.norm((ref_face[rows, :2] - face[rows, :2]) * scale, axis=1).mean())
+        if len(ref_hands) == len(hands):
+            hand_agree += 1
+            for ref_hand, hand in match_hands(ref_hands, hands):
+                hand_errors.append(np.linalg.norm((ref_hand[:, :2] - hand[:, :2]) * scale, axis=1).mean())
+    frames = min(len(reference_frames), len(candidate_frames))
+    return {
+        'face_agreement': face_agree / frames,
+        'hand_agreement': hand_agree / frames,
+        'face_error_px': float(np.mean(face_errors)) if face_errors else None,
+        'hand_error_px': float(np.mean(hand_errors)) if hand_errors else None
+    }
+
+
+def quality_key(result):
+    quality = result['quality']
+    detection = (quality['face_agreement'] + quality['hand_agreement']) / 2
+    error = (quality['face_error_px'] or 0.0) + (quality['hand_error_px'] or 0.0)
+    return (-round(detection, 3), round(error, 1), -result['fps'])
+
+
+def print_results(results, keys, target_fps):
+    header = ' '.join(f"{key[:12]:>12}" for key in keys)
+    print(f"{header} {'fps':>7} {'p95 ms':>7} {'face ok':>8} {'hand ok':>8} {'face px':>8} {'hand px':>8}")
+    for result in results:
+        values = ' '.join(f"{str(result['config'].get(key)):>12}" for key in keys)
+        quality = result['quality']
+        face_error = f"{quality['face_error_px']:8.2f}" if quality['face_error_px'] is not None else f"{'n/a':>8}"
+        hand_error = f"{quality['hand_error_px']:8.2f}" if quality['hand_error_px'] is not None else f"{'n/a':>8}"
+        marker = '' if result['fps'] >= target_fps else '  below target'
+        print(f"{values} {result['fps']:7.1f} {result['latency_ms']['p95']:7.2f} {quality['face_agreement']:8.1%} "
+              f"{quality['hand_agreement']:8.1%} {face_error} {hand_error}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the most accurate pipeline settings that reach a target FPS")
+    parser.add_argument('video', help="Reference clip recorded on this machine's camera")
+    parser.add_argument('--target-fps', type=float, default=30.0)
+    parser.add_argument('--frames', type=int, default=150, help="Measured frames per configuration")
+    parser.add_argument('--warmup', type=int, default=15, help="Frames run before measuring")
+    parser.add_argument('--grid', help="JSON file replacing the default grid of settings")
+    parser.add_argument('--base', help="Settings file to tune (default is the autosave)")
+    parser.add_argument('--name', default="autotune", help="Save name written to the saves folder")
+    parser.add_argument('--report', help="Write every measured configuration to this JSON file")
+    args = parser.parse_args()
+    grid = GRID
+    if args.grid:
+        with open(args.grid, "r") as f:
+            grid = json.load(f)
+    base_settings = load_base_settings(args.base)
+    reference, reference_points = measure(args.video, base_settings, REFERENCE_CONFIG, args.frames, args.warmup)
+    if reference is None:
+        print(f"Clip too short: {args.video} needs more than {args.warmup} frames")
+        return 1
+    reference['quality'] = agreement(reference_points, reference_points)
+    results = [reference]
+    configs = build_configs(grid)
+    for index, config in enumerate(configs):
+        print(f"Measuring configuration {index + 1}/{len(configs)}", end='\r')
+        result, points = measure(args.video, base_settings, config, args.frames, args.warmup)
+        if result is None:
+            continue
+        result['quality'] = agreement(reference_points, points)
+        results.append(result)
+    print()
+    results.sort(key=quality_key)
+    print_results(results, list(grid.keys()), args.target_fps)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({'video': os.path.abspath(args.video), 'target_fps': args.target_fps, 'results': results}, f, indent=2)
+    eligible = [result for result in results if result['fps'] >= args.target_fps]
+    if not eligible:
+        fastest = max(results, key=lambda result: result['fps'])
+        print(f"No configuration reached {args.target_fps:.1f} FPS (fastest was {fastest['fps']:.1f} FPS)")
+        return 1
+    best = eligible[0]
+    settings = dict(base_settings)
+    settings.update(best['config'])
+    saves_dir = os.path.join(SCRIPT_DIR, "saves")
+    os.makedirs(saves_dir, exist_ok=True)
+    save_path = os.path.join(saves_dir, f"{args.name}.json")
+    with open(save_path, "w") as f:
+        json.dump(settings, f, indent=2)
+    print(f"Best configuration at {best['fps']:.1f} FPS: {best['config']}")
+    print(f"Saved as '{args.name}' ({save_path}), load it from the Saves tab")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import DotRasterizer
+
+
+def draw_with_circles(frame, pixels, radius, color, line_type):
+    for x, y in pixels.tolist():
+        cv2.circle(frame, (x, y), radius, color, -1, line_type)
+
+
+def time_call(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def run_benchmark(points, radii, repeats, width, height, seed, inset):
+    rng = np.random.default_rng(seed)
+    pixels = np.column_stack([
+        rng.integers(inset, width - inset, points),
+        rng.integers(inset, height - inset, points)
+    ]).astype(np.int32)
+    color = (255, 255, 0)
+    rasterizer = DotRasterizer()
+    forced = DotRasterizer(max_stamp_cost=np.inf)
+    print(f"{points} dots on {width}x{height}, {repeats} repeats")
+    print(f"{'radius':>6} {'smooth':>7} {'circle ms':>10} {'stamp ms':>9} {'speedup':>8} {'max diff':>9} {'diff px':>8} {'default path':>13}")
+    for radius in radii:
+        for antialiased in (False, True):
+            line_type = cv2.LINE_AA if antialiased else cv2.LINE_8
+            reference = np.zeros((height, width, 3), dtype=np.uint8)
+            stamped = np.zeros((height, width, 3), dtype=np.uint8)
+            draw_with_circles(reference, pixels, radius, color, line_type)
+            forced.stamp(stamped, pixels, radius, color, antialiased)
+            diff = np.abs(reference.astype(np.int16) - stamped.astype(np.int16))
+            circle_ms = time_call(lambda: draw_with_circles(reference, pixels, radius, color, line_type), repeats)
+            stamp_ms = time_call(lambda: forced.stamp(stamped, pixels, radius, color, antialiased), repeats)
+            path = 'stamp' if rasterizer.uses_stamping(radius, color, antialiased, width) else 'circle loop'
+            print(f"{radius:>6} {str(antialiased):>7} {circle_ms:10.3f} {stamp_ms:9.3f} {circle_ms / stamp_ms:7.1f}x "
+                  f"{int(diff.max()):9d} {int(diff.any(axis=2).sum()):8d} {path:>13}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-landmark cv2.circle calls with sprite stamping")
+    parser.add_argument('--points', type=int, default=520, help="Dots per frame (face plus two hands is about 520)")
+    parser.add_argument('--radii', type=int, nargs='+', default=[1, 2, 4, 8], help="Dot radii to test")
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--inset', type=int, default=16,
+                        help="Keep dot centres this far from the frame edges (negative values test clipping)")
+    args = parser.parse_args()
+    run_benchmark(args.points, args.radii, args.repeats, args.width, args.height, args.seed, args.inset)
@@ -0,0 +1,90 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import GestureEngine
+
+FINGER_BASES = [(-0.35, -0.15), (-0.2, -0.9), (0.0, -0.95), (0.2, -0.9), (0.38, -0.8)]
+FINGER_SEGMENTS = [(0.35, 0.3, 0.25), (0.4, 0.25, 0.2), (0.45, 0.28, 0.2), (0.42, 0.26, 0.2), (0.32, 0.2, 0.18)]
+FINGER_ANGLES = [-2.4, -1.75, -1.57, -1.4, -1.2]
+
+POSES = {
+    'open_palm': [0.0, 0.0, 0.0, 0.0, 0.0],
+    'fist': [0.5, 1.0, 1.0, 1.0, 1.0],
+    'point': [0.5, 0.0, 1.0, 1.0, 1.0],
+    'victory': [0.5, 0.0, 0.0, 1.0, 1.0],
+    'pinch': [0.0, 0.0, 0.0, 0.0, 0.0]
+}
+
+
+def synthetic_hand(curls, rng, jitter, pinch=False):
+    points = np.zeros((21, 3))
+    for finger, curl in enumerate(curls):
+        base = np.array(FINGER_BASES[finger])
+        direction = FINGER_ANGLES[finger]
+        chain = [np.array([base[0], base[1], 0.0])]
+        bend = 1.6 if finger else 0.9
+        for length in FINGER_SEGMENTS[finger]:
+            direction += curl * bend
+            step = np.array([np.cos(direction), np.sin(direction), -0.2 * curl]) * length
+            chain.append(chain[-1] + step)
+        points[1 + finger * 4:5 + finger * 4] = chain
+    if pinch:
+        points[4] = points[8] + (0.03, 0.02, 0.0)
+    points += rng.normal(0, jitter, points.shape)
+    angle = rng.uniform(-0.4, 0.4)
+    rotation = np.array([(np.cos(angle), -np.sin(angle)), (np.sin(angle), np.cos(angle))])
+    points[:, :2] = points[:, :2] @ rotation.T
+    scale = rng.uniform(0.08, 0.2)
+    center = rng.uniform(0.3, 0.7, 2)
+    normalized = np.empty((21, 3), dtype=np.float32)
+    normalized[:, 0] = center[0] + points[:, 0] * scale * 0.5625
+    normalized[:, 1] = center[1] + points[:, 1] * scale
+    normalized[:, 2] = points[:, 2] * scale * 0.5625
+    return normalized
+
+
+def build_frames(frames, hands_per_frame, jitter, seed):
+    rng = np.random.default_rng(seed)
+    names = list(POSES)
+    sequence = []
+    labels = []
+    for _ in range(frames):
+        chosen = rng.choice(names, hands_per_frame)
+        sequence.append([synthetic_hand(POSES[name], rng, jitter, pinch=name == 'pinch') for name in chosen])
+        labels.append(list(chosen))
+    return sequence, labels
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time gesture feature extraction and classification per frame")
+    parser.add_argument('--frames', type=int, default=5000)
+    parser.add_argument('--hands', type=int, default=2, help="Hands per frame")
+    parser.add_argument('--jitter', type=float, default=0.02, help="Landmark noise relative to hand size")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    frame_shape = (720, 1280, 3)
+    sequence, labels = build_frames(args.frames, args.hands, args.jitter, args.seed)
+    engine = GestureEngine()
+    times = []
+    correct = 0
+    confusion = {}
+    for hands, expected in zip(sequence, labels):
+        start = time.perf_counter()
+        engine.update(hands, frame_shape)
+        times.append(time.perf_counter() - start)
+        for name, predicted in zip(expected, engine.current):
+            correct += name == predicted
+            confusion.setdefault(name, {}).setdefault(predicted, 0)
+            confusion[name][predicted] += 1
+    times = np.array(times) * 1e6
+    print(f"{args.frames} frames, {args.hands} hands per frame")
+    print(f"update: mean {times.mean():.1f} us, p95 {np.percentile(times, 95):.1f} us, max {times.max():.1f} us")
+    print(f"accuracy: {correct / (args.frames * args.hands):.1%}")
+    for name, predictions in confusion.items():
+        print(f"  {name:<10} " + ", ".join(f"{predicted}: {count}" for predicted, count in sorted(
+            predictions.items(), key=lambda item: -item[1])))
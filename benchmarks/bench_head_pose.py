@@ -0,0 +1,77 @@
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import HeadPoseEstimator
+
+
+def rotation_vector(yaw, pitch, roll):
+    yaw, pitch, roll = np.radians([yaw, pitch, roll])
+    rx = np.array([(1, 0, 0), (0, np.cos(pitch), -np.sin(pitch)), (0, np.sin(pitch), np.cos(pitch))])
+    ry = np.array([(np.cos(yaw), 0, np.sin(yaw)), (0, 1, 0), (-np.sin(yaw), 0, np.cos(yaw))])
+    rz = np.array([(np.cos(roll), -np.sin(roll), 0), (np.sin(roll), np.cos(roll), 0), (0, 0, 1)])
+    return cv2.Rodrigues(rz @ ry @ rx)[0]
+
+
+def synthetic_sequence(estimator, frames, frame_shape, noise, seed):
+    rng = np.random.default_rng(seed)
+    steps = np.arange(frames)
+    angles = np.column_stack([
+        35 * np.sin(steps / 45.0),
+        20 * np.sin(steps / 70.0 + 1.0),
+        15 * np.sin(steps / 90.0 + 2.0)
+    ])
+    translations = np.column_stack([
+        60 * np.sin(steps / 120.0),
+        30 * np.cos(steps / 150.0),
+        2500 + 400 * np.sin(steps / 200.0)
+    ])
+    camera_matrix = estimator.camera_matrix(frame_shape)
+    sequence = []
+    for (yaw, pitch, roll), translation in zip(angles, translations):
+        pixels = cv2.projectPoints(estimator.model_points, rotation_vector(yaw, pitch, roll),
+                                   translation.reshape(3, 1), camera_matrix, estimator.dist_coeffs)[0].reshape(-1, 2)
+        pixels += rng.normal(0, noise, pixels.shape)
+        points = np.zeros((478, 3), dtype=np.float32)
+        points[estimator.landmarks, :2] = pixels / (frame_shape[1], frame_shape[0])
+        sequence.append(points)
+    return sequence, angles
+
+
+def run_sequence(estimator, sequence, angles, frame_shape):
+    estimator.reset()
+    times = []
+    errors = []
+    for points, expected in zip(sequence, angles):
+        start = time.perf_counter()
+        pose = estimator.estimate(points, frame_shape)
+        times.append(time.perf_counter() - start)
+        if pose is not None:
+            errors.append(np.abs(np.array([pose['yaw'], pose['pitch'], pose['roll']]) - expected).max())
+    return np.array(times) * 1e6, np.array(errors)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time head-pose estimation over synthetic landmark sequences")
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--noise', type=float, default=1.0, help="Landmark jitter in pixels")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    frame_shape = (args.height, args.width, 3)
+    estimator = HeadPoseEstimator()
+    sequence, angles = synthetic_sequence(estimator, args.frames, frame_shape, args.noise, args.seed)
+    print(f"{args.frames} frames at {args.width}x{args.height}, {args.noise} px landmark noise")
+    print(f"{'start':>16} {'mean us':>8} {'p95 us':>8} {'max us':>8} {'mean err deg':>13} {'max err deg':>12} {'solved':>7}")
+    for use_previous in (True, False):
+        estimator.use_previous = use_previous
+        times, errors = run_sequence(estimator, sequence, angles, frame_shape)
+        label = 'previous pose' if use_previous else 'from scratch'
+        print(f"{label:>16} {times.mean():8.1f} {np.percentile(times, 95):8.1f} {times.max():8.1f} "
+              f"{errors.mean():13.2f} {errors.max():12.2f} {len(errors) / len(times):7.1%}")
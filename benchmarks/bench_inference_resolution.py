@@ -0,0 +1,127 @@
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import InferenceResizer
+
+
+def landmarks_to_pixels(landmark_list, frame_shape):
+    return np.array([(lm.x * frame_shape[1], lm.y * frame_shape[0]) for lm in landmark_list.landmark])
+
+
+def hand_entries(hand_results, frame_shape):
+    landmarks = hand_results.multi_hand_landmarks or []
+    handedness = hand_results.multi_handedness or []
+    labels = [entry.classification[0].label for entry in handedness]
+    labels += [None] * (len(landmarks) - len(labels))
+    return [(label, landmarks_to_pixels(hand, frame_shape)) for label, hand in zip(labels, landmarks)]
+
+
+def match_hands(ref_hands, test_hands):
+    pairs = []
+    unmatched = list(range(len(test_hands)))
+    for ref_label, ref in ref_hands:
+        same_label = [index for index in unmatched if ref_label is not None and test_hands[index][0] == ref_label]
+        candidates = same_label if len(same_label) == 1 else unmatched
+        if not candidates:
+            break
+        best = min(candidates, key=lambda index: np.linalg.norm(test_hands[index][1][0] - ref[0]))
+        unmatched.remove(best)
+        pairs.append((ref, test_hands[best][1]))
+    return pairs
+
+
+def create_graphs():
+    face_mesh = mp.solutions.face_mesh.FaceMesh(
+        max_num_faces=1,
+        refine_landmarks=True,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=2,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    return face_mesh, hands
+
+
+def run_benchmark(video_path, heights, max_frames):
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        print(f"Could not open video: {video_path}")
+        return 1
+    configs = [0] + heights
+    graphs = {height: create_graphs() for height in configs}
+    resizers = {height: InferenceResizer() for height in configs}
+    stats = {height: {'times': [], 'face_errors': [], 'hand_errors': [], 'face_agree': 0, 'hand_agree': 0}
+             for height in configs}
+    frames = 0
+    frame_shape = None
+    while max_frames <= 0 or frames < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame = cv2.flip(frame, 1)
+        frame_shape = frame.shape
+        outputs = {}
+        for height in configs:
+            face_mesh, hands = graphs[height]
+            resizer = resizers[height]
+            start = time.perf_counter()
+            resizer.new_frame()
+            face_results = face_mesh.process(resizer.get(frame, height))
+            hand_results = hands.process(resizer.get(frame, height))
+            stats[height]['times'].append(time.perf_counter() - start)
+            outputs[height] = (face_results, hand_results)
+        ref_face, ref_hands = outputs[0]
+        for height in configs:
+            face_results, hand_results = outputs[height]
+            entry = stats[height]
+            if bool(face_results.multi_face_landmarks) == bool(ref_face.multi_face_landmarks):
+                entry['face_agree'] += 1
+            if face_results.multi_face_landmarks and ref_face.multi_face_landmarks:
+                ref = landmarks_to_pixels(ref_face.multi_face_landmarks[0], frame.shape)
+                test = landmarks_to_pixels(face_results.multi_face_landmarks[0], frame.shape)
+                entry['face_errors'].append(np.linalg.norm(ref - test, axis=1).mean())
+            reference = hand_entries(ref_hands, frame.shape)
+            tested = hand_entries(hand_results, frame.shape)
+            if len(reference) == len(tested):
+                entry['hand_agree'] += 1
+            for ref, test in match_hands(reference, tested):
+                entry['hand_errors'].append(np.linalg.norm(ref - test, axis=1).mean())
+        frames += 1
+    cap.release()
+    if frames == 0:
+        print("No frames decoded")
+        return 1
+    print(f"{frames} frames at {frame_shape[1]}x{frame_shape[0]}")
+    print(f"{'inference':>10} {'mean ms':>9} {'p95 ms':>8} {'face err px':>12} {'hand err px':>12} {'face agree':>11} {'hand agree':>11}")
+    for height in configs:
+        entry = stats[height]
+        times = np.array(entry['times']) * 1000
+        face_error = np.mean(entry['face_errors']) if entry['face_errors'] else float('nan')
+        hand_error = np.mean(entry['hand_errors']) if entry['hand_errors'] else float('nan')
+        label = 'full' if height == 0 else f"{height}p"
+        print(f"{label:>10} {times.mean():9.2f} {np.percentile(times, 95):8.2f} {face_error:12.2f} {hand_error:12.2f} "
+              f"{entry['face_agree'] / frames:11.1%} {entry['hand_agree'] / frames:11.1%}")
+    for face_mesh, hands in graphs.values():
+        face_mesh.close()
+        hands.close()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare inference cost and landmark accuracy at reduced resolutions")
+    parser.add_argument('video', help="Recorded clip to run inference on")
+    parser.add_argument('--heights', type=int, nargs='+', default=[480, 360, 240], help="Inference heights to test")
+    parser.add_argument('--frames', type=int, default=300, help="Maximum frames to process (0 for the whole clip)")
+    args = parser.parse_args()
+    sys.exit(run_benchmark(args.video, args.heights, args.frames))
@@ -0,0 +1,211 @@
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+from settings_ui import ADDITIONAL_MODES, BASE_MODES
+
+BASELINE_CONFIG = {
+    'mode': 0,
+    'performance_mode': False,
+    'show_hands': True,
+    'show_camera': False,
+    'expression_triggers': False,
+    'audio_visualizer': False,
+    'gesture_controls': False,
+    'display': False
+}
+
+SWEEP = {
+    'mode': list(range(len(BASE_MODES) + len(ADDITIONAL_MODES))),
+    'performance_mode': [False, True],
+    'show_hands': [True, False],
+    'show_camera': [False, True],
+    'expression_triggers': [False, True],
+    'audio_visualizer': [False, True],
+    'gesture_controls': [False, True],
+    'display': [False, True]
+}
+
+
+def config_key(config):
+    return json.dumps(config, sort_keys=True)
+
+
+def build_configs(full):
+    if full:
+        keys = list(SWEEP.keys())
+        return [dict(zip(keys, values)) for values in itertools.product(*(SWEEP[key] for key in keys))]
+    configs = [dict(BASELINE_CONFIG)]
+    for key, values in SWEEP.items():
+        for value in values:
+            if value != BASELINE_CONFIG[key]:
+                config = dict(BASELINE_CONFIG)
+                config[key] = value
+                configs.append(config)
+    return configs
+
+
+def apply_config(tracker, config):
+    tracker.experiments['additional_modes'] = config['mode'] >= len(BASE_MODES)
+    tracker.experiments['expression_triggers'] = config['expression_triggers']
+    tracker.experiments['audio_visualizer'] = config['audio_visualizer']
+    tracker.experiments['gesture_controls'] = config['gesture_controls']
+    tracker.update_modes()
+    tracker.mode = config['mode']
+    tracker.show_hands = config['show_hands']
+    tracker.show_camera = config['show_camera']
+    if tracker.performance_mode != config['performance_mode']:
+        tracker.performance_mode = config['performance_mode']
+        tracker.update_performance_settings()
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measure_config(video, config, frames, warmup):
+    from LiveVisualTracking import FaceTracker
+    tracker = FaceTracker(source=video, headless=True)
+    apply_config(tracker, config)
+    if config['display']:
+        tracker.create_window()
+    latencies = []
+    stages = {}
+    timing = {'start': None, 'end': None, 'seen': 0}
+
+    def on_frame(tracker, output_frame):
+        timing['seen'] += 1
+        if timing['seen'] == warmup:
+            timing['start'] = time.perf_counter()
+        elif timing['seen'] > warmup:
+            latencies.append(tracker.frame_latency)
+            for stage, seconds in tracker.stage_times.items():
+                stages.setdefault(stage, []).append(seconds)
+            timing['end'] = time.perf_counter()
+
+    tracker.frame_callbacks.append(on_frame)
+    if warmup == 0:
+        timing['start'] = time.perf_counter()
+    tracker.run(max_frames=frames + warmup)
+    if tracker.presenter is not None and tracker.presenter.error is not None:
+        return {'config': config, 'error': f"display: {tracker.presenter.error}".splitlines()[0]}
+    if not latencies:
+        return {'config': config, 'error': 'clip too short for warmup'}
+    latencies_ms = np.array(latencies) * 1000
+    elapsed = timing['end'] - timing['start']
+    return {
+        'config': config,
+        'frames': len(latencies),
+        'fps': len(latencies) / elapsed if elapsed > 0 else None,
+        'latency_ms': {
+            'mean': float(latencies_ms.mean()),
+            'p50': float(np.percentile(latencies_ms, 50)),
+            'p90': float(np.percentile(latencies_ms, 90)),
+            'p95': float(np.percentile(latencies_ms, 95)),
+            'p99': float(np.percentile(latencies_ms, 99)),
+            'max': float(latencies_ms.max())
+        },
+        'stages_ms': {stage: float(np.mean(values) * 1000) for stage, values in stages.items()},
+        'display': tracker.presenter.stats() if tracker.presenter is not None else None,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def run_isolated(video, config, frames, warmup):
+    command = [sys.executable, os.path.abspath(__file__), video, '--single', json.dumps(config),
+               '--frames', str(frames), '--warmup', str(warmup)]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    return {'config': config, 'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'no output'}
+
+
+def compare_to_baseline(results, baseline_path, tolerance):
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)
+    reference = {config_key(dict(BASELINE_CONFIG, **entry['config'])): entry
+                 for entry in baseline.get('results', []) if 'error' not in entry}
+    regressions = []
+    for entry in results:
+        previous = reference.get(config_key(entry['config']))
+        if previous is None or 'error' in entry or entry['fps'] is None or previous['fps'] is None:
+            continue
+        if entry['fps'] < previous['fps'] * (1 - tolerance):
+            regressions.append((entry['config'], 'fps', previous['fps'], entry['fps']))
+        if entry['latency_ms']['p95'] > previous['latency_ms']['p95'] * (1 + tolerance):
+            regressions.append((entry['config'], 'p95 ms', previous['latency_ms']['p95'], entry['latency_ms']['p95']))
+    return regressions
+
+
+def print_results(results):
+    print(f"{'config':<72} {'fps':>7} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'out ms':>7} {'rss MB':>7}")
+    for entry in results:
+        label = ' '.join(f"{key}={value}" for key, value in entry['config'].items()
+                         if value != BASELINE_CONFIG[key]) or 'baseline'
+        if 'error' in entry:
+            print(f"{label:<72} error: {entry['error']}")
+            continue
+        rss = f"{entry['peak_rss_mb']:7.0f}" if entry['peak_rss_mb'] is not None else f"{'n/a':>7}"
+        latency = entry['latency_ms']
+        present = entry['stages_ms'].get('present', 0.0)
+        print(f"{label:<72} {entry['fps']:7.1f} {latency['p50']:7.2f} {latency['p95']:7.2f} {latency['p99']:7.2f} "
+              f"{present:7.2f} {rss}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the full tracking pipeline headless over a recorded clip")
+    parser.add_argument('video', help="Recorded clip, image folder or synthetic[:WIDTHxHEIGHT[@FPS]] used as the capture source")
+    parser.add_argument('--frames', type=int, default=300, help="Measured frames per configuration")
+    parser.add_argument('--warmup', type=int, default=30, help="Frames run before measuring")
+    parser.add_argument('--full', action='store_true', help="Sweep the full cartesian product instead of one setting at a time")
+    parser.add_argument('--output', help="Write the JSON report to this path")
+    parser.add_argument('--baseline', help="Compare against a previously written report")
+    parser.add_argument('--tolerance', type=float, default=0.1, help="Allowed relative slowdown before flagging a regression")
+    parser.add_argument('--single', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.single:
+        print(json.dumps(measure_config(args.video, json.loads(args.single), args.frames, args.warmup)))
+        return 0
+    results = []
+    for config in build_configs(args.full):
+        results.append(run_isolated(args.video, config, args.frames, args.warmup))
+    print_results(results)
+    report = {
+        'video': os.path.abspath(args.video),
+        'frames': args.frames,
+        'warmup': args.warmup,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.tolerance)
+        for config, metric, before, after in regressions:
+            print(f"REGRESSION {metric}: {before:.2f} -> {after:.2f} for {config}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
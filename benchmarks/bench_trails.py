@@ -0,0 +1,57 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import TrailHistory
+
+
+def synthetic_sequence(frames, width, height, seed):
+    rng = np.random.default_rng(seed)
+    face_offsets = rng.normal(0, 0.08, (478, 2))
+    hand_offsets = rng.normal(0, 0.04, (2, 21, 2))
+    steps = np.arange(frames)[:, np.newaxis]
+    face_centers = np.column_stack([0.5 + 0.2 * np.sin(steps[:, 0] / 40.0), 0.5 + 0.1 * np.cos(steps[:, 0] / 55.0)])
+    sequence = []
+    for step, center in zip(steps[:, 0], face_centers):
+        face = (center + face_offsets) * (width, height)
+        hands = [(center + (side * 0.3, 0.2 + 0.1 * np.sin(step / 25.0 + side)) + offsets) * (width, height)
+                 for side, offsets in zip((-1, 1), hand_offsets)]
+        sequence.append((face.astype(np.int32), [hand.astype(np.int32) for hand in hands]))
+    return sequence
+
+
+def run_length(length, sequence, frame_shape, thickness):
+    history = TrailHistory(length)
+    output_frame = np.zeros(frame_shape, dtype=np.uint8)
+    times = []
+    for face_pixels, hand_pixels in sequence:
+        output_frame[:] = 0
+        start = time.perf_counter()
+        history.push(face_pixels, hand_pixels)
+        history.render(output_frame, (0, 255, 0), thickness, frame_shape[1] * 0.2)
+        times.append(time.perf_counter() - start)
+    times = np.array(times[length:]) * 1000
+    return times, history.positions.nbytes + history.valid.nbytes + history.boxes.nbytes + history.intensity.nbytes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time motion-trail rendering for several trail lengths")
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--lengths', default="4,8,16,32,64", help="Comma separated trail lengths in frames")
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--thickness', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    frame_shape = (args.height, args.width, 3)
+    sequence = synthetic_sequence(args.frames, args.width, args.height, args.seed)
+    print(f"{args.frames} frames at {args.width}x{args.height}, 520 tracked points")
+    print(f"{'length':>7} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'history KB':>11}")
+    for length in (int(value) for value in args.lengths.split(',')):
+        times, history_bytes = run_length(length, sequence, frame_shape, args.thickness)
+        print(f"{length:>7} {times.mean():8.2f} {np.percentile(times, 95):8.2f} {times.max():8.2f} "
+              f"{history_bytes / 1024:11.1f}")
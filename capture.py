@@ -0,0 +1,317 @@
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+DEVICE_FORMATS = ['MJPG', 'YUYV']
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+
+def fourcc_name(value):
+    value = int(value)
+    name = ''.join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+    return name if name.isprintable() and name.strip() else str(value)
+
+
+def parse_source(value):
+    return int(value) if isinstance(value, str) and value.isdigit() else value
+
+
+class DeviceSource:
+    live = True
+
+    def __init__(self, index, width=1280, height=720, fps=60, fourcc=None, rate_frames=10):
+        self.index = index
+        self.rate_frames = rate_frames
+        self.requested = {'width': width, 'height': height, 'fps': float(fps), 'fourcc': fourcc or 'auto'}
+        self.attempts = []
+        self.achieved = None
+        self.pending = None
+        self.cap = cv2.VideoCapture(index)
+        if self.cap.isOpened():
+            self.negotiate([fourcc] if fourcc else DEVICE_FORMATS)
+        self.fps = self.achieved['fps'] if self.achieved else 0.0
+
+    def configure(self, fourcc):
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.requested['width'])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.requested['height'])
+        self.cap.set(cv2.CAP_PROP_FPS, self.requested['fps'])
+        ret, frame = self.cap.read()
+        reported_fps = float(self.cap.get(cv2.CAP_PROP_FPS))
+        if ret:
+            height, width = frame.shape[:2]
+            fps = self.measure_fps()
+            if fps is None:
+                fps = reported_fps
+            else:
+                ok, latest = self.cap.retrieve()
+                if ok:
+                    frame = latest
+        else:
+            width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = reported_fps
+        achieved = {
+            'width': width,
+            'height': height,
+            'fps': fps,
+            'reported_fps': reported_fps,
+            'fourcc': fourcc_name(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            'requested_fourcc': fourcc,
+            'delivering': ret
+        }
+        return achieved, frame if ret else None
+
+    def measure_fps(self):
+        times = [time.perf_counter()]
+        for _ in range(self.rate_frames):
+            if not self.cap.grab():
+                return None
+            times.append(time.perf_counter())
+        interval = float(np.median(np.diff(times)))
+        return 1.0 / interval if interval > 0 else None
+
+    def meets_request(self, achieved):
+        return (achieved['delivering'] and achieved['width'] == self.requested['width'] and
+                achieved['height'] == self.requested['height'] and
+                achieved['fps'] >= self.requested['fps'] * 0.95)
+
+    def score(self, achieved):
+        size_matches = achieved['width'] == self.requested['width'] and achieved['height'] == self.requested['height']
+        return (achieved['delivering'], size_matches, achieved['fps'], achieved['width'] * achieved['height'])
+
+    def negotiate(self, formats):
+        best = None
+        for fourcc in formats:
+            achieved, frame = self.configure(fourcc)
+            self.attempts.append(achieved)
+            if self.meets_request(achieved):
+                best = (achieved, frame)
+                break
+            if best is None or self.score(achieved) > self.score(best[0]):
+                best = (achieved, frame)
+        if best[0] is not self.attempts[-1]:
+            best = self.configure(best[0]['requested_fourcc'])
+        self.achieved, self.pending = best
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        if self.pending is not None:
+            frame, self.pending = self.pending, None
+            return True, frame
+        return self.cap.read()
+
+    def rewind(self):
+        return False
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        if self.achieved is None:
+            return f"camera {self.index}: not available"
+        achieved = self.achieved
+        description = (f"camera {self.index}: {achieved['width']}x{achieved['height']} {achieved['fourcc']} at "
+                       f"{achieved['fps']:.1f} FPS")
+        if abs(achieved['reported_fps'] - achieved['fps']) > achieved['fps'] * 0.05:
+            description += f" (driver reports {achieved['reported_fps']:.1f})"
+        return description
+
+    def shortfall(self):
+        if self.achieved is None or self.meets_request(self.achieved):
+            return None
+        requested = self.requested
+        return (f"{self.describe()} (requested {requested['width']}x{requested['height']} at {requested['fps']:.0f} FPS, "
+                f"tried {', '.join(attempt['requested_fourcc'] for attempt in self.attempts)})")
+
+    def report(self):
+        return {'source': f"camera {self.index}", 'requested': self.requested, 'achieved': self.achieved,
+                'attempts': self.attempts}
+
+
+class VideoFileSource:
+    live = False
+
+    def __init__(self, path):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self.fps = float(self.cap.get(cv2.CAP_PROP_FPS)) if self.cap.isOpened() else 0.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        return self.cap.read()
+
+    def rewind(self):
+        return self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        if not self.cap.isOpened():
+            return f"{self.path}: could not open"
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return f"{self.path}: {width}x{height} at {self.fps:.1f} FPS"
+
+    def shortfall(self):
+        return None
+
+    def report(self):
+        return {'source': self.path, 'fps': self.fps}
+
+
+class ImageSequenceSource:
+    live = False
+
+    def __init__(self, pattern, fps=0.0):
+        self.pattern = pattern
+        self.fps = fps
+        if os.path.isdir(pattern):
+            self.files = sorted(os.path.join(pattern, name) for name in os.listdir(pattern)
+                                if name.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            self.files = sorted(glob.glob(pattern))
+        self.position = 0
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def read(self):
+        while self.position < len(self.files):
+            path = self.files[self.position]
+            self.position += 1
+            frame = cv2.imread(path)
+            if frame is not None:
+                return True, frame
+            print(f"Error reading image {path}")
+        return False, None
+
+    def rewind(self):
+        self.position = 0
+        return bool(self.files)
+
+    def release(self):
+        self.position = len(self.files)
+
+    def describe(self):
+        return f"{self.pattern}: {len(self.files)} images"
+
+    def shortfall(self):
+        return None
+
+    def report(self):
+        return {'source': self.pattern, 'images': len(self.files)}
+
+
+class SyntheticSource:
+    def __init__(self, width=1280, height=720, fps=0.0, frames=None, seed=0):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.live = fps > 0
+        self.frames = frames
+        self.index = 0
+        self.start_time = None
+        rng = np.random.default_rng(seed)
+        self.phases = rng.uniform(0, 2 * np.pi, 6)
+        self.speeds = rng.uniform(0.01, 0.03, 6)
+        ramp_x = np.linspace(40, 120, width, dtype=np.float32)
+        ramp_y = np.linspace(20, 90, height, dtype=np.float32)
+        self.background = np.empty((height, width, 3), dtype=np.uint8)
+        self.background[:, :, 0] = ramp_x[np.newaxis, :]
+        self.background[:, :, 1] = ramp_y[:, np.newaxis]
+        self.background[:, :, 2] = (ramp_x[np.newaxis, :] + ramp_y[:, np.newaxis]) / 2
+        self.opened = True
+
+    def isOpened(self):
+        return self.opened
+
+    def frame_index(self):
+        if not self.live:
+            return self.index
+        now = time.perf_counter()
+        if self.start_time is None:
+            self.start_time = now
+        target = self.start_time + self.index / self.fps
+        if now < target:
+            time.sleep(target - now)
+            return self.index
+        return max(self.index, int((now - self.start_time) * self.fps))
+
+    def render(self, index):
+        frame = self.background.copy()
+        width, height = self.width, self.height
+        angles = self.phases + self.speeds * index
+        center = (int(width * (0.5 + 0.2 * np.sin(angles[0]))), int(height * (0.5 + 0.15 * np.sin(angles[1]))))
+        axes = (int(height * 0.18), int(height * 0.24))
+        tilt = 15 * np.sin(angles[2])
+        cv2.ellipse(frame, center, axes, tilt, 0, 360, (150, 180, 220), -1, cv2.LINE_AA)
+        for side in (-1, 1):
+            eye = (center[0] + side * axes[0] // 2, center[1] - axes[1] // 4)
+            cv2.circle(frame, eye, max(2, axes[0] // 8), (40, 40, 40), -1, cv2.LINE_AA)
+        mouth_open = int(axes[1] * (0.08 + 0.06 * np.sin(angles[3])))
+        cv2.ellipse(frame, (center[0], center[1] + axes[1] // 2), (axes[0] // 3, max(1, mouth_open)), tilt,
+                    0, 360, (60, 60, 160), -1, cv2.LINE_AA)
+        for offset, angle in ((-1, angles[4]), (1, angles[5])):
+            hand = (int(width * (0.5 + offset * (0.35 + 0.05 * np.sin(angle)))), int(height * (0.6 + 0.2 * np.cos(angle))))
+            cv2.circle(frame, hand, int(height * 0.07), (140, 170, 210), -1, cv2.LINE_AA)
+        cv2.putText(frame, f"synthetic {index}", (10, height - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        return frame
+
+    def read(self):
+        if not self.opened:
+            return False, None
+        index = self.frame_index()
+        if self.frames is not None and index >= self.frames:
+            return False, None
+        self.index = index + 1
+        return True, self.render(index)
+
+    def rewind(self):
+        self.index = 0
+        self.start_time = None
+        return True
+
+    def release(self):
+        self.opened = False
+
+    def describe(self):
+        rate = f"{self.fps:.1f} FPS" if self.live else "unpaced"
+        return f"synthetic: {self.width}x{self.height}, {rate}"
+
+    def shortfall(self):
+        return None
+
+    def report(self):
+        return {'source': 'synthetic', 'width': self.width, 'height': self.height, 'fps': self.fps, 'frames': self.frames}
+
+
+def parse_synthetic(spec, width, height):
+    fps = 0.0
+    options = spec.partition(':')[2]
+    if '@' in options:
+        options, rate = options.split('@', 1)
+        fps = float(rate)
+    if options:
+        width, height = (int(value) for value in options.lower().split('x', 1))
+    return width, height, fps
+
+
+def open_source(source, width=1280, height=720, fps=60, fourcc=None):
+    source = parse_source(source)
+    if isinstance(source, int):
+        return DeviceSource(source, width, height, fps, fourcc)
+    if source == 'synthetic' or source.startswith('synthetic:'):
+        return SyntheticSource(*parse_synthetic(source, width, height))
+    if os.path.isdir(source) or any(char in source for char in '*?['):
+        return ImageSequenceSource(source)
+    return VideoFileSource(source)
@@ -0,0 +1,186 @@
+from collections import deque
+
+import numpy as np
+
+HAND_PALM_TRIANGLES = [
+    (0, 1, 5), (1, 2, 5), (0, 5, 9), (0, 9, 13), (0, 13, 17),
+    (2, 3, 5), (3, 4, 5)
+]
+
+HAND_FINGERS = [
+    (5, 6, 7, 8),
+    (9, 10, 11, 12),
+    (13, 14, 15, 16),
+    (17, 18, 19, 20)
+]
+
+FACE_SKELETON = [(1, 10), (1, 152), (33, 263), (61, 291), (234, 33), (454, 263)]
+
+HAND_SKELETON = [(0, 4), (0, 8), (0, 12), (0, 16), (0, 20)]
+
+LOD_NAMES = ['full', 'decimated', 'contours', 'skeleton']
+
+
+def unique_edges(connections):
+    edges = np.array([(min(a, b), max(a, b)) for a, b in np.asarray(list(connections)).reshape(-1, 2).tolist() if a != b],
+                     dtype=np.int32).reshape(-1, 2)
+    return np.unique(edges, axis=0)
+
+
+def edge_neighbours(edges):
+    neighbours = {}
+    for a, b in edges.tolist():
+        neighbours.setdefault(a, set()).add(b)
+        neighbours.setdefault(b, set()).add(a)
+    return neighbours
+
+
+def triangles_from_edges(connections):
+    edges = unique_edges(connections)
+    neighbours = edge_neighbours(edges)
+    triangles = []
+    for a, b in edges.tolist():
+        for c in neighbours[a] & neighbours[b]:
+            if c > b:
+                triangles.append((a, b, c))
+    return orient_triangles(drop_non_manifold(sorted(triangles)))
+
+
+def edge_triangle_counts(triangles):
+    counts = {}
+    for a, b, c in triangles:
+        for u, v in ((a, b), (b, c), (c, a)):
+            key = (min(u, v), max(u, v))
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def drop_non_manifold(triangles):
+    triangles = [tuple(triangle) for triangle in triangles]
+    while True:
+        counts = edge_triangle_counts(triangles)
+        overloaded = [triangle for triangle in triangles
+                      if all(counts[(min(u, v), max(u, v))] > 2 for u, v in
+                             ((triangle[0], triangle[1]), (triangle[1], triangle[2]), (triangle[2], triangle[0])))]
+        if not overloaded:
+            break
+        triangles = [triangle for triangle in triangles if triangle not in overloaded]
+    counts = edge_triangle_counts(triangles)
+    return [triangle for triangle in triangles
+            if all(counts[(min(u, v), max(u, v))] <= 2 for u, v in
+                   ((triangle[0], triangle[1]), (triangle[1], triangle[2]), (triangle[2], triangle[0])))]
+
+
+def orient_triangles(triangles):
+    triangles = [list(triangle) for triangle in np.asarray(triangles, dtype=np.int32).reshape(-1, 3).tolist()]
+    by_edge = {}
+    for index, (a, b, c) in enumerate(triangles):
+        for u, v in ((a, b), (b, c), (c, a)):
+            by_edge.setdefault((min(u, v), max(u, v)), []).append(index)
+    visited = [False] * len(triangles)
+    for seed in range(len(triangles)):
+        if visited[seed]:
+            continue
+        visited[seed] = True
+        queue = deque([seed])
+        while queue:
+            current = queue.popleft()
+            a, b, c = triangles[current]
+            for u, v in ((a, b), (b, c), (c, a)):
+                for neighbour in by_edge[(min(u, v), max(u, v))]:
+                    if visited[neighbour]:
+                        continue
+                    x, y, z = triangles[neighbour]
+                    if (u, v) in ((x, y), (y, z), (z, x)):
+                        triangles[neighbour] = [x, z, y]
+                    visited[neighbour] = True
+                    queue.append(neighbour)
+    return np.array(triangles, dtype=np.int32).reshape(-1, 3)
+
+
+def vertex_links(triangles):
+    links = {}
+    for a, b, c in triangles:
+        links.setdefault(a, {})[b] = c
+        links.setdefault(b, {})[c] = a
+        links.setdefault(c, {})[a] = b
+    return links
+
+
+def link_cycle(successors):
+    start = next(iter(successors))
+    cycle = [start]
+    current = successors[start]
+    while current != start:
+        if current not in successors or len(cycle) >= len(successors):
+            return None
+        cycle.append(current)
+        current = successors[current]
+    return cycle if len(cycle) == len(successors) else None
+
+
+def decimate_triangles(triangles, rounds=1, protected=()):
+    triangles = [tuple(triangle) for triangle in np.asarray(triangles, dtype=np.int32).reshape(-1, 3).tolist()]
+    for _ in range(rounds):
+        links = vertex_links(triangles)
+        blocked = set(protected)
+        removed = {}
+        for vertex in sorted(links):
+            if vertex in blocked:
+                continue
+            cycle = link_cycle(links[vertex])
+            if cycle is None or len(cycle) < 3:
+                continue
+            removed[vertex] = cycle
+            blocked.add(vertex)
+            blocked.update(cycle)
+        if not removed:
+            break
+        triangles = [triangle for triangle in triangles if not any(vertex in removed for vertex in triangle)]
+        for cycle in removed.values():
+            for index in range(1, len(cycle) - 1):
+                triangles.append((cycle[0], cycle[index], cycle[index + 1]))
+    return np.array(triangles, dtype=np.int32).reshape(-1, 3)
+
+
+def lod_levels(edge_sets):
+    levels = []
+    for index, edges in enumerate(edge_sets):
+        edges = unique_edges(edges)
+        levels.append({
+            'name': LOD_NAMES[index],
+            'edges': edges,
+            'vertices': None if index == 0 else np.unique(edges)
+        })
+    return levels
+
+
+def edges_from_triangles(triangles):
+    triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    return unique_edges(edges.tolist())
+
+
+def hand_triangles():
+    triangles = list(HAND_PALM_TRIANGLES)
+    for first, second in zip(HAND_FINGERS, HAND_FINGERS[1:]):
+        for joint in range(3):
+            triangles.append((first[joint], first[joint + 1], second[joint]))
+            triangles.append((first[joint + 1], second[joint + 1], second[joint]))
+    return orient_triangles(triangles)
+
+
+def triangle_depth_order(points, triangles):
+    depth = points[triangles, 2].mean(axis=1)
+    order = np.argsort(-depth, kind='stable')
+    return order, depth[order]
+
+
+def front_facing(pixels, triangles):
+    corners = pixels[triangles].astype(np.int64)
+    first = corners[:, 1] - corners[:, 0]
+    second = corners[:, 2] - corners[:, 0]
+    area = first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]
+    if np.count_nonzero(area < 0) > np.count_nonzero(area > 0):
+        area = -area
+    return area > 0
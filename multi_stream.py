@@ -0,0 +1,273 @@
+import argparse
+import json
+import math
+import multiprocessing
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from capture import parse_source
+from LiveVisualTracking import FaceTracker
+from settings_ui import SettingsController, SettingsUIProcess
+
+
+def source_label(source):
+    return f"camera {source}" if isinstance(source, int) else str(source)
+
+
+def stream_worker(index, source, settings, settings_queue, stats_queue, tile_name, tile_shape, tile_lock,
+                  stop_event, max_frames, loop):
+    tile_memory = shared_memory.SharedMemory(name=tile_name)
+    tile = np.ndarray(tile_shape, dtype=np.uint8, buffer=tile_memory.buf)
+    tracker = FaceTracker(source=source, headless=True)
+    tracker.apply_settings(settings)
+    frames = 0
+    try:
+        if not tracker.cap.isOpened():
+            stats_queue.put((index, 'error', f"Could not open {source_label(source)}"))
+            return
+        while not stop_event.is_set() and (max_frames is None or frames < max_frames):
+            changes = {}
+            while True:
+                try:
+                    changes.update(settings_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if changes:
+                tracker.update_settings(changes)
+            frame_start = time.perf_counter()
+            ret, frame = tracker.cap.read()
+            if not ret:
+                if loop and frames > 0 and tracker.cap.rewind():
+                    continue
+                break
+            output_frame = tracker.process_frame(frame)
+            latency = time.perf_counter() - frame_start
+            resized = cv2.resize(output_frame, (tile_shape[1], tile_shape[0]), interpolation=cv2.INTER_AREA)
+            with tile_lock:
+                tile[:] = resized
+            frames += 1
+            stats_queue.put((index, 'frame', latency, time.perf_counter()))
+    except Exception as e:
+        stats_queue.put((index, 'error', str(e)))
+    finally:
+        stats_queue.put((index, 'done', frames))
+        tracker.cleanup()
+        del tile
+        tile_memory.close()
+
+
+class MultiStreamRunner:
+    def __init__(self, sources, tile_size=(640, 360), columns=None, max_frames=None, loop=False,
+                 headless=False, settings_path=None):
+        self.sources = sources
+        self.tile_shape = (tile_size[1], tile_size[0], 3)
+        self.columns = columns or math.ceil(math.sqrt(len(sources)))
+        self.rows = math.ceil(len(sources) / self.columns)
+        self.max_frames = max_frames
+        self.loop = loop
+        self.headless = headless
+        self.context = multiprocessing.get_context('spawn')
+        self.controller = SettingsController()
+        self.settings_ui = None
+        if settings_path:
+            with open(settings_path, "r") as f:
+                self.controller.apply_settings(json.load(f))
+        if not headless:
+            self.settings_ui = SettingsUIProcess(self.controller.get_settings())
+        self.stop_event = self.context.Event()
+        self.stats_queue = self.context.Queue()
+        self.streams = []
+        self.errors = []
+
+    def start(self):
+        settings = self.controller.settings_changes()
+        for index, source in enumerate(self.sources):
+            tile_memory = shared_memory.SharedMemory(create=True, size=int(np.prod(self.tile_shape)))
+            tile = np.ndarray(self.tile_shape, dtype=np.uint8, buffer=tile_memory.buf)
+            tile[:] = 0
+            stream = {
+                'source': source,
+                'settings_queue': self.context.Queue(),
+                'tile_memory': tile_memory,
+                'tile': tile,
+                'tile_lock': self.context.Lock(),
+                'latencies': [],
+                'first_frame': None,
+                'last_frame': None,
+                'done': False
+            }
+            stream['process'] = self.context.Process(
+                target=stream_worker,
+                args=(index, source, settings, stream['settings_queue'], self.stats_queue, tile_memory.name,
+                      self.tile_shape, stream['tile_lock'], self.stop_event, self.max_frames, self.loop),
+                daemon=True
+            )
+            stream['process'].start()
+            self.streams.append(stream)
+
+    def receive_ui_settings(self):
+        if self.settings_ui is None:
+            return
+        changes = self.settings_ui.receive()
+        if changes is not None:
+            self.controller.update_settings(changes)
+
+    def publish_settings(self):
+        changes = self.controller.settings_changes()
+        if changes is not None:
+            for stream in self.streams:
+                stream['settings_queue'].put(changes)
+
+    def drain_stats(self, timeout=0):
+        while True:
+            try:
+                message = self.stats_queue.get(timeout=timeout) if timeout else self.stats_queue.get_nowait()
+            except queue.Empty:
+                return
+            timeout = 0
+            index, kind = message[0], message[1]
+            stream = self.streams[index]
+            if kind == 'frame':
+                stream['latencies'].append(message[2])
+                if stream['first_frame'] is None:
+                    stream['first_frame'] = message[3]
+                stream['last_frame'] = message[3]
+            elif kind == 'error':
+                self.errors.append((index, message[2]))
+                print(f"Error in stream {index} ({source_label(stream['source'])}): {message[2]}")
+            elif kind == 'done':
+                stream['done'] = True
+
+    def stream_fps(self, stream):
+        frames = len(stream['latencies'])
+        if frames < 2 or stream['last_frame'] <= stream['first_frame']:
+            return 0.0
+        return (frames - 1) / (stream['last_frame'] - stream['first_frame'])
+
+    def compose_preview(self):
+        height, width = self.tile_shape[:2]
+        preview = np.zeros((height * self.rows, width * self.columns, 3), dtype=np.uint8)
+        for index, stream in enumerate(self.streams):
+            row, column = divmod(index, self.columns)
+            target = preview[row * height:(row + 1) * height, column * width:(column + 1) * width]
+            with stream['tile_lock']:
+                target[:] = stream['tile']
+            label = f"{index}: {source_label(stream['source'])}  {self.stream_fps(stream):.1f} FPS"
+            cv2.putText(target, label, (10, height - 12), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        return preview
+
+    def cycle_mode(self):
+        self.controller.mode = (self.controller.mode + 1) % len(self.controller.modes)
+        if self.settings_ui is not None:
+            self.settings_ui.send_settings({'mode': self.controller.mode})
+
+    def run(self):
+        self.start()
+        try:
+            while not all(stream['done'] for stream in self.streams):
+                self.receive_ui_settings()
+                self.publish_settings()
+                for stream in self.streams:
+                    if not stream['process'].is_alive():
+                        stream['done'] = True
+                if self.headless:
+                    self.drain_stats(timeout=0.1)
+                    continue
+                self.drain_stats()
+                cv2.imshow('Multi-Stream Tracking', self.compose_preview())
+                key = cv2.waitKey(15) & 0xFF
+                if key == ord('q'):
+                    break
+                elif key == ord(' '):
+                    self.cycle_mode()
+        except KeyboardInterrupt:
+            pass
+        self.stop()
+        return self.report()
+
+    def stop(self):
+        self.stop_event.set()
+        deadline = time.perf_counter() + 10
+        while not all(stream['done'] for stream in self.streams) and time.perf_counter() < deadline:
+            self.drain_stats(timeout=0.1)
+        for stream in self.streams:
+            stream['process'].join(timeout=5)
+            if stream['process'].is_alive():
+                stream['process'].terminate()
+            del stream['tile']
+            stream['tile_memory'].close()
+            stream['tile_memory'].unlink()
+        self.drain_stats()
+        if not self.headless:
+            cv2.destroyAllWindows()
+        if self.settings_ui is not None:
+            self.settings_ui.close()
+
+    def report(self):
+        streams = []
+        total_frames = 0
+        for index, stream in enumerate(self.streams):
+            latencies_ms = np.array(stream['latencies']) * 1000
+            total_frames += len(latencies_ms)
+            entry = {'stream': index, 'source': source_label(stream['source']), 'frames': len(latencies_ms),
+                     'fps': self.stream_fps(stream)}
+            if len(latencies_ms):
+                entry['latency_ms'] = {
+                    'mean': float(latencies_ms.mean()),
+                    'p50': float(np.percentile(latencies_ms, 50)),
+                    'p95': float(np.percentile(latencies_ms, 95)),
+                    'max': float(latencies_ms.max())
+                }
+            streams.append(entry)
+        first = [stream['first_frame'] for stream in self.streams if stream['first_frame'] is not None]
+        last = [stream['last_frame'] for stream in self.streams if stream['last_frame'] is not None]
+        elapsed = max(last) - min(first) if first else 0.0
+        return {
+            'streams': streams,
+            'total_frames': total_frames,
+            'elapsed': elapsed,
+            'aggregate_fps': total_frames / elapsed if elapsed > 0 else 0.0,
+            'errors': self.errors
+        }
+
+
+def print_report(report):
+    print(f"{'stream':<40} {'frames':>7} {'fps':>7} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}")
+    for entry in report['streams']:
+        label = f"{entry['stream']}: {entry['source']}"
+        if 'latency_ms' not in entry:
+            print(f"{label:<40} {entry['frames']:>7} no frames")
+            continue
+        latency = entry['latency_ms']
+        print(f"{label:<40} {entry['frames']:>7} {entry['fps']:7.1f} {latency['mean']:8.2f} {latency['p50']:7.2f} "
+              f"{latency['p95']:7.2f} {latency['max']:7.2f}")
+    print(f"Aggregate: {report['total_frames']} frames in {report['elapsed']:.2f}s, {report['aggregate_fps']:.1f} FPS")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Track several cameras or video files at once")
+    parser.add_argument('sources', nargs='+', help="Camera indices, video files, image folders or synthetic[:WIDTHxHEIGHT[@FPS]]")
+    parser.add_argument('--tile-width', type=int, default=640)
+    parser.add_argument('--tile-height', type=int, default=360)
+    parser.add_argument('--columns', type=int, help="Preview grid columns (default is a near-square grid)")
+    parser.add_argument('--frames', type=int, help="Stop each stream after this many frames")
+    parser.add_argument('--loop', action='store_true', help="Restart video files and image sequences when they end")
+    parser.add_argument('--headless', action='store_true', help="No preview window or settings UI")
+    parser.add_argument('--settings', help="Settings file to start from (for example autosave/autosave.json)")
+    parser.add_argument('--report', help="Write the throughput and latency report to this JSON file")
+    args = parser.parse_args()
+    runner = MultiStreamRunner([parse_source(source) for source in args.sources],
+                               tile_size=(args.tile_width, args.tile_height), columns=args.columns,
+                               max_frames=args.frames, loop=args.loop, headless=args.headless,
+                               settings_path=args.settings)
+    report = runner.run()
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if report['errors'] else 0)
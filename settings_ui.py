@@ -0,0 +1,907 @@
+import copy
+import json
+import os
+import subprocess
+import sys
+import threading
+import tkinter as tk
+from multiprocessing.connection import Client, Listener
+from tkinter import ttk, colorchooser, messagebox, filedialog
+
+DEFAULT_COLOR_PRESETS = {
+    "Neon": {"dot_color": [255, 0, 255], "line_color": [0, 255, 255], "bg_color": [0, 0, 0]},
+    "Matrix": {"dot_color": [0, 255, 0], "line_color": [0, 200, 0], "bg_color": [0, 0, 0]},
+    "Cyberpunk": {"dot_color": [255, 0, 128], "line_color": [0, 255, 255], "bg_color": [16, 0, 32]},
+    "Wireframe": {"dot_color": [255, 255, 255], "line_color": [128, 128, 128], "bg_color": [0, 0, 0]},
+    "Ocean": {"dot_color": [255, 200, 0], "line_color": [255, 100, 0], "bg_color": [40, 20, 0]},
+    "Sunset": {"dot_color": [0, 200, 255], "line_color": [0, 100, 200], "bg_color": [0, 20, 40]}
+}
+
+DEFAULT_SETTINGS = {
+    "mode": 0,
+    "connection": "TESSELATION",
+    "dot_color": [255, 255, 0],
+    "line_color": [0, 255, 0],
+    "bg_color": [0, 0, 0],
+    "dot_size": 2,
+    "line_thickness": 1,
+    "show_fps": True,
+    "show_camera": False,
+    "camera_opacity": 0.5,
+    "show_hands": True,
+    "antialias_dots": False,
+    "show_head_pose": False,
+    "replay_speed": 1.0,
+    "replay_frames": False,
+    "trail_length": 12,
+    "performance_mode": False,
+    "detection_confidence": None,
+    "hand_model_complexity": None,
+    "iris_refinement": True,
+    "incremental_render": False,
+    "lod_enabled": True,
+    "face_inference_height": 0,
+    "hand_inference_height": 0,
+    "experiments": {
+        'expression_triggers': False,
+        'additional_modes': False,
+        'audio_visualizer': False,
+        'gesture_controls': False
+    },
+    "emotion_colors": {
+        'happy': [0, 255, 0],
+        'sad': [255, 0, 0],
+        'angry': [0, 0, 255],
+        'neutral': [128, 128, 128]
+    },
+    "audio_sensitivity": 1.0
+}
+
+SETTING_ATTRIBUTES = {"connection": "current_connection"}
+
+BASE_MODES = ['Mesh', 'Dots']
+
+ADDITIONAL_MODES = ['Skeleton', 'Wireframe Triangle', 'Wireframe Hexagon', 'Shaded', 'Trails']
+
+AUTOSAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "autosave", "autosave.json")
+
+def load_autosave_settings():
+    if not os.path.exists(AUTOSAVE_PATH):
+        return None
+    try:
+        with open(AUTOSAVE_PATH, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading settings: {e}")
+        return None
+
+class ModernSettingsUI:
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.saves_dir = os.path.join(self.script_dir, "saves")
+        self.color_presets_dir = os.path.join(self.script_dir, "color_presets")
+        self.autosave_dir = os.path.join(self.script_dir, "autosave")
+        for directory in [self.saves_dir, self.color_presets_dir, self.autosave_dir]:
+            os.makedirs(directory, exist_ok=True)
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.run_ui, daemon=True)
+        self.thread.start()
+        
+    def run_ui(self):
+        self.root = tk.Tk()
+        self.root.title("Face Tracker Settings")
+        self.root.geometry("450x700")
+        self.root.configure(bg='#2b2b2b')
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+        self.configure_styles()
+        self.notebook = ttk.Notebook(self.root, style='Dark.TNotebook')
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        self.create_appearance_tab()
+        self.create_color_presets_tab()
+        self.create_saves_tab()
+        self.create_experiments_tab()
+        self.create_performance_tab()
+        self.status_bar = tk.Label(self.root, text="Ready", bg='#1e1e1e', fg='white', relief=tk.SUNKEN, anchor=tk.W)
+        self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.after(100, self.load_autosave)
+        self.root.mainloop()
+        
+    def configure_styles(self):
+        self.style.configure('Dark.TNotebook', background='#2b2b2b', borderwidth=0)
+        self.style.configure('Dark.TNotebook.Tab', background='#3c3c3c', foreground='white', padding=[20, 10])
+        self.style.map('Dark.TNotebook.Tab', background=[('selected', '#555555')])
+        self.style.configure('Dark.TFrame', background='#2b2b2b')
+        self.style.configure('Dark.TLabel', background='#2b2b2b', foreground='white')
+        self.style.configure('Dark.TButton', background='#3c3c3c', foreground='white', borderwidth=0, focuscolor='none')
+        self.style.map('Dark.TButton', background=[('active', '#555555')])
+        self.style.configure('Dark.TCheckbutton', background='#2b2b2b', foreground='white', focuscolor='none')
+        self.style.configure('Dark.TRadiobutton', background='#2b2b2b', foreground='white', focuscolor='none')
+        self.style.configure('Dark.Horizontal.TScale', background='#2b2b2b', troughcolor='#3c3c3c', borderwidth=0)
+        
+    def create_appearance_tab(self):
+        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
+        self.notebook.add(tab, text='Appearance')
+        mode_frame = ttk.Frame(tab, style='Dark.TFrame')
+        mode_frame.pack(fill='x', padx=20, pady=10)
+        ttk.Label(mode_frame, text="Mode:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
+        self.mode_var = tk.StringVar(value=self.tracker.modes[self.tracker.mode])
+        self.mode_menu = ttk.Combobox(mode_frame, textvariable=self.mode_var, values=self.tracker.modes, state='readonly', width=15)
+        self.mode_menu.pack(side='left')
+        self.mode_menu.bind('<<ComboboxSelected>>', self.on_mode_change)
+        conn_frame = ttk.Frame(tab, style='Dark.TFrame')
+        conn_frame.pack(fill='x', padx=20, pady=10)
+        ttk.Label(conn_frame, text="Connection:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
+        self.conn_var = tk.StringVar(value=self.tracker.current_connection)
+        self.conn_menu = ttk.Combobox(conn_frame, textvariable=self.conn_var, values=list(self.tracker.connection_types.keys()), state='readonly', width=15)
+        self.conn_menu.pack(side='left')
+        self.conn_menu.bind('<<ComboboxSelected>>', self.on_connection_change)
+        toggles_frame = ttk.Frame(tab, style='Dark.TFrame')
+        toggles_frame.pack(fill='x', padx=20, pady=10)
+        self.show_camera_var = tk.BooleanVar(value=self.tracker.show_camera)
+        camera_check = ttk.Checkbutton(toggles_frame, text="Show Camera Feed", variable=self.show_camera_var,
+                                      command=self.on_camera_toggle, style='Dark.TCheckbutton')
+        camera_check.pack(anchor='w', pady=2)
+        self.show_hands_var = tk.BooleanVar(value=self.tracker.show_hands)
+        hands_check = ttk.Checkbutton(toggles_frame, text="Show Hands", variable=self.show_hands_var,
+                                     command=self.on_hands_toggle, style='Dark.TCheckbutton')
+        hands_check.pack(anchor='w', pady=2)
+        self.antialias_dots_var = tk.BooleanVar(value=self.tracker.antialias_dots)
+        antialias_check = ttk.Checkbutton(toggles_frame, text="Smooth Dots", variable=self.antialias_dots_var,
+                                         command=self.on_antialias_dots_toggle, style='Dark.TCheckbutton')
+        antialias_check.pack(anchor='w', pady=2)
+        self.show_head_pose_var = tk.BooleanVar(value=self.tracker.show_head_pose)
+        head_pose_check = ttk.Checkbutton(toggles_frame, text="Show Head Pose", variable=self.show_head_pose_var,
+                                         command=self.on_head_pose_toggle, style='Dark.TCheckbutton')
+        head_pose_check.pack(anchor='w', pady=2)
+        ttk.Label(toggles_frame, text="Camera Opacity:", style='Dark.TLabel').pack(anchor='w', pady=(10, 0))
+        self.camera_opacity_var = tk.DoubleVar(value=self.tracker.camera_opacity)
+        opacity_scale = ttk.Scale(toggles_frame, from_=0.1, to=1.0, orient='horizontal',
+                                 variable=self.camera_opacity_var, command=self.on_camera_opacity_change,
+                                 style='Dark.Horizontal.TScale')
+        opacity_scale.pack(fill='x', pady=5)
+        ttk.Label(toggles_frame, text="Replay Speed (R to replay):", style='Dark.TLabel').pack(anchor='w', pady=(10, 0))
+        self.replay_speed_var = tk.DoubleVar(value=self.tracker.replay_speed)
+        replay_scale = ttk.Scale(toggles_frame, from_=0.25, to=4.0, orient='horizontal',
+                                variable=self.replay_speed_var, command=self.on_replay_speed_change,
+                                style='Dark.Horizontal.TScale')
+        replay_scale.pack(fill='x', pady=5)
+        self.replay_frames_var = tk.BooleanVar(value=self.tracker.replay_frames)
+        replay_frames_check = ttk.Checkbutton(toggles_frame, text="Keep Camera Frames for Replay",
+                                             variable=self.replay_frames_var,
+                                             command=self.on_replay_frames_toggle, style='Dark.TCheckbutton')
+        replay_frames_check.pack(anchor='w', pady=2)
+        ttk.Label(toggles_frame, text="Trail Length (Trails mode, frames):", style='Dark.TLabel').pack(anchor='w', pady=(10, 0))
+        self.trail_length_var = tk.IntVar(value=self.tracker.trail_length)
+        trail_scale = ttk.Scale(toggles_frame, from_=2, to=60, orient='horizontal',
+                               variable=self.trail_length_var, command=self.on_trail_length_change,
+                               style='Dark.Horizontal.TScale')
+        trail_scale.pack(fill='x', pady=5)
+        ttk.Label(tab, text="Colors:", style='Dark.TLabel').pack(anchor='w', padx=20, pady=(10, 5))
+        self.create_color_control(tab, "Dot Color", self.tracker.dot_color, self.on_dot_color_change)
+        self.create_color_control(tab, "Line Color", self.tracker.line_color, self.on_line_color_change)
+        self.create_color_control(tab, "Background", self.tracker.bg_color, self.on_bg_color_change)
+        size_frame = ttk.Frame(tab, style='Dark.TFrame')
+        size_frame.pack(fill='x', padx=20, pady=20)
+        ttk.Label(size_frame, text="Dot Size:", style='Dark.TLabel').pack()
+        self.dot_size_var = tk.IntVar(value=self.tracker.dot_size)
+        dot_scale = ttk.Scale(size_frame, from_=1, to=10, orient='horizontal', variable=self.dot_size_var, 
+                             command=self.on_dot_size_change, style='Dark.Horizontal.TScale')
+        dot_scale.pack(fill='x', pady=5)
+        ttk.Label(size_frame, text="Line Width:", style='Dark.TLabel').pack()
+        self.line_width_var = tk.IntVar(value=self.tracker.line_thickness)
+        line_scale = ttk.Scale(size_frame, from_=1, to=5, orient='horizontal', variable=self.line_width_var,
+                              command=self.on_line_width_change, style='Dark.Horizontal.TScale')
+        line_scale.pack(fill='x', pady=5)
+        
+    def create_color_presets_tab(self):
+        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
+        self.notebook.add(tab, text='Color Presets')
+        self.default_presets = DEFAULT_COLOR_PRESETS
+        preset_frame = ttk.Frame(tab, style='Dark.TFrame')
+        preset_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        ttk.Label(preset_frame, text="Available Color Presets:", style='Dark.TLabel').pack()
+        self.preset_listbox = tk.Listbox(preset_frame, bg='#3c3c3c', fg='white', selectbackground='#555555')
+        self.preset_listbox.pack(fill='both', expand=True, pady=10)
+        button_frame = ttk.Frame(preset_frame, style='Dark.TFrame')
+        button_frame.pack(fill='x')
+        ttk.Button(button_frame, text="Load", command=self.load_color_preset, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Save Current", command=self.save_color_preset, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Delete", command=self.delete_color_preset, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh_color_preset_list, style='Dark.TButton').pack(side='left', padx=5)
+        self.refresh_color_preset_list()
+    
+    def create_saves_tab(self):
+        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
+        self.notebook.add(tab, text='Saves')
+        save_frame = ttk.Frame(tab, style='Dark.TFrame')
+        save_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        ttk.Label(save_frame, text="Saved Configurations:", style='Dark.TLabel').pack()
+        self.save_listbox = tk.Listbox(save_frame, bg='#3c3c3c', fg='white', selectbackground='#555555')
+        self.save_listbox.pack(fill='both', expand=True, pady=10)
+        button_frame = ttk.Frame(save_frame, style='Dark.TFrame')
+        button_frame.pack(fill='x')
+        ttk.Button(button_frame, text="Load", command=self.load_save, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Save Current", command=self.save_current, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Delete", command=self.delete_save, style='Dark.TButton').pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh_save_list, style='Dark.TButton').pack(side='left', padx=5)
+        self.start_save_monitor()
+        self.refresh_save_list()
+        
+    def create_experiments_tab(self):
+        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
+        self.notebook.add(tab, text='Experiments')
+        info_label = ttk.Label(tab, text="Enable experimental features (may affect performance)", 
+                              style='Dark.TLabel', font=('Arial', 10, 'bold'))
+        info_label.pack(padx=20, pady=10)
+        self.exp_expression_triggers = tk.BooleanVar(value=self.tracker.experiments.get('expression_triggers', False))
+        exp1_check = ttk.Checkbutton(tab, text="Expression Triggers (Emotion-based colors)", 
+                                    variable=self.exp_expression_triggers,
+                                    command=self.on_exp_expression_toggle, style='Dark.TCheckbutton')
+        exp1_check.pack(anchor='w', padx=20, pady=5)
+        self.expression_frame = ttk.LabelFrame(tab, text="Expression Settings", style='Dark.TFrame')
+        self.expression_frame.pack(fill='x', padx=40, pady=5)
+        self.emotion_colors = {
+            'happy': tk.StringVar(value=str(self.tracker.emotion_colors.get('happy', [0, 255, 0]))),
+            'sad': tk.StringVar(value=str(self.tracker.emotion_colors.get('sad', [255, 0, 0]))),
+            'angry': tk.StringVar(value=str(self.tracker.emotion_colors.get('angry', [0, 0, 255]))),
+            'neutral': tk.StringVar(value=str(self.tracker.emotion_colors.get('neutral', [128, 128, 128])))
+        }
+        for emotion, color_var in self.emotion_colors.items():
+            self.create_emotion_color_control(self.expression_frame, emotion.capitalize(), emotion)
+        self.toggle_expression_settings()
+        self.exp_additional_modes = tk.BooleanVar(value=self.tracker.experiments.get('additional_modes', False))
+        exp2_check = ttk.Checkbutton(tab, text="Additional Visualization Modes", 
+                                    variable=self.exp_additional_modes,
+                                    command=self.on_exp_modes_toggle, style='Dark.TCheckbutton')
+        exp2_check.pack(anchor='w', padx=20, pady=5)
+        modes_info = ttk.Label(tab, text="    Adds: Skeleton, Wireframe Triangle, Wireframe Hexagon, Shaded, Trails", 
+                              style='Dark.TLabel', font=('Arial', 9))
+        modes_info.pack(anchor='w', padx=40, pady=2)
+        self.exp_audio_visualizer = tk.BooleanVar(value=self.tracker.experiments.get('audio_visualizer', False))
+        exp3_check = ttk.Checkbutton(tab, text="Audio Visualizer (Mic controls thickness)", 
+                                    variable=self.exp_audio_visualizer,
+                                    command=self.on_exp_audio_toggle, style='Dark.TCheckbutton')
+        exp3_check.pack(anchor='w', padx=20, pady=5)
+        self.audio_frame = ttk.LabelFrame(tab, text="Audio Settings", style='Dark.TFrame')
+        self.audio_frame.pack(fill='x', padx=40, pady=5)
+        self.audio_sensitivity = tk.DoubleVar(value=self.tracker.audio_sensitivity)
+        ttk.Label(self.audio_frame, text="Sensitivity:", style='Dark.TLabel').pack(anchor='w', padx=10)
+        sensitivity_scale = ttk.Scale(self.audio_frame, from_=0.1, to=5.0, orient='horizontal',
+                                     variable=self.audio_sensitivity, command=self.on_audio_sensitivity_change,
+                                     style='Dark.Horizontal.TScale')
+        sensitivity_scale.pack(fill='x', padx=10, pady=5)
+        self.toggle_audio_settings()
+        self.exp_gesture_controls = tk.BooleanVar(value=self.tracker.experiments.get('gesture_controls', False))
+        exp4_check = ttk.Checkbutton(tab, text="Gesture Controls (Hand signs change mode and colors)",
+                                    variable=self.exp_gesture_controls,
+                                    command=self.on_exp_gesture_toggle, style='Dark.TCheckbutton')
+        exp4_check.pack(anchor='w', padx=20, pady=5)
+        gestures_info = ttk.Label(tab, text="    Victory: next mode, Pinch: next color preset",
+                                 style='Dark.TLabel', font=('Arial', 9))
+        gestures_info.pack(anchor='w', padx=40, pady=2)
+    
+    def create_performance_tab(self):
+        tab = ttk.Frame(self.notebook, style='Dark.TFrame')
+        self.notebook.add(tab, text='Performance')
+        self.performance_mode = tk.BooleanVar(value=self.tracker.performance_mode)
+        perf_check = ttk.Checkbutton(tab, text="Performance Mode (Higher FPS)", variable=self.performance_mode,
+                                    command=self.on_performance_toggle, style='Dark.TCheckbutton')
+        perf_check.pack(padx=20, pady=10)
+        self.show_fps = tk.BooleanVar(value=self.tracker.show_fps)
+        fps_check = ttk.Checkbutton(tab, text="Show FPS", variable=self.show_fps,
+                                   command=self.on_fps_toggle, style='Dark.TCheckbutton')
+        fps_check.pack(padx=20, pady=10)
+        self.incremental_render = tk.BooleanVar(value=self.tracker.incremental_render)
+        incremental_check = ttk.Checkbutton(tab, text="Incremental Rendering (Skip unchanged frames)",
+                                           variable=self.incremental_render,
+                                           command=self.on_incremental_render_toggle, style='Dark.TCheckbutton')
+        incremental_check.pack(padx=20, pady=10)
+        self.lod_enabled = tk.BooleanVar(value=self.tracker.lod_enabled)
+        lod_check = ttk.Checkbutton(tab, text="Level of Detail (Simplify distant faces)", variable=self.lod_enabled,
+                                   command=self.on_lod_toggle, style='Dark.TCheckbutton')
+        lod_check.pack(padx=20, pady=10)
+        inference_frame = ttk.Frame(tab, style='Dark.TFrame')
+        inference_frame.pack(fill='x', padx=20, pady=10)
+        resolutions = list(self.tracker.inference_resolutions.keys())
+        ttk.Label(inference_frame, text="Face Inference:", style='Dark.TLabel').grid(row=0, column=0, sticky='w', pady=2)
+        self.face_inference_var = tk.StringVar(value=self.inference_label(self.tracker.face_inference_height))
+        self.face_inference_menu = ttk.Combobox(inference_frame, textvariable=self.face_inference_var, values=resolutions,
+                                                state='readonly', width=10)
+        self.face_inference_menu.grid(row=0, column=1, sticky='w', padx=10, pady=2)
+        self.face_inference_menu.bind('<<ComboboxSelected>>', self.on_inference_resolution_change)
+        ttk.Label(inference_frame, text="Hand Inference:", style='Dark.TLabel').grid(row=1, column=0, sticky='w', pady=2)
+        self.hand_inference_var = tk.StringVar(value=self.inference_label(self.tracker.hand_inference_height))
+        self.hand_inference_menu = ttk.Combobox(inference_frame, textvariable=self.hand_inference_var, values=resolutions,
+                                                state='readonly', width=10)
+        self.hand_inference_menu.grid(row=1, column=1, sticky='w', padx=10, pady=2)
+        self.hand_inference_menu.bind('<<ComboboxSelected>>', self.on_inference_resolution_change)
+        self.auto_save = tk.BooleanVar(value=True)
+        auto_save_check = ttk.Checkbutton(tab, text="Auto-save settings", variable=self.auto_save,
+                                         style='Dark.TCheckbutton')
+        auto_save_check.pack(padx=20, pady=10)
+        info_frame = ttk.LabelFrame(tab, text="Performance Mode Info", style='Dark.TFrame')
+        info_frame.pack(fill='x', padx=20, pady=10)
+        info_text = """Performance mode optimizes tracking by:
+• Reducing face mesh resolution
+• Lowering detection confidence
+• Decreasing tracking smoothness
+• Simplifying hand tracking
+        
+This can improve FPS from 10-15 to 30-60."""
+        info_label = ttk.Label(info_frame, text=info_text, style='Dark.TLabel', justify='left')
+        info_label.pack(padx=10, pady=10)
+    
+    def create_emotion_color_control(self, parent, label, emotion):
+        frame = ttk.Frame(parent, style='Dark.TFrame')
+        frame.pack(fill='x', padx=10, pady=5)
+        ttk.Label(frame, text=f"{label}:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
+        current_color = eval(self.emotion_colors[emotion].get())
+        color_frame = tk.Frame(frame, width=50, height=25, bg=self.rgb_to_hex(current_color), relief=tk.RAISED, bd=2)
+        color_frame.pack(side='left', padx=(0, 10))
+        if not hasattr(self, 'emotion_color_frames'):
+            self.emotion_color_frames = {}
+        self.emotion_color_frames[emotion] = color_frame
+        ttk.Button(frame, text="Choose", 
+                  command=lambda: self.choose_emotion_color(emotion, color_frame),
+                  style='Dark.TButton').pack(side='left')
+    
+    def choose_emotion_color(self, emotion, color_frame):
+        current_color = eval(self.emotion_colors[emotion].get())
+        color = colorchooser.askcolor(initialcolor=self.rgb_to_hex(current_color))
+        if color[0]:
+            new_color = [int(color[0][2]), int(color[0][1]), int(color[0][0])]
+            self.emotion_colors[emotion].set(str(new_color))
+            self.tracker.emotion_colors[emotion] = new_color
+            color_frame.configure(bg=color[1])
+            self.schedule_autosave()
+    
+    def toggle_expression_settings(self):
+        if self.exp_expression_triggers.get():
+            self.expression_frame.pack(fill='x', padx=40, pady=5)
+        else:
+            self.expression_frame.pack_forget()
+    
+    def toggle_audio_settings(self):
+        if self.exp_audio_visualizer.get():
+            self.audio_frame.pack(fill='x', padx=40, pady=5)
+        else:
+            self.audio_frame.pack_forget()
+    
+    def on_exp_expression_toggle(self):
+        self.tracker.experiments['expression_triggers'] = self.exp_expression_triggers.get()
+        self.toggle_expression_settings()
+        self.schedule_autosave()
+    
+    def on_exp_modes_toggle(self):
+        self.tracker.experiments['additional_modes'] = self.exp_additional_modes.get()
+        self.tracker.update_modes()
+        self.mode_var.set(self.tracker.modes[self.tracker.mode])
+        self.mode_menu['values'] = self.tracker.modes
+        self.schedule_autosave()
+    
+    def on_exp_audio_toggle(self):
+        self.tracker.experiments['audio_visualizer'] = self.exp_audio_visualizer.get()
+        if self.exp_audio_visualizer.get():
+            self.tracker.start_audio_stream()
+        else:
+            self.tracker.stop_audio_stream()
+        self.toggle_audio_settings()
+        self.schedule_autosave()
+    
+    def on_exp_gesture_toggle(self):
+        self.tracker.experiments['gesture_controls'] = self.exp_gesture_controls.get()
+        self.schedule_autosave()
+    
+    def on_audio_sensitivity_change(self, value):
+        self.tracker.audio_sensitivity = float(value)
+        self.schedule_autosave()
+    
+    def create_color_control(self, parent, label, color, callback):
+        frame = ttk.Frame(parent, style='Dark.TFrame')
+        frame.pack(fill='x', padx=20, pady=10)
+        ttk.Label(frame, text=f"{label}:", style='Dark.TLabel').pack(side='left', padx=(0, 10))
+        color_frame = tk.Frame(frame, width=50, height=25, bg=self.rgb_to_hex(color), relief=tk.RAISED, bd=2)
+        color_frame.pack(side='left', padx=(0, 10))
+        if not hasattr(self, 'color_frames'):
+            self.color_frames = []
+        attr_map = {
+            "Dot Color": "dot_color",
+            "Line Color": "line_color",
+            "Background": "bg_color"
+        }
+        self.color_frames.append((color_frame, color, attr_map.get(label)))
+        ttk.Button(frame, text="Choose", command=lambda: self.choose_color(color, callback, color_frame),
+                  style='Dark.TButton').pack(side='left')
+    
+    def rgb_to_hex(self, rgb):
+        return '#{:02x}{:02x}{:02x}'.format(rgb[2], rgb[1], rgb[0])
+    
+    def choose_color(self, current_color, callback, color_frame):
+        rgb_color = (current_color[2], current_color[1], current_color[0])
+        color = colorchooser.askcolor(initialcolor=self.rgb_to_hex(current_color))
+        if color[0]:
+            new_color = [int(color[0][2]), int(color[0][1]), int(color[0][0])]
+            callback(new_color)
+            color_frame.configure(bg=color[1])
+    
+    def on_mode_change(self, event=None):
+        self.tracker.mode = self.tracker.modes.index(self.mode_var.get())
+        self.schedule_autosave()
+        
+    def on_connection_change(self, event=None):
+        self.tracker.current_connection = self.conn_var.get()
+        self.schedule_autosave()
+        
+    def on_dot_color_change(self, color):
+        self.tracker.dot_color = color
+        self.schedule_autosave()
+        
+    def on_line_color_change(self, color):
+        self.tracker.line_color = color
+        self.schedule_autosave()
+        
+    def on_bg_color_change(self, color):
+        self.tracker.bg_color = color
+        self.schedule_autosave()
+        
+    def on_dot_size_change(self, value):
+        self.tracker.dot_size = int(float(value))
+        self.schedule_autosave()
+        
+    def on_line_width_change(self, value):
+        self.tracker.line_thickness = int(float(value))
+        self.schedule_autosave()
+    
+    def on_fps_toggle(self):
+        self.tracker.show_fps = self.show_fps.get()
+        self.schedule_autosave()
+    
+    def on_camera_toggle(self):
+        self.tracker.show_camera = self.show_camera_var.get()
+        self.schedule_autosave()
+    
+    def on_camera_opacity_change(self, value):
+        self.tracker.camera_opacity = float(value)
+        self.schedule_autosave()
+    
+    def on_replay_speed_change(self, value):
+        self.tracker.replay_speed = float(value)
+        self.schedule_autosave()
+    
+    def on_replay_frames_toggle(self):
+        self.tracker.replay_frames = self.replay_frames_var.get()
+        self.schedule_autosave()
+    
+    def on_trail_length_change(self, value):
+        self.tracker.trail_length = int(float(value))
+        self.schedule_autosave()
+    
+    def on_hands_toggle(self):
+        self.tracker.show_hands = self.show_hands_var.get()
+        self.schedule_autosave()
+    
+    def on_head_pose_toggle(self):
+        self.tracker.show_head_pose = self.show_head_pose_var.get()
+        self.schedule_autosave()
+    
+    def inference_label(self, height):
+        for label, value in self.tracker.inference_resolutions.items():
+            if value == height:
+                return label
+        return 'Full'
+    
+    def on_inference_resolution_change(self, event=None):
+        self.tracker.face_inference_height = self.tracker.inference_resolutions[self.face_inference_var.get()]
+        self.tracker.hand_inference_height = self.tracker.inference_resolutions[self.hand_inference_var.get()]
+        self.schedule_autosave()
+    
+    def on_incremental_render_toggle(self):
+        self.tracker.incremental_render = self.incremental_render.get()
+        self.schedule_autosave()
+    
+    def on_antialias_dots_toggle(self):
+        self.tracker.antialias_dots = self.antialias_dots_var.get()
+        self.schedule_autosave()
+    
+    def on_lod_toggle(self):
+        self.tracker.lod_enabled = self.lod_enabled.get()
+        self.schedule_autosave()
+    
+    def on_performance_toggle(self):
+        self.tracker.performance_mode = self.performance_mode.get()
+        self.tracker.update_performance_settings()
+        self.schedule_autosave()
+    
+    def schedule_autosave(self):
+        if hasattr(self, 'autosave_timer') and self.autosave_timer:
+            self.root.after_cancel(self.autosave_timer)
+        self.autosave_timer = self.root.after(1000, self.autosave_settings)
+    
+    def autosave_settings(self):
+        if self.auto_save.get():
+            autosave_path = os.path.join(self.autosave_dir, "autosave.json")
+            self.save_all_settings(autosave_path)
+    
+    def save_all_settings(self, filepath):
+        settings = self.tracker.get_settings()
+        try:
+            with open(filepath, "w") as f:
+                json.dump(settings, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+            return False
+    
+    def load_all_settings(self, filepath):
+        try:
+            with open(filepath, "r") as f:
+                settings = json.load(f)
+            self.tracker.apply_settings(settings)
+            self.update_ui_from_settings()
+            return True
+            
+        except json.JSONDecodeError:
+            os.remove(filepath)
+            return False
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            return False
+    
+    def update_ui_from_settings(self):
+        self.mode_var.set(self.tracker.modes[self.tracker.mode])
+        self.mode_menu['values'] = self.tracker.modes
+        self.conn_var.set(self.tracker.current_connection)
+        self.dot_size_var.set(self.tracker.dot_size)
+        self.line_width_var.set(self.tracker.line_thickness)
+        self.show_camera_var.set(self.tracker.show_camera)
+        self.camera_opacity_var.set(self.tracker.camera_opacity)
+        self.show_hands_var.set(self.tracker.show_hands)
+        self.antialias_dots_var.set(self.tracker.antialias_dots)
+        self.show_head_pose_var.set(self.tracker.show_head_pose)
+        self.replay_speed_var.set(self.tracker.replay_speed)
+        self.replay_frames_var.set(self.tracker.replay_frames)
+        self.trail_length_var.set(self.tracker.trail_length)
+        self.show_fps.set(self.tracker.show_fps)
+        self.performance_mode.set(self.tracker.performance_mode)
+        self.incremental_render.set(self.tracker.incremental_render)
+        self.lod_enabled.set(self.tracker.lod_enabled)
+        self.face_inference_var.set(self.inference_label(self.tracker.face_inference_height))
+        self.hand_inference_var.set(self.inference_label(self.tracker.hand_inference_height))
+        if hasattr(self, 'exp_expression_triggers'):
+            self.exp_expression_triggers.set(self.tracker.experiments.get('expression_triggers', False))
+            self.exp_additional_modes.set(self.tracker.experiments.get('additional_modes', False))
+            self.exp_audio_visualizer.set(self.tracker.experiments.get('audio_visualizer', False))
+            self.exp_gesture_controls.set(self.tracker.experiments.get('gesture_controls', False))
+            self.audio_sensitivity.set(self.tracker.audio_sensitivity)
+        if hasattr(self, 'emotion_colors'):
+            for emotion, color in self.tracker.emotion_colors.items():
+                self.emotion_colors[emotion].set(str(color))
+        for frame, color, attr in self.color_frames:
+            current_color = getattr(self.tracker, attr)
+            frame.configure(bg=self.rgb_to_hex(current_color))
+    
+    def load_autosave(self):
+        autosave_path = os.path.join(self.autosave_dir, "autosave.json")
+        if os.path.exists(autosave_path):
+            if not self.load_all_settings(autosave_path):
+                self.status_bar.config(text="Autosave corrupted, using defaults")
+            else:
+                self.status_bar.config(text="Loaded autosaved settings")
+        self.ready.set()
+    
+    def refresh_save_list(self):
+        self.save_listbox.delete(0, tk.END)
+        if os.path.exists(self.saves_dir):
+            for filename in os.listdir(self.saves_dir):
+                if filename.endswith('.json'):
+                    name = filename[:-5]
+                    self.save_listbox.insert(tk.END, name)
+    
+    def save_current(self):
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Save Configuration")
+        dialog.geometry("300x100")
+        dialog.configure(bg='#2b2b2b')
+        tk.Label(dialog, text="Save Name:", bg='#2b2b2b', fg='white').pack(pady=10)
+        name_entry = tk.Entry(dialog, bg='#3c3c3c', fg='white')
+        name_entry.pack(pady=5)
+        
+        def save():
+            name = name_entry.get()
+            if name:
+                save_path = os.path.join(self.saves_dir, f"{name}.json")
+                if self.save_all_settings(save_path):
+                    self.refresh_save_list()
+                    dialog.destroy()
+                    self.status_bar.config(text=f"Saved configuration: {name}")
+                else:
+                    messagebox.showerror("Error", "Failed to save configuration")
+        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+    
+    def load_save(self):
+        selection = self.save_listbox.curselection()
+        if selection:
+            save_name = self.save_listbox.get(selection[0])
+            save_path = os.path.join(self.saves_dir, f"{save_name}.json")
+            if self.load_all_settings(save_path):
+                self.status_bar.config(text=f"Loaded configuration: {save_name}")
+            else:
+                messagebox.showwarning("Corrupted File", 
+                    f"The save file '{save_name}' was corrupted and has been deleted.")
+                self.refresh_save_list()
+    
+    def delete_save(self):
+        selection = self.save_listbox.curselection()
+        if selection:
+            save_name = self.save_listbox.get(selection[0])
+            if messagebox.askyesno("Delete Save", f"Delete configuration '{save_name}'?"):
+                save_path = os.path.join(self.saves_dir, f"{save_name}.json")
+                os.remove(save_path)
+                self.refresh_save_list()
+                self.status_bar.config(text=f"Deleted configuration: {save_name}")
+    
+    def start_save_monitor(self):
+        def check_saves():
+            self.refresh_save_list()
+            self.root.after(2000, check_saves)
+        self.root.after(2000, check_saves)
+
+    def refresh_color_preset_list(self):
+        self.preset_listbox.delete(0, tk.END)
+        for name in self.default_presets:
+            self.preset_listbox.insert(tk.END, f"[Default] {name}")
+        if os.path.exists(self.color_presets_dir):
+            for filename in os.listdir(self.color_presets_dir):
+                if filename.endswith('.json'):
+                    name = filename[:-5]
+                    self.preset_listbox.insert(tk.END, name)
+    
+    def save_color_preset(self):
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Save Color Preset")
+        dialog.geometry("300x100")
+        dialog.configure(bg='#2b2b2b')
+        tk.Label(dialog, text="Preset Name:", bg='#2b2b2b', fg='white').pack(pady=10)
+        name_entry = tk.Entry(dialog, bg='#3c3c3c', fg='white')
+        name_entry.pack(pady=5)
+        
+        def save():
+            name = name_entry.get()
+            if name:
+                preset = {
+                    "dot_color": self.tracker.dot_color,
+                    "line_color": self.tracker.line_color,
+                    "bg_color": self.tracker.bg_color
+                }
+                preset_path = os.path.join(self.color_presets_dir, f"{name}.json")
+                try:
+                    with open(preset_path, "w") as f:
+                        json.dump(preset, f, indent=2)
+                    self.refresh_color_preset_list()
+                    dialog.destroy()
+                    self.status_bar.config(text=f"Saved color preset: {name}")
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to save preset: {e}")
+        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+    
+    def load_color_preset(self):
+        selection = self.preset_listbox.curselection()
+        if selection:
+            preset_name = self.preset_listbox.get(selection[0])
+            if preset_name.startswith("[Default]"):
+                preset_name = preset_name.replace("[Default] ", "")
+                preset = self.default_presets[preset_name]
+            else:
+                preset_path = os.path.join(self.color_presets_dir, f"{preset_name}.json")
+                try:
+                    with open(preset_path, "r") as f:
+                        preset = json.load(f)
+                except json.JSONDecodeError:
+                    messagebox.showwarning("Corrupted File", 
+                        f"The preset file '{preset_name}' was corrupted and has been deleted.")
+                    os.remove(preset_path)
+                    self.refresh_color_preset_list()
+                    return
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to load preset: {e}")
+                    return
+            self.tracker.dot_color = preset["dot_color"]
+            self.tracker.line_color = preset["line_color"]
+            self.tracker.bg_color = preset["bg_color"]
+            self.update_ui_from_settings()
+            self.status_bar.config(text=f"Loaded color preset: {preset_name}")
+            self.schedule_autosave()
+    
+    def delete_color_preset(self):
+        selection = self.preset_listbox.curselection()
+        if selection:
+            preset_name = self.preset_listbox.get(selection[0])
+            if preset_name.startswith("[Default]"):
+                messagebox.showwarning("Cannot Delete", "Cannot delete default presets")
+                return
+            if messagebox.askyesno("Delete Preset", f"Delete color preset '{preset_name}'?"):
+                preset_path = os.path.join(self.color_presets_dir, f"{preset_name}.json")
+                os.remove(preset_path)
+                self.refresh_color_preset_list()
+                self.status_bar.config(text=f"Deleted color preset: {preset_name}")
+    
+    def on_closing(self):
+        if hasattr(self, 'auto_save') and self.auto_save.get():
+            self.autosave_settings()
+        self.root.quit()
+    
+    def update(self):
+        pass
+        
+    def close(self):
+        pass
+
+class SettingsController:
+    def __init__(self, settings=None):
+        self.connection_types = dict.fromkeys(['TESSELATION', 'CONTOURS', 'FACE_OVAL', 'LIPS', 'LEFT_EYE', 'RIGHT_EYE'])
+        self.inference_resolutions = {'Full': 0, '480p': 480, '360p': 360, '240p': 240}
+        self.modes = list(BASE_MODES)
+        self.published = None
+        self.apply_settings(settings or {})
+    
+    def get_settings(self):
+        return {key: getattr(self, SETTING_ATTRIBUTES.get(key, key)) for key in DEFAULT_SETTINGS}
+    
+    def apply_settings(self, settings):
+        self.update_settings({key: settings[key] if key in settings else copy.deepcopy(default)
+                              for key, default in DEFAULT_SETTINGS.items()})
+    
+    def update_settings(self, changes):
+        for key, value in changes.items():
+            if key in DEFAULT_SETTINGS:
+                setattr(self, SETTING_ATTRIBUTES.get(key, key), value)
+        self.update_modes()
+    
+    def update_modes(self):
+        self.modes = list(BASE_MODES)
+        if self.experiments.get('additional_modes', False):
+            self.modes.extend(ADDITIONAL_MODES)
+        if self.mode >= len(self.modes):
+            self.mode = 0
+    
+    def settings_changes(self):
+        settings = self.get_settings()
+        if self.published is None:
+            changes = settings
+        else:
+            changes = {key: value for key, value in settings.items() if self.published.get(key) != value}
+        if not changes:
+            return None
+        self.published = copy.deepcopy(settings)
+        return copy.deepcopy(changes)
+    
+    def accept_changes(self, changes):
+        self.update_settings(changes)
+        if self.published is not None:
+            self.published.update(copy.deepcopy(changes))
+    
+    def update_performance_settings(self):
+        pass
+    
+    def start_audio_stream(self):
+        pass
+    
+    def stop_audio_stream(self):
+        pass
+
+def run_settings_process(connection, settings):
+    controller = SettingsController(settings)
+    controller.published = copy.deepcopy(controller.get_settings())
+    ui = ModernSettingsUI(controller)
+    pending = {}
+    closing = False
+    try:
+        while ui.thread.is_alive():
+            if ui.ready.is_set():
+                if closing:
+                    ui.root.after(0, ui.on_closing)
+                    break
+                if pending:
+                    controller.accept_changes(pending)
+                    pending = {}
+                    ui.root.after(0, ui.update_ui_from_settings)
+                changes = controller.settings_changes()
+                if changes is not None:
+                    connection.send(('settings', changes))
+            if not connection.poll(0.05):
+                continue
+            kind, payload = connection.recv()
+            if kind == 'close':
+                closing = True
+            elif kind == 'settings':
+                pending.update(payload)
+    except (EOFError, OSError):
+        pass
+    ui.thread.join(timeout=2.0)
+
+class SettingsUIProcess:
+    def __init__(self, settings):
+        authkey = os.urandom(16)
+        self.settings = dict(settings)
+        self.connection = None
+        self.closed = False
+        self.lock = threading.Lock()
+        self.listener = Listener(authkey=authkey)
+        self.process = subprocess.Popen([sys.executable, os.path.abspath(__file__), self.listener.address],
+                                        stdin=subprocess.PIPE)
+        self.process.stdin.write(authkey.hex().encode() + b'\n')
+        self.process.stdin.close()
+        self.accept_thread = threading.Thread(target=self.accept, daemon=True)
+        self.accept_thread.start()
+    
+    def accept(self):
+        try:
+            connection = self.listener.accept()
+        except Exception as e:
+            if not self.closed:
+                print(f"Error connecting to settings UI: {e}")
+            return
+        finally:
+            self.listener.close()
+        with self.lock:
+            try:
+                if self.closed:
+                    raise OSError("closed")
+                connection.send(('settings', self.settings))
+            except OSError:
+                connection.close()
+                return
+            self.connection = connection
+    
+    def receive(self):
+        with self.lock:
+            connection = self.connection
+        if connection is None:
+            return None
+        changes = {}
+        try:
+            while connection.poll():
+                kind, payload = connection.recv()
+                if kind == 'settings':
+                    changes.update(payload)
+        except (EOFError, OSError):
+            pass
+        return changes or None
+    
+    def send_settings(self, changes):
+        with self.lock:
+            if self.connection is None:
+                self.settings.update(changes)
+                return
+            try:
+                self.connection.send(('settings', changes))
+            except OSError:
+                pass
+    
+    def close(self):
+        with self.lock:
+            self.closed = True
+            connection = self.connection
+        if connection is not None:
+            try:
+                connection.send(('close', None))
+            except OSError:
+                pass
+        else:
+            self.process.terminate()
+        try:
+            self.process.wait(timeout=3.0)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+        if connection is not None:
+            connection.close()
+        self.listener.close()
+
+if __name__ == "__main__":
+    authkey = bytes.fromhex(sys.stdin.readline().strip())
+    connection = Client(sys.argv[1], authkey=authkey)
+    kind, settings = connection.recv()
+    run_settings_process(connection, settings)
@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+class TelemetryWriter:
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backups=5, flush_interval=0.5, session=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.session = session or datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.frame_index = 0
+        self.queue = queue.SimpleQueue()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "a")
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def on_frame(self, tracker, output_frame):
+        self.queue.put((time.time(), self.frame_index, tracker.frame_latency, dict(tracker.stage_times),
+                        tracker.face_detected, tracker.hands_detected, tracker.mode, tracker.performance_mode,
+                        tracker.dropped_frames, tracker.presenter.stats() if tracker.presenter is not None else None))
+        self.frame_index += 1
+
+    def format_record(self, item):
+        timestamp, frame_index, latency, stage_times, face, hands, mode, performance_mode, dropped, display = item
+        record = {
+            't': round(timestamp, 3),
+            's': self.session,
+            'f': frame_index,
+            'ms': round(latency * 1000, 2),
+            'st': {stage: round(seconds * 1000, 2) for stage, seconds in stage_times.items()},
+            'fd': int(face),
+            'hd': int(hands),
+            'm': mode,
+            'pm': int(performance_mode)
+        }
+        if dropped is not None:
+            record['dr'] = dropped
+        if display is not None:
+            record['ds'] = [display['presented'], display['skipped'], display['late']]
+        return json.dumps(record, separators=(',', ':')) + '\n'
+
+    def write_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.drain()
+        self.drain()
+        self.file.close()
+
+    def drain(self):
+        lines = []
+        while True:
+            try:
+                lines.append(self.format_record(self.queue.get_nowait()))
+            except queue.Empty:
+                break
+        if not lines:
+            return
+        try:
+            self.file.write(''.join(lines))
+            self.file.flush()
+            if self.file.tell() >= self.max_bytes:
+                self.rotate()
+        except Exception as e:
+            print(f"Error writing telemetry: {e}")
+
+    def rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "a")
+
+    def close(self):
+        self.stop_event.set()
+        self.thread.join(timeout=5.0)
+
+
+def log_files(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    name = os.path.basename(path)
+    backups = []
+    if os.path.isdir(directory):
+        for filename in os.listdir(directory):
+            suffix = filename[len(name) + 1:]
+            if filename.startswith(name + '.') and suffix.isdigit():
+                backups.append((int(suffix), os.path.join(directory, filename)))
+    files = [filepath for _, filepath in sorted(backups, reverse=True)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_records(path):
+    for filepath in log_files(path):
+        with open(filepath, "r") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def summarize_session(records, top):
+    records.sort(key=lambda record: (record['t'], record['f']))
+    times = np.array([record['t'] for record in records])
+    latencies = np.array([record['ms'] for record in records])
+    seconds = np.floor(times - times[0]).astype(np.int64)
+    per_second = np.bincount(seconds)
+    full_seconds = per_second[:-1] if len(per_second) > 1 else per_second
+    worst = sorted(records, key=lambda record: record['ms'], reverse=True)[:top]
+    display = [record['ds'] for record in records if 'ds' in record]
+    dropped = [record['dr'] for record in records if 'dr' in record]
+    return {
+        'session': records[0]['s'],
+        'start': datetime.fromtimestamp(times[0]).strftime('%Y-%m-%d %H:%M:%S'),
+        'duration': float(times[-1] - times[0]),
+        'frames': len(records),
+        'fps': {
+            'mean': len(records) / (times[-1] - times[0]) if times[-1] > times[0] else 0.0,
+            'min': int(full_seconds.min()),
+            'p5': float(np.percentile(full_seconds, 5)),
+            'p50': float(np.percentile(full_seconds, 50)),
+            'max': int(full_seconds.max())
+        },
+        'latency_ms': {
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'p99': float(np.percentile(latencies, 99)),
+            'max': float(latencies.max())
+        },
+        'face_rate': float(np.mean([record['fd'] for record in records])),
+        'hand_rate': float(np.mean([record['hd'] for record in records])),
+        'dropped': int(sum(dropped)) if dropped else None,
+        'display': dict(zip(('presented', 'skipped', 'late'), display[-1])) if display else None,
+        'stalls': [{
+            'time': datetime.fromtimestamp(record['t']).strftime('%H:%M:%S.%f')[:-3],
+            'frame': record['f'],
+            'ms': record['ms'],
+            'stages': record['st'],
+            'mode': record['m'],
+            'performance_mode': bool(record['pm'])
+        } for record in worst]
+    }
+
+
+def summarize(path, top=5, session=None):
+    sessions = {}
+    for record in read_records(path):
+        if session is None or record['s'] == session:
+            sessions.setdefault(record['s'], []).append(record)
+    return [summarize_session(records, top) for _, records in sorted(sessions.items())]
+
+
+def print_summary(summaries):
+    for summary in summaries:
+        fps = summary['fps']
+        latency = summary['latency_ms']
+        print(f"Session {summary['session']}: started {summary['start']}, {summary['duration']:.0f}s, {summary['frames']} frames")
+        print(f"  FPS: mean {fps['mean']:.1f}, min {fps['min']}, p5 {fps['p5']:.0f}, median {fps['p50']:.0f}, max {fps['max']}")
+        print(f"  Latency ms: p50 {latency['p50']:.1f}, p95 {latency['p95']:.1f}, p99 {latency['p99']:.1f}, max {latency['max']:.1f}")
+        dropped = summary['dropped'] if summary['dropped'] is not None else "n/a (file input)"
+        print(f"  Detection: face {summary['face_rate']:.1%}, hands {summary['hand_rate']:.1%}, dropped frames {dropped}")
+        if summary['display'] is not None:
+            display = summary['display']
+            print(f"  Display: presented {display['presented']}, skipped {display['skipped']}, late {display['late']}")
+        print("  Worst stalls:")
+        for stall in summary['stalls']:
+            stages = ', '.join(f"{stage} {ms:.1f}" for stage, ms in sorted(stall['stages'].items(), key=lambda item: -item[1]))
+            print(f"    {stall['time']} frame {stall['frame']}: {stall['ms']:.1f} ms ({stages})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a telemetry log written with --telemetry")
+    parser.add_argument('path', nargs='?',
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "telemetry.jsonl"),
+                        help="Telemetry log, rotated files next to it are included")
+    parser.add_argument('--top', type=int, default=5, help="Worst stalls to list per session")
+    parser.add_argument('--session', help="Only summarize this session")
+    parser.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    args = parser.parse_args()
+    summaries = summarize(args.path, args.top, args.session)
+    if not summaries:
+        print(f"No telemetry records in {args.path}")
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+    else:
+        print_summary(summaries)
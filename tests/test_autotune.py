@@ -0,0 +1,20 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import autotune
+
+
+def test_crossed_hands_are_paired_by_handedness():
+    rng = np.random.default_rng(0)
+    left = rng.random((21, 3)).astype(np.float32)
+    right = rng.random((21, 3)).astype(np.float32)
+    left[0, :2] = (0.52, 0.5)
+    right[0, :2] = (0.48, 0.5)
+    reference = ([(None, [('Left', left), ('Right', right)], None)], (480, 640))
+    candidate = ([(None, [('Right', right + 0.001), ('Left', left + 0.001)], None)], (480, 640))
+    quality = autotune.agreement(reference, candidate)
+    assert quality['hand_agreement'] == 1.0
+    assert quality['hand_error_px'] < 1.0
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import capture
+
+
+class EchoingCamera:
+    def __init__(self, index, delivered_fps=30.0):
+        self.properties = {}
+        self.interval = 1.0 / delivered_fps
+        self.frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        self.properties[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.properties.get(prop, 0.0)
+
+    def grab(self):
+        time.sleep(self.interval)
+        return True
+
+    def retrieve(self):
+        return True, self.frame
+
+    def read(self):
+        self.grab()
+        return self.retrieve()
+
+    def release(self):
+        pass
+
+
+def test_rate_is_measured_when_the_driver_echoes_the_request(monkeypatch):
+    monkeypatch.setattr(capture.cv2, 'VideoCapture', EchoingCamera)
+    source = capture.DeviceSource(0, width=1280, height=720, fps=60, fourcc='MJPG', rate_frames=6)
+    assert source.achieved['reported_fps'] == 60
+    assert 25 <= source.fps <= 33
+    assert source.shortfall() is not None
+    assert "driver reports 60.0" in source.describe()
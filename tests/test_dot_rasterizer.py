@@ -0,0 +1,37 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import DotRasterizer
+
+
+def draw_reference(frame, pixels, radius, color, antialiased):
+    for x, y in pixels.tolist():
+        cv2.circle(frame, (x, y), radius, color, -1, cv2.LINE_AA if antialiased else cv2.LINE_8)
+
+
+def edge_pixels(width, height, count, seed):
+    rng = np.random.default_rng(seed)
+    xs = rng.integers(-4, width + 4, count)
+    ys = rng.integers(-4, height + 4, count)
+    xs[:count // 4] = rng.integers(-4, 6, count // 4)
+    ys[count // 4:count // 2] = rng.integers(height - 6, height + 4, count // 4)
+    return np.column_stack([xs, ys]).astype(np.int32)
+
+
+@pytest.mark.parametrize('radius', [1, 2, 4])
+@pytest.mark.parametrize('antialiased', [False, True])
+def test_stamp_matches_circle_at_frame_edges(radius, antialiased):
+    width, height = 160, 120
+    pixels = edge_pixels(width, height, 200, radius)
+    color = (255, 255, 0)
+    reference = np.zeros((height, width, 3), dtype=np.uint8)
+    stamped = np.zeros((height, width, 3), dtype=np.uint8)
+    draw_reference(reference, pixels, radius, color, antialiased)
+    DotRasterizer(max_stamp_cost=np.inf).stamp(stamped, pixels, radius, color, antialiased)
+    diff = np.abs(reference.astype(np.int16) - stamped.astype(np.int16))
+    assert diff.max() <= (2 if antialiased else 0)
@@ -0,0 +1,36 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker
+
+
+def test_mode_switch_rebuilds_face_mesh_in_background():
+    tracker = FaceTracker(source='synthetic:320x240', headless=True)
+    tracker.configure_pipeline(wait=True)
+    original = tracker.face_mesh
+    built = threading.Event()
+    create_face_mesh = tracker.create_face_mesh
+
+    def slow_create_face_mesh(config):
+        time.sleep(0.5)
+        built.set()
+        return create_face_mesh(config)
+
+    tracker.create_face_mesh = slow_create_face_mesh
+    tracker.experiments['additional_modes'] = True
+    tracker.update_modes()
+    tracker.mode = tracker.modes.index('Skeleton')
+    start = time.perf_counter()
+    tracker.configure_pipeline()
+    assert time.perf_counter() - start < 0.25
+    assert tracker.face_mesh is original
+    assert tracker.face_config[0] is True
+    built.wait(2.0)
+    tracker.face_mesh_thread.join()
+    tracker.configure_pipeline()
+    assert tracker.face_mesh is not original
+    assert tracker.face_config[0] is False
+    tracker.cleanup()
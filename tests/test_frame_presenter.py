@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker, FramePresenter
+
+
+class RecordingPresenter(FramePresenter):
+    def __init__(self, target_fps=200.0):
+        super().__init__(target_fps=target_fps)
+        self.threads = set()
+        self.shown_frames = []
+
+    def create_window(self):
+        self.threads.add(threading.get_ident())
+
+    def show_latest(self):
+        self.threads.add(threading.get_ident())
+        with self.lock:
+            frame = self.latest if self.submitted != self.shown else None
+            self.shown = self.submitted
+        if frame is not None:
+            self.shown_frames.append(frame)
+            self.presented += 1
+
+
+def test_window_is_driven_from_the_calling_thread_while_frames_arrive():
+    presenter = RecordingPresenter()
+    presenter.start()
+    done = threading.Event()
+
+    def produce():
+        for index in range(20):
+            presenter.submit(np.full((2, 2, 3), index, dtype=np.uint8))
+            time.sleep(0.002)
+        time.sleep(0.05)
+        done.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    presenter.run(lambda: not done.is_set())
+    producer.join()
+    assert presenter.threads == {threading.get_ident()}
+    stats = presenter.stats()
+    assert stats['presented'] == len(presenter.shown_frames) > 0
+    assert stats['presented'] + stats['skipped'] == stats['submitted'] == 20
+    assert presenter.shown_frames[-1][0, 0, 0] == 19
+
+
+def failing_window():
+    raise RuntimeError("cannot connect to display")
+
+
+def test_window_failure_stops_the_tracker():
+    presenter = FramePresenter()
+    presenter.create_window = failing_window
+    presenter.start()
+    assert isinstance(presenter.error, RuntimeError)
+    presenter.run(lambda: True)
+    tracker = FaceTracker.__new__(FaceTracker)
+    tracker.presenter = presenter
+    assert tracker.present(np.zeros((4, 4, 3), dtype=np.uint8)) is False
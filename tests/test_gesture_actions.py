@@ -0,0 +1,21 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker
+
+
+def test_gesture_action_applies_before_next_pipeline_configuration():
+    tracker = FaceTracker(source='synthetic:320x240', headless=True)
+    tracker.experiments['additional_modes'] = True
+    tracker.update_modes()
+    tracker.mode = tracker.modes.index('Dots')
+    tracker.process_frame(np.zeros((240, 320, 3), dtype=np.uint8))
+    tracker.handle_gesture('victory')
+    assert tracker.modes[tracker.mode] == 'Dots'
+    tracker.process_frame(np.zeros((240, 320, 3), dtype=np.uint8))
+    assert tracker.modes[tracker.mode] == 'Skeleton'
+    assert tracker.pipeline['face_points'] is not None
+    tracker.cleanup()
@@ -0,0 +1,60 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker
+
+
+class FakeHands:
+    def close(self):
+        pass
+
+
+def make_tracker(create_hands):
+    tracker = FaceTracker.__new__(FaceTracker)
+    tracker.startup_timings = {}
+    tracker.hands = None
+    tracker.hands_thread = None
+    tracker.hands_lock = threading.Lock()
+    tracker.hands_error = None
+    tracker.hands_error_time = None
+    tracker.hands_retry_interval = 0.0
+    tracker.create_hands = create_hands
+    return tracker
+
+
+def test_failed_load_raises_and_can_be_retried():
+    attempts = []
+
+    def create_hands():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("model file missing")
+        return FakeHands()
+
+    tracker = make_tracker(create_hands)
+    tracker.preload_hands()
+    with pytest.raises(RuntimeError, match="model file missing"):
+        tracker.get_hands()
+    assert tracker.hands_thread is None
+    assert isinstance(tracker.get_hands(), FakeHands)
+    assert len(attempts) == 2
+    assert tracker.hands_error is None
+
+
+def test_failed_load_waits_before_retrying():
+    attempts = []
+
+    def create_hands():
+        attempts.append(1)
+        raise OSError("model file missing")
+
+    tracker = make_tracker(create_hands)
+    tracker.hands_retry_interval = 60.0
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            tracker.get_hands()
+    assert len(attempts) == 1
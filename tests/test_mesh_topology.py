@@ -0,0 +1,55 @@
+import os
+import sys
+
+import mediapipe as mp
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import mesh_topology
+from LiveVisualTracking import FaceTracker
+
+
+def directed_edges(triangles):
+    edges = {}
+    for a, b, c in triangles.tolist():
+        for u, v in ((a, b), (b, c), (c, a)):
+            edges[(u, v)] = edges.get((u, v), 0) + 1
+    return edges
+
+
+@pytest.mark.parametrize('triangles', [
+    mesh_topology.triangles_from_edges(mp.solutions.face_mesh.FACEMESH_TESSELATION),
+    mesh_topology.hand_triangles()
+], ids=['face', 'hand'])
+def test_triangles_are_manifold_and_consistently_wound(triangles):
+    edges = directed_edges(triangles)
+    assert max(edges.values()) == 1
+    undirected = {}
+    for u, v in edges:
+        key = (min(u, v), max(u, v))
+        undirected[key] = undirected.get(key, 0) + 1
+    assert max(undirected.values()) <= 2
+
+
+def test_face_tesselation_has_canonical_triangle_count():
+    assert len(mesh_topology.triangles_from_edges(mp.solutions.face_mesh.FACEMESH_TESSELATION)) == 852
+
+
+def test_drop_non_manifold_removes_separating_triangle():
+    fan = [(0, 1, 3), (1, 2, 3), (2, 0, 3), (0, 1, 4), (1, 2, 4), (2, 0, 4), (0, 1, 2)]
+    assert sorted(mesh_topology.drop_non_manifold(fan)) == sorted(fan[:-1])
+
+
+def test_overlapping_triangles_in_one_shade_band_are_filled():
+    tracker = FaceTracker.__new__(FaceTracker)
+    tracker.cull_back_faces = False
+    tracker.shade_levels = 1
+    tracker.dot_color = [255, 255, 255]
+    tracker.line_color = [255, 255, 255]
+    points = np.array([(0.1, 0.1, 0.0), (0.9, 0.1, 0.0), (0.1, 0.9, 0.0),
+                       (0.2, 0.2, 0.0), (0.9, 0.3, 0.0), (0.3, 0.9, 0.0)], dtype=np.float32)
+    triangles = np.array([(0, 1, 2), (3, 4, 5)], dtype=np.int32)
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    tracker.fill_triangles(frame, points, triangles, frame.shape)
+    assert frame[40, 40].tolist() == [255, 255, 255]
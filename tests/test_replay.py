@@ -0,0 +1,58 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker, ReplayBuffer
+
+
+def face_subset_points(subset, seed=0):
+    rng = np.random.default_rng(seed)
+    points = np.zeros((478, 3), dtype=np.float32)
+    points[subset] = 0.4 + 0.2 * rng.random((len(subset), 3))
+    return points
+
+
+def test_replay_in_other_mode_skips_landmarks_not_recorded():
+    tracker = FaceTracker(source='synthetic:320x240', headless=True)
+    tracker.experiments['additional_modes'] = True
+    tracker.update_modes()
+    tracker.show_fps = False
+    shape = (240, 320, 3)
+    for recorded in ('Skeleton', 'Wireframe Hexagon'):
+        subset = sorted(set(tracker.mode_requirements[recorded]['face_points']) |
+                        set(tracker.head_pose_estimator.landmarks))
+        tracker.replay_buffer.clear()
+        for step in range(3):
+            tracker.replay_buffer.append(float(step), [face_subset_points(subset, step)], None, subset, shape)
+        for mode in tracker.modes:
+            tracker.mode = tracker.modes.index(mode)
+            tracker.toggle_replay()
+            output = tracker.render_replay()
+            tracker.replay = None
+            assert output[:40, :40].max() == 0, (recorded, mode)
+    tracker.cleanup()
+
+
+def test_byte_budget_evicts_oldest_entries():
+    points = np.zeros((478, 3), dtype=np.float32)
+    entry_size = 256 + points.nbytes
+    buffer = ReplayBuffer(max_bytes=entry_size * 5, max_seconds=1000.0)
+    for step in range(12):
+        buffer.append(float(step), [points], None, None, (240, 320, 3))
+        assert buffer.bytes_used <= buffer.max_bytes
+    entries = buffer.snapshot()
+    assert [entry[0] for entry in entries] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert buffer.bytes_used == entry_size * 5
+
+
+def test_frames_are_encoded_off_the_calling_thread():
+    buffer = ReplayBuffer(max_bytes=64 * 1024 * 1024)
+    frame = np.full((240, 320, 3), 128, dtype=np.uint8)
+    buffer.append(0.0, [], None, None, frame.shape, frame)
+    buffer.close()
+    entry = buffer.snapshot()[0]
+    assert entry[5] is not None
+    assert np.abs(buffer.decode(entry).astype(np.int16) - 128).max() <= 2
+    assert buffer.bytes_used == entry[6]
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import threading
+import time
+from multiprocessing import Pipe
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import settings_ui
+from settings_ui import DEFAULT_SETTINGS, SettingsController
+
+
+def test_first_changes_are_the_full_settings():
+    controller = SettingsController()
+    assert controller.settings_changes() == controller.get_settings()
+    assert controller.settings_changes() is None
+
+
+def test_only_changed_keys_are_sent():
+    controller = SettingsController()
+    controller.settings_changes()
+    controller.show_fps = not DEFAULT_SETTINGS['show_fps']
+    controller.dot_size = 7
+    assert controller.settings_changes() == {'show_fps': controller.show_fps, 'dot_size': 7}
+
+
+def test_update_settings_leaves_other_state_alone():
+    controller = SettingsController()
+    controller.dot_color = [1, 2, 3]
+    controller.mode = 1
+    controller.update_settings({'line_thickness': 4})
+    assert controller.line_thickness == 4
+    assert controller.dot_color == [1, 2, 3]
+    assert controller.mode == 1
+
+
+def test_accepted_changes_are_not_sent_back():
+    controller = SettingsController()
+    controller.settings_changes()
+    controller.accept_changes({'mode': 1})
+    assert controller.mode == 1
+    assert controller.settings_changes() is None
+
+
+def test_autosave_is_read_without_tk(tmp_path, monkeypatch):
+    path = tmp_path / "autosave.json"
+    monkeypatch.setattr(settings_ui, 'AUTOSAVE_PATH', str(path))
+    assert settings_ui.load_autosave_settings() is None
+    path.write_text(json.dumps({'show_hands': False}))
+    assert SettingsController(settings_ui.load_autosave_settings()).show_hands is False
+    path.write_text("{not json")
+    assert settings_ui.load_autosave_settings() is None
+
+
+class SlowUI:
+    def __init__(self, controller):
+        self.tracker = controller
+        self.ready = threading.Event()
+        self.closed = threading.Event()
+        self.updates = []
+        self.thread = threading.Thread(target=self.run_ui, daemon=True)
+        self.thread.start()
+
+    def run_ui(self):
+        time.sleep(0.3)
+        self.root = self
+        self.ready.set()
+        self.closed.wait(5.0)
+
+    def after(self, delay, callback):
+        callback()
+
+    def update_ui_from_settings(self):
+        self.updates.append(self.tracker.mode)
+
+    def on_closing(self):
+        self.closed.set()
+
+
+def test_messages_before_ui_is_ready_are_buffered(monkeypatch):
+    created = []
+    monkeypatch.setattr(settings_ui, 'ModernSettingsUI', lambda controller: created.append(SlowUI(controller)) or created[-1])
+    parent, child = Pipe()
+    worker = threading.Thread(target=settings_ui.run_settings_process, args=(child, {}))
+    worker.start()
+    parent.send(('settings', {'mode': 1}))
+    deadline = time.perf_counter() + 5.0
+    while not (created and created[0].updates) and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    parent.send(('close', None))
+    worker.join(timeout=5.0)
+    assert not worker.is_alive()
+    ui = created[0]
+    assert ui.updates == [1]
+    assert ui.closed.is_set()
+    assert not parent.poll()
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LiveVisualTracking import FaceTracker, TrailHistory
+
+
+def step_pixels(step):
+    return np.tile(np.array([[10 + 10 * step, 50]], dtype=np.int32), (478, 1))
+
+
+def test_trail_fades_out_after_its_length():
+    history = TrailHistory(4)
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    for step in range(6):
+        history.push(step_pixels(step), None)
+        frame[:] = 0
+        history.render(frame, (0, 255, 0), 1, 50)
+    levels = history.intensity[50, 25::10].tolist()
+    assert levels[0] == 0
+    assert levels[1] < levels[2] < levels[3] <= 255
+    history.reset()
+    assert history.intensity.max() == 0
+
+
+def test_render_dispatches_on_mode_name():
+    tracker = FaceTracker.__new__(FaceTracker)
+    tracker.modes = ['Mesh', 'Dots', 'Trails']
+    tracker.mode = 2
+    calls = []
+    tracker.update_trails = lambda *args: calls.append('update')
+    tracker.trail_history = TrailHistory(4)
+    tracker.incremental_render = False
+    tracker.show_camera = False
+    tracker.bg_color = [0, 0, 0]
+    tracker.line_color = [0, 255, 0]
+    tracker.line_thickness = 1
+    tracker.show_hands = True
+    tracker.draw_dots_only = lambda *args: calls.append('dots')
+    tracker.render_frame(np.zeros((10, 10, 3), dtype=np.uint8), [np.zeros((478, 3))], None)
+    assert calls == ['update', 'dots']